@@ -16,7 +16,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.config import config
-from utils.db import init_db
+from utils.db import classify_closed_trades, init_db
 from collectors.market import get_current_price
 
 app = Flask(__name__)
@@ -532,12 +532,20 @@ def api_trade_enter():
     cur = conn.cursor()
 
     try:
+        # Copy the signal's insider context onto the trade, as the CLI does
         cur.execute("""
             INSERT INTO trades (signal_id, ticker, entry_date, entry_price, shares,
-                              stop_price, target_price, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'OPEN')
+                              stop_price, target_price, status,
+                              ceo_cfo_buying, unique_buyers)
+            SELECT ?, ?, ?, ?, ?, ?, ?, 'OPEN',
+                   (SELECT CASE WHEN json_valid(insider_details)
+                                THEN json_extract(insider_details, '$.ceo_cfo_buying') END
+                    FROM signals WHERE id = ?),
+                   (SELECT CASE WHEN json_valid(insider_details)
+                                THEN json_extract(insider_details, '$.unique_buyers') END
+                    FROM signals WHERE id = ?)
         """, (signal_id, ticker, date.today().isoformat(), price, shares,
-              stop_price, target_price))
+              stop_price, target_price, signal_id, signal_id))
 
         conn.commit()
         trade_id = cur.lastrowid
@@ -619,6 +627,7 @@ def api_trade_exit():
             WHERE id = ?
         """, (date.today().isoformat(), price, reason,
               return_pct, return_dollars, days_held, trade_id))
+        classify_closed_trades(conn, trade_id)
 
         conn.commit()
         conn.close()
@@ -836,19 +845,10 @@ def api_v2_portfolio():
 def api_v2_watchlist():
     """Get V2 watchlist - stocks passing trend template."""
     from signals.trend_template import get_compliant_stocks
-    from datetime import date
 
+    # Rows include distance_from_high_pct for dashboard display
     stocks = get_compliant_stocks(date.today())
 
-    # Add distance_from_high_pct for dashboard display
-    for stock in stocks:
-        if stock.get('high_52w') and stock.get('price'):
-            high = stock['high_52w']
-            price = stock['price']
-            stock['distance_from_high_pct'] = ((high - price) / high) * 100
-        else:
-            stock['distance_from_high_pct'] = 0
-
     return jsonify({
         "date": date.today().isoformat(),
         "count": len(stocks),
@@ -859,8 +859,6 @@ def api_v2_watchlist():
 @app.route("/api/v2/screening")
 def api_v2_screening():
     """Get today's V2 screening results."""
-    from datetime import date
-    
     conn = get_db()
     cur = conn.cursor()
     
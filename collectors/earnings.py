@@ -6,6 +6,7 @@ Fetches earnings dates to avoid trading near earnings announcements.
 Rule: No new positions within 5 days of earnings.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 import yfinance as yf
@@ -96,19 +97,37 @@ def is_earnings_safe(ticker: str, days: int = None) -> Tuple[bool, Optional[date
         days = config.EARNINGS_BUFFER_DAYS
     
     earnings_date = get_earnings_date(ticker)
-    
+    return _is_safe(earnings_date, days, date.today()), earnings_date
+
+
+def _is_safe(earnings_date: Optional[date], days: int, today: date) -> bool:
+    """Apply the earnings buffer rule to a (possibly unknown) earnings date."""
     if earnings_date is None:
         # Unknown earnings date - assume safe but flag it
-        return True, None
+        return True
     
-    today = date.today()
     days_until = (earnings_date - today).days
     
     # Safe if earnings is more than N days away
     # Also safe if earnings already passed (days_until negative)
-    is_safe = days_until > days or days_until < -1
+    return days_until > days or days_until < -1
+
+
+def get_earnings_dates(tickers: List[str]) -> Dict[str, Optional[date]]:
+    """
+    Get next earnings dates for several stocks.
+    
+    Each lookup is an independent yfinance request, so they run on a thread
+    pool instead of one after another.
     
-    return is_safe, earnings_date
+    Returns:
+        Dict mapping ticker -> next earnings date (None if not available)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        return dict(zip(tickers, executor.map(get_earnings_date, tickers)))
 
 
 def check_earnings_batch(tickers: List[str], days: int = None) -> Dict[str, Dict]:
@@ -127,9 +146,11 @@ def check_earnings_batch(tickers: List[str], days: int = None) -> Dict[str, Dict
     
     results = {}
     today = date.today()
+    earnings_dates = get_earnings_dates(tickers)
     
     for ticker in tickers:
-        is_safe, earnings_date = is_earnings_safe(ticker, days)
+        earnings_date = earnings_dates[ticker]
+        is_safe = _is_safe(earnings_date, days, today)
         
         if earnings_date:
             days_until = (earnings_date - today).days
@@ -162,10 +183,11 @@ def filter_by_earnings(tickers: List[str], days: int = None) -> Tuple[List[str],
     
     safe = []
     unsafe = []
+    today = date.today()
+    earnings_dates = get_earnings_dates(tickers)
     
     for ticker in tickers:
-        is_safe, _ = is_earnings_safe(ticker, days)
-        if is_safe:
+        if _is_safe(earnings_dates[ticker], days, today):
             safe.append(ticker)
         else:
             unsafe.append(ticker)
@@ -189,9 +211,7 @@ def get_upcoming_earnings(tickers: List[str], days_ahead: int = 14) -> List[Dict
     
     upcoming = []
     
-    for ticker in tickers:
-        earnings_date = get_earnings_date(ticker)
-        
+    for ticker, earnings_date in get_earnings_dates(tickers).items():
         if earnings_date and today <= earnings_date <= cutoff:
             days_until = (earnings_date - today).days
             upcoming.append({
@@ -215,8 +235,10 @@ def format_earnings_report(results: Dict[str, Dict]) -> str:
         "",
     ]
     
-    safe = [r for r in results.values() if r['is_safe']]
-    unsafe = [r for r in results.values() if not r['is_safe']]
+    safe = []
+    unsafe = []
+    for r in results.values():
+        (safe if r['is_safe'] else unsafe).append(r)
     
     if unsafe:
         lines.append("⚠️  AVOID - Earnings within 5 days:")
@@ -11,7 +11,9 @@ SEC EDGAR Notes:
 """
 
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
@@ -34,6 +36,9 @@ from utils.db import get_db
 SEC_FORM4_RSS = "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=4&company=&dateb=&owner=include&count={count}&output=atom"
 SEC_BASE_URL = "https://www.sec.gov"
 
+# Per-thread HTTP session for _sec_request()
+_local = threading.local()
+
 
 @dataclass
 class InsiderTrade:
@@ -62,15 +67,23 @@ class InsiderTrade:
         return "CEO" in title or "CFO" in title or "CHIEF EXECUTIVE" in title or "CHIEF FINANCIAL" in title
 
 
+def _sec_session() -> requests.Session:
+    """Return this thread's SEC session, reusing its keep-alive connections."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.headers.update({
+            "User-Agent": config.SEC_USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+        })
+    return session
+
+
 @sleep_and_retry
 @limits(calls=config.SEC_RATE_LIMIT, period=1)
 def _sec_request(url: str) -> requests.Response:
     """Make a rate-limited request to SEC EDGAR."""
-    headers = {
-        "User-Agent": config.SEC_USER_AGENT,
-        "Accept-Encoding": "gzip, deflate",
-    }
-    response = requests.get(url, headers=headers, timeout=30)
+    response = _sec_session().get(url, timeout=30)
     response.raise_for_status()
     return response
 
@@ -319,49 +332,68 @@ def _parse_transaction(
     )
 
 
+INSIDER_TRADE_INSERT_SQL = """
+    INSERT OR IGNORE INTO insider_trades
+    (ticker, company_name, insider_name, insider_title, trade_type,
+     shares, price_per_share, total_value, shares_owned_after,
+     trade_date, filed_date, form_type, source_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def save_trades(trades: list[InsiderTrade]) -> int:
     """
     Save insider trades to database.
 
+    All rows are written with one executemany in a single transaction. If
+    the batch fails it is rolled back and the trades are saved one at a
+    time, so a bad trade is reported and skipped without losing the rest.
+
     Args:
         trades: List of InsiderTrade objects
 
     Returns:
         Number of new trades inserted
     """
-    inserted = 0
+    rows = []
+    for trade in trades:
+        try:
+            rows.append((
+                trade.ticker,
+                trade.company_name,
+                trade.insider_name,
+                trade.insider_title,
+                trade.trade_type,
+                trade.shares,
+                trade.price_per_share,
+                trade.total_value,
+                trade.shares_owned_after,
+                trade.trade_date.isoformat(),
+                trade.filed_date.isoformat(),
+                trade.form_type,
+                trade.source_url,
+            ))
+        except Exception as e:
+            print(f"Error saving trade {trade.ticker} {trade.insider_name}: {e}")
+
+    if not rows:
+        return 0
 
     with get_db() as conn:
-        for trade in trades:
+        try:
+            # Nested get_db() runs in a savepoint, so a failed batch leaves nothing behind
+            with get_db() as batch:
+                # Ignored duplicates don't count towards rowcount
+                return batch.executemany(INSIDER_TRADE_INSERT_SQL, rows).rowcount
+        except Exception:
+            pass
+
+        inserted = 0
+        for row in rows:
             try:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO insider_trades
-                    (ticker, company_name, insider_name, insider_title, trade_type,
-                     shares, price_per_share, total_value, shares_owned_after,
-                     trade_date, filed_date, form_type, source_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        trade.ticker,
-                        trade.company_name,
-                        trade.insider_name,
-                        trade.insider_title,
-                        trade.trade_type,
-                        trade.shares,
-                        trade.price_per_share,
-                        trade.total_value,
-                        trade.shares_owned_after,
-                        trade.trade_date.isoformat(),
-                        trade.filed_date.isoformat(),
-                        trade.form_type,
-                        trade.source_url,
-                    )
-                )
-                if conn.total_changes > 0:
-                    inserted += 1
+                inserted += conn.execute(INSIDER_TRADE_INSERT_SQL, row).rowcount
             except Exception as e:
-                print(f"Error saving trade {trade.ticker} {trade.insider_name}: {e}")
+                print(f"Error saving trade {row[0]} {row[2]}: {e}")
 
     return inserted
 
@@ -409,14 +441,14 @@ def update_daily_aggregates(target_date: Optional[date] = None):
                 (date_str,)
             )
 
-            for row in cursor.fetchall():
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO insider_daily
-                    (ticker, date, buy_transactions, sell_transactions, buy_value, sell_value,
-                     unique_buyers, unique_sellers, ceo_cfo_buying)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO insider_daily
+                (ticker, date, buy_transactions, sell_transactions, buy_value, sell_value,
+                 unique_buyers, unique_sellers, ceo_cfo_buying)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         row["ticker"],
                         date_str,
@@ -428,16 +460,32 @@ def update_daily_aggregates(target_date: Optional[date] = None):
                         row["unique_sellers"],
                         bool(row["ceo_cfo_buying"]),
                     )
-                )
+                    for row in cursor.fetchall()
+                ]
+            )
+
+
+def _fetch_filing_trades(filing: dict) -> Optional[list[InsiderTrade]]:
+    """
+    Resolve a filing's Form 4 XML and parse its trades.
+
+    Returns:
+        List of trades, or None if the filing has no XML document
+    """
+    xml_url = get_form4_xml_url(filing["link"])
+    if not xml_url:
+        return None
+    return parse_form4_xml(xml_url)
 
 
-def collect_insider_data(count: int = 100, purchases_only: bool = True) -> dict:
+def collect_insider_data(count: int = 100, purchases_only: bool = True, max_workers: int = 4) -> dict:
     """
     Main collection function - fetch and parse recent Form 4 filings.
 
     Args:
         count: Number of filings to fetch
         purchases_only: If True, only save purchases (not sales)
+        max_workers: Number of filings fetched concurrently
 
     Returns:
         Dict with collection statistics
@@ -457,32 +505,33 @@ def collect_insider_data(count: int = 100, purchases_only: bool = True) -> dict:
 
     all_trades = []
 
-    for i, filing in enumerate(filings):
-        try:
-            # Get XML URL
-            xml_url = get_form4_xml_url(filing["link"])
-            if not xml_url:
+    # SEC requests go through the shared _sec_request limiter, so a few
+    # workers keep the request rate unchanged while overlapping latency
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(filings)))) as executor:
+        futures = {executor.submit(_fetch_filing_trades, filing): filing for filing in filings}
+        for i, future in enumerate(as_completed(futures)):
+            filing = futures[future]
+            try:
+                trades = future.result()
+            except Exception as e:
+                stats["errors"].append(f"{filing['link']}: {str(e)}")
                 continue
 
-            # Parse the XML
-            trades = parse_form4_xml(xml_url)
-            stats["filings_parsed"] += 1
+            if trades is not None:
+                stats["filings_parsed"] += 1
 
-            for trade in trades:
-                stats["trades_found"] += 1
-                if trade.trade_type == "P":
-                    stats["purchases_found"] += 1
+                for trade in trades:
+                    stats["trades_found"] += 1
+                    if trade.trade_type == "P":
+                        stats["purchases_found"] += 1
 
-                if not purchases_only or trade.trade_type == "P":
-                    all_trades.append(trade)
+                    if not purchases_only or trade.trade_type == "P":
+                        all_trades.append(trade)
 
             # Progress indicator
             if (i + 1) % 10 == 0:
                 print(f"  Processed {i + 1}/{len(filings)} filings...")
 
-        except Exception as e:
-            stats["errors"].append(f"{filing['link']}: {str(e)}")
-
     # Save to database
     if all_trades:
         stats["trades_saved"] = save_trades(all_trades)
@@ -9,6 +9,7 @@ Used for:
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Optional
@@ -190,6 +191,89 @@ def get_current_price(ticker: str) -> Optional[float]:
         return None
 
 
+def get_current_prices(tickers: list[str]) -> dict[str, Optional[float]]:
+    """
+    Get latest prices for several tickers with one batched download.
+
+    Tickers missing from the batch result fall back to get_current_price(),
+    fetched concurrently since each is an independent HTTP call.
+
+    Args:
+        tickers: Stock symbols
+
+    Returns:
+        Dict of ticker -> price (None if unavailable)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    prices: dict[str, Optional[float]] = {}
+    try:
+        data = yf.download(
+            tickers, period="1d", group_by="column", threads=True, progress=False
+        )
+        closes = data["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(name=tickers[0])
+        last = closes.ffill().iloc[-1]
+        for ticker in tickers:
+            value = last.get(ticker)
+            if value is not None and not pd.isna(value):
+                prices[ticker] = round(float(value), 2)
+    except Exception as e:
+        print(f"Error batch-downloading prices: {e}")
+
+    missing = [t for t in tickers if t not in prices]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+            prices.update(zip(missing, executor.map(get_current_price, missing)))
+
+    return prices
+
+
+def get_price_histories(tickers: list[str], period: str = "15mo") -> dict[str, pd.DataFrame]:
+    """
+    Download daily OHLCV history for several tickers in one batched request.
+
+    The scan loops pass these frames to check_trend_template(), detect_vcp()
+    and check_breakout() so each stock is not downloaded separately.
+
+    Args:
+        tickers: Stock symbols
+        period: yfinance period string
+
+    Returns:
+        Dict of ticker -> DataFrame (Open/High/Low/Close/Volume). Tickers the
+        download returned no rows for are omitted; callers fetch those
+        individually.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    try:
+        data = yf.download(
+            tickers, period=period, group_by="ticker", threads=True, progress=False
+        )
+    except Exception as e:
+        print(f"Error batch-downloading price history: {e}")
+        return {}
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        frames = {tickers[0]: data}
+    else:
+        available = set(data.columns.get_level_values(0))
+        frames = {t: data[t] for t in tickers if t in available}
+
+    histories = {}
+    for ticker, frame in frames.items():
+        frame = frame.dropna(subset=["Close"])
+        if not frame.empty:
+            histories[ticker] = frame
+    return histories
+
+
 def save_market_data(snapshot: MarketSnapshot) -> bool:
     """Save market data to database."""
     try:
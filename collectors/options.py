@@ -10,13 +10,15 @@ Key metrics:
 - Near-term vs long-term expiration focus
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-import time
 
 import yfinance as yf
 import pandas as pd
+from ratelimit import limits, sleep_and_retry
 
 import sys
 from pathlib import Path
@@ -166,46 +168,82 @@ def get_historical_averages(ticker: str, days: int = 20) -> tuple[float, float]:
     return 0.0, 0.0
 
 
+OPTIONS_FLOW_INSERT_SQL = """
+    INSERT OR REPLACE INTO options_flow
+    (ticker, date, call_volume, put_volume, call_oi, put_oi,
+     avg_call_volume_20d, avg_put_volume_20d, call_volume_ratio,
+     put_call_ratio, unusual_calls, unusual_puts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _options_snapshot_row(snapshot: OptionsSnapshot) -> tuple:
+    """Column values for OPTIONS_FLOW_INSERT_SQL."""
+    return (
+        snapshot.ticker,
+        snapshot.date.isoformat(),
+        snapshot.call_volume,
+        snapshot.put_volume,
+        snapshot.call_oi,
+        snapshot.put_oi,
+        snapshot.avg_call_volume_20d,
+        snapshot.avg_put_volume_20d,
+        snapshot.call_volume_ratio,
+        snapshot.put_call_ratio,
+        snapshot.unusual_calls,
+        snapshot.unusual_puts,
+    )
+
+
 def save_options_snapshot(snapshot: OptionsSnapshot) -> bool:
     """Save options snapshot to database."""
-    try:
-        with get_db() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO options_flow
-                (ticker, date, call_volume, put_volume, call_oi, put_oi,
-                 avg_call_volume_20d, avg_put_volume_20d, call_volume_ratio,
-                 put_call_ratio, unusual_calls, unusual_puts)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    snapshot.ticker,
-                    snapshot.date.isoformat(),
-                    snapshot.call_volume,
-                    snapshot.put_volume,
-                    snapshot.call_oi,
-                    snapshot.put_oi,
-                    snapshot.avg_call_volume_20d,
-                    snapshot.avg_put_volume_20d,
-                    snapshot.call_volume_ratio,
-                    snapshot.put_call_ratio,
-                    snapshot.unusual_calls,
-                    snapshot.unusual_puts,
-                )
-            )
-        return True
-    except Exception as e:
-        print(f"Error saving options for {snapshot.ticker}: {e}")
-        return False
+    return bool(save_options_snapshots([snapshot]))
+
+
+def save_options_snapshots(snapshots: list[OptionsSnapshot]) -> list[OptionsSnapshot]:
+    """
+    Save options snapshots with one executemany in a single transaction.
+
+    If the batch fails it is rolled back and the snapshots are saved one at
+    a time, so a bad row is reported and skipped without losing the rest.
+
+    Returns:
+        The snapshots that were saved
+    """
+    if not snapshots:
+        return []
+
+    with get_db() as conn:
+        try:
+            # Nested get_db() runs in a savepoint, so a failed batch leaves nothing behind
+            with get_db() as batch:
+                batch.executemany(OPTIONS_FLOW_INSERT_SQL, [_options_snapshot_row(s) for s in snapshots])
+            return list(snapshots)
+        except Exception:
+            pass
+
+        saved = []
+        for snapshot in snapshots:
+            try:
+                conn.execute(OPTIONS_FLOW_INSERT_SQL, _options_snapshot_row(snapshot))
+                saved.append(snapshot)
+            except Exception as e:
+                print(f"Error saving options for {snapshot.ticker}: {e}")
 
+    return saved
 
-def collect_options_data(tickers: list[str], delay: float = 0.5) -> dict:
+
+def collect_options_data(tickers: list[str], delay: float = 0.5, max_workers: int = 8) -> dict:
     """
     Collect options data for a list of tickers.
 
+    Tickers are fetched on a thread pool. Requests still start at most once
+    per `delay` seconds overall, but their network latency overlaps.
+
     Args:
         tickers: List of stock symbols
-        delay: Delay between requests (seconds)
+        delay: Minimum spacing between requests (seconds)
+        max_workers: Maximum concurrent requests
 
     Returns:
         Dict with collection statistics
@@ -218,29 +256,32 @@ def collect_options_data(tickers: list[str], delay: float = 0.5) -> dict:
         "errors": [],
     }
 
-    for i, ticker in enumerate(tickers):
-        try:
-            snapshot = get_options_data(ticker)
+    snapshots = []
 
-            if snapshot:
-                if save_options_snapshot(snapshot):
-                    stats["tickers_collected"] += 1
+    # Rate limiting, shared by all worker threads
+    fetch = get_options_data
+    if delay > 0:
+        fetch = sleep_and_retry(limits(calls=1, period=delay)(get_options_data))
 
-                    if snapshot.unusual_calls:
-                        stats["unusual_calls"] += 1
-                    if snapshot.unusual_puts:
-                        stats["unusual_puts"] += 1
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+        futures = {executor.submit(fetch, ticker): ticker for ticker in tickers}
+        for i, future in enumerate(as_completed(futures)):
+            try:
+                snapshot = future.result()
+                if snapshot:
+                    snapshots.append(snapshot)
+            except Exception as e:
+                stats["errors"].append(f"{futures[future]}: {str(e)}")
 
             # Progress indicator
             if (i + 1) % 10 == 0:
                 print(f"  Processed {i + 1}/{len(tickers)} tickers...")
 
-            # Rate limiting
-            if delay > 0:
-                time.sleep(delay)
-
-        except Exception as e:
-            stats["errors"].append(f"{ticker}: {str(e)}")
+    # Write everything in one transaction once fetching is done
+    saved = save_options_snapshots(snapshots)
+    stats["tickers_collected"] = len(saved)
+    stats["unusual_calls"] = sum(1 for s in saved if s.unusual_calls)
+    stats["unusual_puts"] = sum(1 for s in saved if s.unusual_puts)
 
     return stats
 
@@ -281,12 +322,21 @@ def get_default_watchlist() -> list[str]:
     Combines:
     - Stocks with recent insider buying
     - High-volume stocks
+
+    The result is cached per day; call get_default_watchlist.cache_clear()
+    after new insider data is saved.
     """
+    return list(_load_default_watchlist(date.today()))
+
+
+@lru_cache(maxsize=1)
+def _load_default_watchlist(today: date) -> tuple[str, ...]:
+    """Build the default watchlist for a given day (cached by get_default_watchlist)."""
     tickers = set()
 
     # Add stocks with recent insider buying
     with get_db() as conn:
-        cutoff = (date.today() - timedelta(days=14)).isoformat()
+        cutoff = (today - timedelta(days=14)).isoformat()
         cursor = conn.execute(
             """
             SELECT DISTINCT ticker FROM insider_trades
@@ -305,7 +355,10 @@ def get_default_watchlist() -> list[str]:
     ]
     tickers.update(popular)
 
-    return sorted(list(tickers))
+    return tuple(sorted(tickers))
+
+
+get_default_watchlist.cache_clear = _load_default_watchlist.cache_clear
 
 
 if __name__ == "__main__":
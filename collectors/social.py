@@ -9,12 +9,15 @@ Sources:
 - Stocktwits: Free API tier (secondary/confirmation source)
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Optional
 
 import requests
+from ratelimit import limits, sleep_and_retry
 
 import sys
 from pathlib import Path
@@ -23,6 +26,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.config import config
 from utils.db import get_db
 
+# Stocktwits free tier; matches the old 0.5s sleep between sequential calls
+STOCKTWITS_CALLS_PER_SECOND = 2
+
+# Per-thread HTTP session for Stocktwits requests
+_local = threading.local()
+
 
 @dataclass
 class SocialSnapshot:
@@ -115,6 +124,15 @@ class AdanosAPIClient:
         return self._request("/compare", {"tickers": ",".join(tickers[:10])})
 
 
+def _stocktwits_session() -> requests.Session:
+    """Return this thread's Stocktwits session, reusing its keep-alive connections."""
+    session = getattr(_local, "stocktwits_session", None)
+    if session is None:
+        session = _local.stocktwits_session = requests.Session()
+        session.headers.update({"User-Agent": "StockRadar/1.0"})
+    return session
+
+
 def fetch_stocktwits_data(ticker: str) -> dict:
     """
     Fetch recent messages for a ticker from Stocktwits.
@@ -131,8 +149,7 @@ def fetch_stocktwits_data(ticker: str) -> dict:
     url = f"https://api.stocktwits.com/api/2/streams/symbol/{ticker}.json"
 
     try:
-        headers = {"User-Agent": "StockRadar/1.0"}
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _stocktwits_session().get(url, timeout=30)
 
         if response.status_code in (403, 429):
             # API requires auth or rate limited - return empty gracefully
@@ -268,44 +285,167 @@ def calculate_velocity(current: int, previous: int) -> float:
     return ((current - previous) / previous) * 100
 
 
+SOCIAL_METRICS_INSERT_SQL = """
+    INSERT OR REPLACE INTO social_metrics
+    (ticker, date, reddit_mentions, reddit_sentiment, reddit_velocity,
+     stocktwits_mentions, stocktwits_sentiment, stocktwits_velocity,
+     combined_velocity, bullish_ratio)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _social_snapshot_row(snapshot: SocialSnapshot) -> tuple:
+    """Column values for SOCIAL_METRICS_INSERT_SQL."""
+    return (
+        snapshot.ticker,
+        snapshot.date.isoformat(),
+        snapshot.reddit_mentions,
+        snapshot.reddit_sentiment,
+        snapshot.reddit_velocity,
+        snapshot.stocktwits_mentions,
+        snapshot.stocktwits_sentiment,
+        snapshot.stocktwits_velocity,
+        snapshot.combined_velocity,
+        snapshot.bullish_ratio,
+    )
+
+
 def save_social_snapshot(snapshot: SocialSnapshot) -> bool:
     """Save social snapshot to database."""
-    try:
-        with get_db() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO social_metrics
-                (ticker, date, reddit_mentions, reddit_sentiment, reddit_velocity,
-                 stocktwits_mentions, stocktwits_sentiment, stocktwits_velocity,
-                 combined_velocity, bullish_ratio)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    snapshot.ticker,
-                    snapshot.date.isoformat(),
-                    snapshot.reddit_mentions,
-                    snapshot.reddit_sentiment,
-                    snapshot.reddit_velocity,
-                    snapshot.stocktwits_mentions,
-                    snapshot.stocktwits_sentiment,
-                    snapshot.stocktwits_velocity,
-                    snapshot.combined_velocity,
-                    snapshot.bullish_ratio,
-                )
-            )
-        return True
-    except Exception as e:
-        print(f"Error saving social data for {snapshot.ticker}: {e}")
-        return False
+    return bool(save_social_snapshots([snapshot]))
+
 
+def save_social_snapshots(snapshots: list[SocialSnapshot]) -> list[SocialSnapshot]:
+    """
+    Save social data snapshots with one executemany in a single transaction.
 
-def collect_social_data(tickers: list[str] = None, source: str = "all") -> dict:
+    If the batch fails it is rolled back and the snapshots are saved one at
+    a time, so a bad row is reported and skipped without losing the rest.
+
+    Returns:
+        The snapshots that were saved
+    """
+    if not snapshots:
+        return []
+
+    with get_db() as conn:
+        try:
+            # Nested get_db() runs in a savepoint, so a failed batch leaves nothing behind
+            with get_db() as batch:
+                batch.executemany(SOCIAL_METRICS_INSERT_SQL, [_social_snapshot_row(s) for s in snapshots])
+            return list(snapshots)
+        except Exception:
+            pass
+
+        saved = []
+        for snapshot in snapshots:
+            try:
+                conn.execute(SOCIAL_METRICS_INSERT_SQL, _social_snapshot_row(snapshot))
+                saved.append(snapshot)
+            except Exception as e:
+                print(f"Error saving social data for {snapshot.ticker}: {e}")
+
+    return saved
+
+
+@sleep_and_retry
+@limits(calls=STOCKTWITS_CALLS_PER_SECOND, period=1)
+def _fetch_stocktwits_throttled(ticker: str) -> dict:
+    """Stocktwits fetch shared by all collector threads under one rate limit."""
+    return fetch_stocktwits_data(ticker)
+
+
+def _build_social_snapshot(ticker: str, adanos_info: dict, source: str, today: date) -> SocialSnapshot:
+    """
+    Combine Adanos and Stocktwits data for one ticker into a snapshot.
+
+    Args:
+        ticker: Stock ticker symbol
+        adanos_info: Adanos metrics for the ticker (empty if none)
+        source: Data source - "adanos", "stocktwits", or "all"
+        today: Snapshot date
+
+    Returns:
+        SocialSnapshot for the ticker
+    """
+    # Adanos/Reddit data
+    reddit_mentions = adanos_info.get("mentions", 0)
+    reddit_sentiment = adanos_info.get("avg_sentiment", 0)
+
+    # Adanos provides bullish_pct (0-100), convert to ratio (0-1)
+    adanos_bullish_ratio = adanos_info.get("bullish_pct", 50) / 100
+
+    # Stocktwits data (secondary source)
+    stocktwits_mentions = 0
+    stocktwits_sentiment = 0
+    stocktwits_bullish_ratio = 0.5
+
+    if source in ("stocktwits", "all"):
+        stocktwits_info = _fetch_stocktwits_throttled(ticker)
+        stocktwits_mentions = stocktwits_info.get("count", 0)
+        stocktwits_sentiment = (stocktwits_info.get("bullish_ratio", 0.5) - 0.5) * 2  # Convert to -1 to 1
+        stocktwits_bullish_ratio = stocktwits_info.get("bullish_ratio", 0.5)
+
+    # Calculate combined bullish ratio
+    if reddit_mentions > 0 and stocktwits_mentions > 0:
+        # Weight by mention count
+        total = reddit_mentions + stocktwits_mentions
+        bullish_ratio = (
+            (adanos_bullish_ratio * reddit_mentions + stocktwits_bullish_ratio * stocktwits_mentions)
+            / total
+        )
+    elif reddit_mentions > 0:
+        bullish_ratio = adanos_bullish_ratio
+    elif stocktwits_mentions > 0:
+        bullish_ratio = stocktwits_bullish_ratio
+    else:
+        bullish_ratio = 0.5
+
+    # Get historical data for velocity
+    history = get_historical_mentions(ticker, days=7)
+
+    # Calculate velocity
+    reddit_velocity = calculate_velocity(
+        reddit_mentions,
+        history.get("yesterday_reddit", 0)
+    )
+    stocktwits_velocity = calculate_velocity(
+        stocktwits_mentions,
+        history.get("yesterday_stocktwits", 0)
+    )
+
+    # Combined velocity: weighted average if both have data
+    if reddit_velocity > 0 and stocktwits_velocity > 0:
+        combined_velocity = (reddit_velocity + stocktwits_velocity) / 2
+    elif reddit_velocity > 0:
+        combined_velocity = reddit_velocity
+    elif stocktwits_velocity > 0:
+        combined_velocity = stocktwits_velocity
+    else:
+        combined_velocity = 0
+
+    return SocialSnapshot(
+        ticker=ticker,
+        date=today,
+        reddit_mentions=reddit_mentions,
+        reddit_sentiment=reddit_sentiment,
+        reddit_velocity=reddit_velocity,
+        stocktwits_mentions=stocktwits_mentions,
+        stocktwits_sentiment=stocktwits_sentiment,
+        stocktwits_velocity=stocktwits_velocity,
+        combined_velocity=combined_velocity,
+        bullish_ratio=bullish_ratio,
+    )
+
+
+def collect_social_data(tickers: list[str] = None, source: str = "all", max_workers: int = 4) -> dict:
     """
     Collect social media data for tickers.
 
     Args:
         tickers: List of tickers to collect (None = use Adanos trending)
         source: Data source - "adanos", "stocktwits", or "all"
+        max_workers: Number of tickers fetched concurrently
 
     Returns:
         Dict with collection statistics
@@ -339,89 +479,34 @@ def collect_social_data(tickers: list[str] = None, source: str = "all") -> dict:
         print("  No tickers to process")
         return stats
 
-    # Process each ticker
-    for ticker in sorted(target_tickers):
-        try:
-            # Adanos/Reddit data
-            adanos_info = adanos_data.get(ticker, {})
-            reddit_mentions = adanos_info.get("mentions", 0)
-            reddit_sentiment = adanos_info.get("avg_sentiment", 0)
-
-            # Adanos provides bullish_pct (0-100), convert to ratio (0-1)
-            adanos_bullish_ratio = adanos_info.get("bullish_pct", 50) / 100
-
-            # Stocktwits data (secondary source)
-            stocktwits_mentions = 0
-            stocktwits_sentiment = 0
-            stocktwits_bullish_ratio = 0.5
-
-            if source in ("stocktwits", "all"):
-                stocktwits_info = fetch_stocktwits_data(ticker)
-                stocktwits_mentions = stocktwits_info.get("count", 0)
-                stocktwits_sentiment = (stocktwits_info.get("bullish_ratio", 0.5) - 0.5) * 2  # Convert to -1 to 1
-                stocktwits_bullish_ratio = stocktwits_info.get("bullish_ratio", 0.5)
-                time.sleep(0.5)  # Rate limit Stocktwits
-                if stocktwits_mentions > 0:
-                    stats["stocktwits_tickers"] += 1
-
-            # Calculate combined bullish ratio
-            if reddit_mentions > 0 and stocktwits_mentions > 0:
-                # Weight by mention count
-                total = reddit_mentions + stocktwits_mentions
-                bullish_ratio = (
-                    (adanos_bullish_ratio * reddit_mentions + stocktwits_bullish_ratio * stocktwits_mentions)
-                    / total
-                )
-            elif reddit_mentions > 0:
-                bullish_ratio = adanos_bullish_ratio
-            elif stocktwits_mentions > 0:
-                bullish_ratio = stocktwits_bullish_ratio
-            else:
-                bullish_ratio = 0.5
-
-            # Get historical data for velocity
-            history = get_historical_mentions(ticker, days=7)
-
-            # Calculate velocity
-            reddit_velocity = calculate_velocity(
-                reddit_mentions,
-                history.get("yesterday_reddit", 0)
-            )
-            stocktwits_velocity = calculate_velocity(
-                stocktwits_mentions,
-                history.get("yesterday_stocktwits", 0)
-            )
-
-            # Combined velocity: weighted average if both have data
-            if reddit_velocity > 0 and stocktwits_velocity > 0:
-                combined_velocity = (reddit_velocity + stocktwits_velocity) / 2
-            elif reddit_velocity > 0:
-                combined_velocity = reddit_velocity
-            elif stocktwits_velocity > 0:
-                combined_velocity = stocktwits_velocity
-            else:
-                combined_velocity = 0
-
-            snapshot = SocialSnapshot(
-                ticker=ticker,
-                date=today,
-                reddit_mentions=reddit_mentions,
-                reddit_sentiment=reddit_sentiment,
-                reddit_velocity=reddit_velocity,
-                stocktwits_mentions=stocktwits_mentions,
-                stocktwits_sentiment=stocktwits_sentiment,
-                stocktwits_velocity=stocktwits_velocity,
-                combined_velocity=combined_velocity,
-                bullish_ratio=bullish_ratio,
-            )
-
-            if save_social_snapshot(snapshot):
-                stats["tickers_collected"] += 1
-                if combined_velocity > 100:
-                    stats["high_velocity"] += 1
-
-        except Exception as e:
-            stats["errors"].append(f"{ticker}: {str(e)}")
+    snapshots = []
+
+    # Fetch each ticker on a small pool; the Stocktwits limiter is shared,
+    # so the request rate stays the same while network waits overlap
+    ordered = sorted(target_tickers)
+    workers = max(1, min(max_workers, len(ordered)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _build_social_snapshot, ticker, adanos_data.get(ticker, {}), source, today
+            ): ticker
+            for ticker in ordered
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                snapshot = future.result()
+            except Exception as e:
+                stats["errors"].append(f"{ticker}: {str(e)}")
+                continue
+            snapshots.append(snapshot)
+            if snapshot.stocktwits_mentions > 0:
+                stats["stocktwits_tickers"] += 1
+
+    # Write everything in one transaction once fetching is done
+    saved = save_social_snapshots(snapshots)
+    stats["tickers_collected"] = len(saved)
+    stats["high_velocity"] = sum(1 for s in saved if s.combined_velocity > 100)
 
     return stats
 
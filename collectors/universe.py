@@ -9,6 +9,7 @@ import time
 from io import StringIO
 from typing import List, Dict, Optional, Tuple
 from datetime import date
+from functools import lru_cache
 import requests
 import yfinance as yf
 import pandas as pd
@@ -18,22 +19,36 @@ SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
 
 
 def get_sp500_tickers() -> List[str]:
-    """Fetch current S&P 500 constituents from Wikipedia."""
+    """
+    Fetch current S&P 500 constituents from Wikipedia.
+    
+    A successful fetch is cached for the rest of the day, so commands that
+    scan the universe more than once in a process only download it once.
+    Failures are not cached. Call get_sp500_tickers.cache_clear() to refetch.
+    """
     try:
-        # Use requests with User-Agent to avoid 403 Forbidden
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(SP500_URL, headers=headers)
-        response.raise_for_status()
-        tables = pd.read_html(StringIO(response.text))
-        df = tables[0]
-        # Handle tickers with dots (e.g., BRK.B -> BRK-B for yfinance)
-        tickers = df['Symbol'].str.replace('.', '-', regex=False).tolist()
-        return tickers
+        return list(_fetch_sp500_tickers(date.today()))
     except Exception as e:
         print(f"Error fetching S&P 500 list: {e}")
         return _get_fallback_tickers()
 
 
+@lru_cache(maxsize=1)
+def _fetch_sp500_tickers(today: date) -> Tuple[str, ...]:
+    """Download the S&P 500 list for a given day (cached by get_sp500_tickers)."""
+    # Use requests with User-Agent to avoid 403 Forbidden
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    response = requests.get(SP500_URL, headers=headers)
+    response.raise_for_status()
+    tables = pd.read_html(StringIO(response.text))
+    df = tables[0]
+    # Handle tickers with dots (e.g., BRK.B -> BRK-B for yfinance)
+    return tuple(df['Symbol'].str.replace('.', '-', regex=False))
+
+
+get_sp500_tickers.cache_clear = _fetch_sp500_tickers.cache_clear
+
+
 def get_nasdaq100_tickers() -> List[str]:
     """Get NASDAQ-100 components."""
     # These rarely change, so hardcoded is fine
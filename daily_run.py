@@ -6,6 +6,9 @@ Main command-line interface for running the stock radar system.
 """
 
 import click
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -14,196 +17,278 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.config import config
-from utils.db import get_db, get_table_counts, init_db
-from collectors.insider import collect_insider_data, get_recent_purchases
-from collectors.options import collect_options_data, get_default_watchlist, get_unusual_options
-from collectors.social import collect_social_data, get_trending_tickers
-from collectors.market import collect_market_data, get_market_data, get_current_price
-from signals.insider_signal import score_insider, get_top_insider_stocks, format_signal_report as format_insider_report
-from signals.options_signal import score_options, get_top_options_stocks, format_signal_report as format_options_report
-from signals.social_signal import score_social, get_top_social_stocks, format_signal_report as format_social_report
-from signals.combiner import (
-    combine_signals, run_daily_scoring, get_top_signals, format_combined_signal, get_scoring_universe
+from utils.db import classify_closed_trades, get_closed_trade_summary, get_db, get_table_counts, init_db, shared_connection
+
+# Row templates for the top and history tables
+TOP_ROW_FORMAT = (
+    "{ticker:<8} {total_score:>6} {action:<8} {tier:>4} {position_size:<8} "
+    "{insider_score:>4} {options_score:>4} {social_score:>4}"
+)
+HISTORY_ROW_FORMAT = (
+    "{result} {ticker:<6} ${entry_price:.2f} → ${exit_price:.2f}  "
+    "{return_pct:+.1f}% (${return_dollars:+.2f})  {days_held}d  {exit_reason}"
 )
-from output.formatter import format_daily_email, preview_email
-from output.emailer import send_daily_email, test_email_connection, send_test_email
+
+# Fraction of the paper portfolio allocated per position size
+POSITION_SIZE_PCT = {"FULL": 0.10, "HALF": 0.05, "QUARTER": 0.025}
+
+# Listings longer than this are sent through the pager
+PAGER_MIN_ROWS = 50
+
+# Bytes read from the end of cron.log when checking for recent errors
+CRON_LOG_TAIL_BYTES = 16 * 1024
+
+
+class Out:
+    """Collect report lines and write them to stdout in one go."""
+
+    def __init__(self):
+        self.lines = []
+
+    def __call__(self, line=""):
+        self.lines.append(str(line))
+
+    def flush(self, pager=False):
+        """
+        Write the buffered lines.
+
+        Args:
+            pager: Page the output (e.g. through less) instead of printing
+                it; click falls back to plain output when not on a terminal
+        """
+        if self.lines:
+            if pager:
+                click.echo_via_pager(f"{line}\n" for line in self.lines)
+            else:
+                # Reports are plain text (no ANSI styling), so skip click.echo
+                # and write straight to the text stream with a single flush
+                stdout = click.get_text_stream("stdout")
+                stdout.write("\n".join(self.lines))
+                stdout.write("\n")
+                stdout.flush()
+            self.lines = []
+
+
+def _scan_concurrently(func, tickers, max_workers=None):
+    """
+    Run func(ticker) for each ticker on a thread pool.
+
+    Yields (ticker, result, error) in input order so callers can keep their
+    per-ticker progress and error handling. Threads rather than processes:
+    the work is dominated by network I/O, and workers can read preloaded
+    price frames (get_price_histories) in place without pickling them.
+    """
+    max_workers = max_workers or config.V2_SCAN_WORKERS
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, ticker) for ticker in tickers]
+        for ticker, future in zip(tickers, futures):
+            try:
+                yield ticker, future.result(), None
+            except Exception as e:
+                yield ticker, None, e
+
+
+def _rank_by_rs(results, rs_ratings):
+    """
+    Order trend template results by RS rating, highest first.
+
+    Ratings are gathered into one array and ranked with a stable argsort,
+    so ties keep their scan order (same as a reverse sorted()).
+    """
+    import numpy as np
+    scores = np.fromiter(
+        (rs_ratings.get(r.ticker) or 0 for r in results), dtype=np.float64, count=len(results)
+    )
+    return [results[i] for i in np.argsort(-scores, kind="stable")]
 
 
 @click.group()
-def cli():
+@click.pass_context
+def cli(ctx):
     """Stock Radar - Daily stock signal generator."""
-    pass
+    # Every get_db() block in the command shares one connection
+    ctx.with_resource(shared_connection())
+    # Resolve "today" once per invocation; commands bind it as a parameter
+    ctx.ensure_object(dict)["today"] = date.today()
 
 
 @cli.command()
-def status():
+@click.option("--exact", is_flag=True, help="Use exact COUNT(*) row counts (slower on large tables)")
+def status(exact):
     """Show system status and database health."""
-    click.echo("=" * 50)
-    click.echo("STOCK RADAR STATUS")
-    click.echo("=" * 50)
-    click.echo()
+    out = Out()
+    out("=" * 50)
+    out("STOCK RADAR STATUS")
+    out("=" * 50)
+    out()
 
     # Check configuration
-    click.echo("Configuration:")
+    out("Configuration:")
     issues = config.validate()
     if issues:
         for issue in issues:
-            click.echo(f"  ⚠️  {issue}")
+            out(f"  ⚠️  {issue}")
     else:
-        click.echo("  ✅ All required config present")
-    click.echo()
+        out("  ✅ All required config present")
+    out()
 
     # Check database
-    click.echo("Database:")
+    out("Database:")
     if config.DB_PATH.exists():
-        click.echo(f"  ✅ Database exists at {config.DB_PATH}")
-        counts = get_table_counts()
-        click.echo("  Table counts:")
+        out(f"  ✅ Database exists at {config.DB_PATH}")
+        counts = get_table_counts(exact=exact)
+        out("  Table counts:" if exact else "  Table counts (approximate, use --exact):")
         for table, count in counts.items():
-            click.echo(f"    {table}: {count}")
+            out(f"    {table}: {count}")
     else:
-        click.echo(f"  ❌ Database not found at {config.DB_PATH}")
-        click.echo("  Run: python3 -m utils.db")
-    click.echo()
+        out(f"  ❌ Database not found at {config.DB_PATH}")
+        out("  Run: python3 -m utils.db")
+    out()
 
     # Check directories
-    click.echo("Directories:")
-    click.echo(f"  Data: {config.DATA_DIR} {'✅' if config.DATA_DIR.exists() else '❌'}")
-    click.echo(f"  Logs: {config.LOGS_DIR} {'✅' if config.LOGS_DIR.exists() else '❌'}")
-    click.echo()
+    out("Directories:")
+    out(f"  Data: {config.DATA_DIR} {'✅' if config.DATA_DIR.exists() else '❌'}")
+    out(f"  Logs: {config.LOGS_DIR} {'✅' if config.LOGS_DIR.exists() else '❌'}")
+    out()
+    out.flush()
 
 
 @cli.command()
-def health():
+@click.pass_obj
+def health(obj):
     """Show system health and recent activity."""
-    from datetime import datetime, timedelta
+    out = Out()
     from utils.trading_calendar import is_trading_day, next_trading_day, previous_trading_day
 
-    click.echo("=" * 50)
-    click.echo("STOCK RADAR HEALTH CHECK")
-    click.echo("=" * 50)
-    click.echo()
+    out("=" * 50)
+    out("STOCK RADAR HEALTH CHECK")
+    out("=" * 50)
+    out()
 
-    today = date.today()
+    today = obj["today"]
     now = datetime.now()
 
     # Trading calendar status
-    click.echo("Trading Calendar:")
-    click.echo(f"  Today ({today}): {'Trading day' if is_trading_day(today) else 'Market closed'}")
-    click.echo(f"  Next trading day: {next_trading_day(today)}")
-    click.echo(f"  Previous trading day: {previous_trading_day(today)}")
-    click.echo()
+    out("Trading Calendar:")
+    out(f"  Today ({today}): {'Trading day' if is_trading_day(today) else 'Market closed'}")
+    out(f"  Next trading day: {next_trading_day(today)}")
+    out(f"  Previous trading day: {previous_trading_day(today)}")
+    out()
 
     # Check database
     if not config.DB_PATH.exists():
-        click.echo("Database: NOT FOUND")
-        click.echo("  Run: python3 daily_run.py init")
+        out("Database: NOT FOUND")
+        out("  Run: python3 daily_run.py init")
+        out.flush()
         return
 
-    click.echo("Recent Activity:")
-    with get_db() as conn:
-        # Last insider collection
-        cursor = conn.execute(
-            "SELECT MAX(filed_date) as last_date, COUNT(*) as count FROM insider_trades WHERE filed_date >= date('now', '-7 days')"
-        )
-        insider = cursor.fetchone()
-        if insider and insider['last_date']:
-            click.echo(f"  Last insider data: {insider['last_date']} ({insider['count']} trades in last 7 days)")
-        else:
-            click.echo("  Last insider data: No recent data")
+    today_str = today.isoformat()
+    cutoff_7d = (today - timedelta(days=7)).isoformat()
 
-        # Last options collection
-        cursor = conn.execute(
-            "SELECT MAX(date) as last_date, COUNT(*) as count FROM options_flow WHERE date >= date('now', '-7 days')"
-        )
-        options = cursor.fetchone()
-        if options and options['last_date']:
-            click.echo(f"  Last options data: {options['last_date']} ({options['count']} records in last 7 days)")
+    out("Recent Activity:")
+    # One round-trip: per-source freshness, signals per day and today's
+    # actions, tagged by kind
+    with get_db() as conn:
+        rows = conn.execute("""
+            SELECT 'insider' AS kind, MAX(filed_date) AS label, COUNT(*) AS count
+            FROM insider_trades WHERE filed_date >= :cutoff
+            UNION ALL
+            SELECT 'options', MAX(date), COUNT(*) FROM options_flow WHERE date >= :cutoff
+            UNION ALL
+            SELECT 'social', MAX(date), COUNT(*) FROM social_metrics WHERE date >= :cutoff
+            UNION ALL
+            SELECT 'recent', date, count FROM (
+                SELECT date, COUNT(*) AS count FROM signals
+                WHERE date >= :cutoff GROUP BY date ORDER BY date DESC LIMIT 5
+            )
+            UNION ALL
+            SELECT 'today', action, COUNT(*) FROM signals WHERE date = :today GROUP BY action
+        """, {"cutoff": cutoff_7d, "today": today_str}).fetchall()
+
+    sources = {}
+    recent_signals = []
+    today_actions = []
+    for kind, label, count in rows:
+        if kind == 'recent':
+            recent_signals.append((label, count))
+        elif kind == 'today':
+            today_actions.append((label, count))
         else:
-            click.echo("  Last options data: No recent data")
-
-        # Last social collection
-        cursor = conn.execute(
-            "SELECT MAX(date) as last_date, COUNT(*) as count FROM social_metrics WHERE date >= date('now', '-7 days')"
-        )
-        social = cursor.fetchone()
-        if social and social['last_date']:
-            click.echo(f"  Last social data: {social['last_date']} ({social['count']} records in last 7 days)")
+            sources[kind] = (label, count)
+
+    insider, options, social = sources['insider'], sources['options'], sources['social']
+    for name, (last_date, count), unit in (
+        ("insider", insider, "trades"),
+        ("options", options, "records"),
+        ("social", social, "records"),
+    ):
+        if last_date:
+            out(f"  Last {name} data: {last_date} ({count} {unit} in last 7 days)")
         else:
-            click.echo("  Last social data: No recent data")
+            out(f"  Last {name} data: No recent data")
 
-        # Last signal generation
-        cursor = conn.execute(
-            "SELECT MAX(date) as last_date, COUNT(*) as today_count FROM signals WHERE date = date('now')"
-        )
-        signals = cursor.fetchone()
-        cursor = conn.execute(
-            "SELECT date, COUNT(*) as count FROM signals WHERE date >= date('now', '-7 days') GROUP BY date ORDER BY date DESC LIMIT 5"
-        )
-        recent_signals = cursor.fetchall()
-
-        click.echo()
-        click.echo("Signal Generation:")
-        if recent_signals:
-            for row in recent_signals:
-                click.echo(f"  {row['date']}: {row['count']} signals")
-        else:
-            click.echo("  No signals in last 7 days")
+    out()
+    out("Signal Generation:")
+    if recent_signals:
+        for signal_date, count in recent_signals:
+            out(f"  {signal_date}: {count} signals")
+    else:
+        out("  No signals in last 7 days")
 
-        # Today's signals summary
-        cursor = conn.execute(
-            "SELECT action, COUNT(*) as count FROM signals WHERE date = date('now') GROUP BY action"
-        )
-        today_actions = cursor.fetchall()
-        if today_actions:
-            click.echo()
-            click.echo("Today's Signals:")
-            for row in today_actions:
-                click.echo(f"  {row['action']}: {row['count']}")
+    # Today's signals summary
+    if today_actions:
+        out()
+        out("Today's Signals:")
+        for action, count in today_actions:
+            out(f"  {action}: {count}")
 
     # Check cron log for errors
-    click.echo()
-    click.echo("Recent Errors:")
+    out()
+    out("Recent Errors:")
     cron_log = config.LOGS_DIR / "cron.log"
     if cron_log.exists():
         try:
-            with open(cron_log, 'r') as f:
-                lines = f.readlines()
-                # Look for ERROR in last 100 lines
-                recent_lines = lines[-100:] if len(lines) > 100 else lines
-                errors = [l.strip() for l in recent_lines if 'ERROR' in l.upper()]
-                if errors:
-                    for err in errors[-5:]:  # Show last 5 errors
-                        click.echo(f"  {err[:80]}")
-                else:
-                    click.echo("  No errors in recent log")
+            # Only read the tail of the log so this stays cheap as it grows
+            size = cron_log.stat().st_size
+            with open(cron_log, 'rb') as f:
+                f.seek(max(0, size - CRON_LOG_TAIL_BYTES))
+                tail = f.read().decode('utf-8', 'replace')
+            # Look for ERROR in last 100 lines
+            recent_lines = tail.splitlines()[-100:]
+            errors = [l.strip() for l in recent_lines if 'ERROR' in l.upper()]
+            if errors:
+                for err in errors[-5:]:  # Show last 5 errors
+                    out(f"  {err[:80]}")
+            else:
+                out("  No errors in recent log")
         except Exception as e:
-            click.echo(f"  Could not read log: {e}")
+            out(f"  Could not read log: {e}")
     else:
-        click.echo("  No cron log found (scripts not yet run)")
+        out("  No cron log found (scripts not yet run)")
 
     # Overall health assessment
-    click.echo()
-    click.echo("-" * 50)
+    out()
+    out("-" * 50)
 
     issues = []
-    if not insider or not insider['last_date']:
+    if not insider[0]:
         issues.append("No recent insider data")
-    if not options or not options['last_date']:
+    if not options[0]:
         issues.append("No recent options data")
-    if not social or not social['last_date']:
+    if not social[0]:
         issues.append("No recent social data")
     if not recent_signals:
         issues.append("No signals generated recently")
 
     if issues:
-        click.echo("Issues Found:")
+        out("Issues Found:")
         for issue in issues:
-            click.echo(f"  - {issue}")
-        click.echo()
-        click.echo("Run 'python3 daily_run.py evening' to collect data and generate signals")
+            out(f"  - {issue}")
+        out()
+        out("Run 'python3 daily_run.py evening' to collect data and generate signals")
     else:
-        click.echo("System healthy - all data sources active")
+        out("System healthy - all data sources active")
+    out.flush()
 
 
 @cli.command()
@@ -216,11 +301,57 @@ def init():
     click.echo("Database initialized.")
 
 
+# Tables the scoring pipeline reads; new rows in any of them invalidate the cache
+SCORING_INPUT_TABLES = ("insider_trades", "options_flow", "social_metrics", "market_data")
+
+# Scoring code; edits to any of these invalidate the cache
+SCORING_SOURCE_FILES = (
+    "signals/combiner.py",
+    "signals/insider_signal.py",
+    "signals/options_signal.py",
+    "signals/social_signal.py",
+)
+
+
+def _scoring_cache_path(scoring_date):
+    """
+    Path of the pickled scoring result for a date and the current input data.
+
+    The key includes the latest rowid of every scoring input table, so any
+    collector run invalidates previously cached results. The file mtime of
+    the database is not used because scoring itself writes the signals
+    table and WAL checkpoints rewrite the file. The config settings and
+    the scoring source files are hashed in too, so changed thresholds,
+    weights or signal classes never reuse an old result.
+    """
+    stamp_sql = ", ".join(f"(SELECT MAX(rowid) FROM {t})" for t in SCORING_INPUT_TABLES)
+    with get_db() as conn:
+        stamp = tuple(conn.execute(f"SELECT {stamp_sql}").fetchone())
+
+    digest = hashlib.sha1(f"{scoring_date}:{stamp}".encode())
+    settings = sorted((name, repr(getattr(config, name))) for name in dir(config) if name.isupper())
+    digest.update(repr(settings).encode())
+    root = Path(__file__).parent
+    for source in SCORING_SOURCE_FILES:
+        digest.update((root / source).read_bytes())
+    return config.DATA_DIR / "scoring-cache" / f"{digest.hexdigest()}.pkl"
+
+
+def _save_scoring_cache(cache_path, signals):
+    """Pickle scoring results, replacing any older cache entries."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in cache_path.parent.glob("*.pkl"):
+        stale.unlink()
+    with open(cache_path, "wb") as f:
+        pickle.dump(signals, f, protocol=5)
+
+
 @cli.command()
 @click.option("--date", "-d", "target_date", default=None,
               help="Date to score (YYYY-MM-DD), defaults to today")
 def score(target_date):
     """Run daily scoring pipeline."""
+    from signals.combiner import run_daily_scoring, get_scoring_universe
     if target_date:
         try:
             scoring_date = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -244,8 +375,22 @@ def score(target_date):
         click.echo("  python3 daily_run.py social-collect")
         return
 
-    # Run scoring
-    signals = run_daily_scoring(scoring_date)
+    # Reuse the previous run if nothing has been written since
+    cache_path = _scoring_cache_path(scoring_date)
+    signals = None
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                signals = pickle.load(f)
+            click.echo("Using cached scores (no new data since last run)")
+        except Exception:
+            # Unreadable or written by incompatible code: treat as a miss
+            signals = None
+
+    if signals is None:
+        # Run scoring
+        signals = run_daily_scoring(scoring_date, universe=universe)
+        _save_scoring_cache(cache_path, signals)
 
     # Show results summary
     trade_signals = [s for s in signals if s.action == "TRADE"]
@@ -272,46 +417,57 @@ def score(target_date):
 @click.option("--action", "-a", type=click.Choice(["TRADE", "WATCH", "ALL"]), default="ALL",
               help="Filter by action type")
 @click.option("--limit", "-l", default=10, help="Number of signals to show")
-def top(action, limit):
+@click.pass_obj
+def top(obj, action, limit):
     """Show today's top signals."""
-    today = date.today()
+    from signals.combiner import get_top_signals
+    out = Out()
+    today = obj["today"]
 
     action_filter = action if action != "ALL" else None
     signals = get_top_signals(target_date=today, action_filter=action_filter, limit=limit)
 
     if not signals:
-        click.echo(f"No signals found for {today}")
-        click.echo("Run: python3 daily_run.py score")
+        out(f"No signals found for {today}")
+        out("Run: python3 daily_run.py score")
+        out.flush()
         return
 
-    click.echo(f"Top signals for {today}" + (f" (action={action})" if action != "ALL" else "") + ":")
-    click.echo("-" * 70)
-    click.echo(f"{'Ticker':<8} {'Score':>6} {'Action':<8} {'Tier':>4} {'Size':<8} {'I':>4} {'O':>4} {'S':>4}")
-    click.echo("-" * 70)
+    out(f"Top signals for {today}" + (f" (action={action})" if action != "ALL" else "") + ":")
+    out("-" * 70)
+    out(f"{'Ticker':<8} {'Score':>6} {'Action':<8} {'Tier':>4} {'Size':<8} {'I':>4} {'O':>4} {'S':>4}")
+    out("-" * 70)
 
-    for sig in signals:
-        click.echo(
-            f"{sig['ticker']:<8} {sig['total_score']:>6} {sig['action']:<8} "
-            f"{sig['tier'] or '-':>4} {sig['position_size'] or '-':<8} "
-            f"{sig['insider_score']:>4} {sig['options_score']:>4} {sig['social_score']:>4}"
-        )
+    row = TOP_ROW_FORMAT.format
+    out("\n".join(
+        row(**{**sig, 'tier': sig['tier'] or '-', 'position_size': sig['position_size'] or '-'})
+        for sig in signals
+    ))
 
-    click.echo()
-    click.echo("Use 'python3 daily_run.py explain <TICKER>' for details")
+    out()
+    out("Use 'python3 daily_run.py explain <TICKER>' for details")
+    out.flush(pager=len(signals) > PAGER_MIN_ROWS)
 
 
 @cli.command()
 @click.argument("ticker")
 @click.option("--live", is_flag=True, help="Calculate live signal (don't use cached)")
-def explain(ticker, live):
+@click.pass_obj
+def explain(obj, ticker, live):
     """Show signal breakdown for a specific ticker."""
-    today = date.today()
+    from collectors.market import get_market_data, get_current_price
+    from signals.combiner import combine_signals, format_combined_signal
+    today = obj["today"]
     ticker = ticker.upper()
 
     if live:
-        # Get current price and ATR for live calculation
-        price = get_current_price(ticker)
-        market = get_market_data(ticker)
+        # Get current price and ATR for live calculation (independent
+        # network calls, so fetch them concurrently)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(get_current_price, ticker)
+            market_future = executor.submit(get_market_data, ticker)
+            price = price_future.result()
+            market = market_future.result()
         atr = market.atr_14 if market else None
 
         signal = combine_signals(ticker, today, current_price=price, atr=atr)
@@ -368,6 +524,8 @@ def explain(ticker, live):
               help="Date to generate email for (YYYY-MM-DD)")
 def email(preview, test, target_date):
     """Generate and send daily email."""
+    from output.formatter import preview_email
+    from output.emailer import send_daily_email, test_email_connection, send_test_email
     if target_date:
         try:
             email_date = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -414,6 +572,7 @@ def email(preview, test, target_date):
 @click.option("--count", "-c", default=100, help="Number of filings to fetch")
 def morning(count):
     """Run morning data collection (insider filings)."""
+    from collectors.insider import collect_insider_data
     click.echo(f"Morning collection - {date.today()}")
     click.echo()
 
@@ -433,30 +592,60 @@ def morning(count):
 @click.option("--skip-collect", is_flag=True, help="Skip data collection (use existing data)")
 def evening(skip_collect):
     """Run evening pipeline (collect -> score -> email)."""
+    from collectors.insider import collect_insider_data
+    from collectors.options import collect_options_data, get_default_watchlist
+    from collectors.social import collect_social_data
+    from signals.combiner import run_daily_scoring
     click.echo(f"Evening pipeline - {date.today()}")
     click.echo("=" * 50)
     click.echo()
 
     if not skip_collect:
-        # Step 1: Collect insider data
-        click.echo("Step 1/4: Collecting insider data...")
-        insider_stats = collect_insider_data(count=100, purchases_only=True)
-        click.echo(f"  Purchases found: {insider_stats['purchases_found']}")
-        click.echo()
-
-        # Step 2: Collect options data
-        click.echo("Step 2/4: Collecting options data...")
-        options_tickers = get_default_watchlist()
-        options_stats = collect_options_data(options_tickers, delay=0.3)
-        click.echo(f"  Tickers collected: {options_stats['tickers_collected']}")
-        click.echo(f"  Unusual calls: {options_stats['unusual_calls']}")
-        click.echo()
+        # The options watchlist includes recent insider purchases, so options
+        # collection waits for tonight's Form 4 filings in the same worker;
+        # social data is fetched alongside. Each collector writes its batch
+        # in one short transaction at the end.
+        click.echo("Steps 1-3/4: Collecting insider, options and social data...")
+
+        def collect_insider_then_options():
+            results = {}
+            try:
+                results["insider"] = collect_insider_data(count=100, purchases_only=True)
+            except Exception as e:
+                results["insider"] = e
+            get_default_watchlist.cache_clear()
+            try:
+                results["options"] = collect_options_data(get_default_watchlist(), delay=0.3)
+            except Exception as e:
+                results["options"] = e
+            return results
 
-        # Step 3: Collect social data (via Adanos API + Stocktwits)
-        click.echo("Step 3/4: Collecting social data...")
-        social_stats = collect_social_data()
-        click.echo(f"  Tickers collected: {social_stats['tickers_collected']}")
-        click.echo(f"  High velocity: {social_stats['high_velocity']}")
+        def collect_social():
+            try:
+                return {"social": collect_social_data()}
+            except Exception as e:
+                return {"social": e}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(collect_insider_then_options),
+                executor.submit(collect_social),
+            ]
+            for future in as_completed(futures):
+                for source, stats in future.result().items():
+                    if isinstance(stats, Exception):
+                        click.echo(f"  {source.title()} collection failed: {stats}")
+                        continue
+
+                    click.echo(f"  {source.title()} data collected")
+                    if source == "insider":
+                        click.echo(f"    Purchases found: {stats['purchases_found']}")
+                    elif source == "options":
+                        click.echo(f"    Tickers collected: {stats['tickers_collected']}")
+                        click.echo(f"    Unusual calls: {stats['unusual_calls']}")
+                    else:
+                        click.echo(f"    Tickers collected: {stats['tickers_collected']}")
+                        click.echo(f"    High velocity: {stats['high_velocity']}")
         click.echo()
     else:
         click.echo("Skipping data collection (using existing data)")
@@ -501,20 +690,21 @@ def full():
 @cli.command()
 @click.argument("ticker")
 @click.argument("price", type=float)
-@click.option("--size", "-s", type=click.Choice(["FULL", "HALF", "QUARTER"]), default="HALF",
+@click.option("--size", "-s", type=click.Choice(list(POSITION_SIZE_PCT)), default="HALF",
               help="Position size (default: HALF)")
 @click.option("--notes", "-n", default=None, help="Trade notes/reason")
-def enter(ticker, price, size, notes):
+@click.pass_obj
+def enter(obj, ticker, price, size, notes):
     """Log a paper trade entry.
 
     Example: python3 daily_run.py enter NVDA 142.30 --size HALF --notes "CEO buying"
     """
     ticker = ticker.upper()
-    today = date.today()
+    today = obj["today"]
 
     # Calculate position size
     portfolio = config.PAPER_PORTFOLIO_SIZE
-    size_pct = {"FULL": 0.10, "HALF": 0.05, "QUARTER": 0.025}[size]
+    size_pct = POSITION_SIZE_PCT[size]
     position_value = portfolio * size_pct
     shares = int(position_value / price)
 
@@ -528,10 +718,24 @@ def enter(ticker, price, size, notes):
     signal_id = None
     stop_price = None
     target_price = None
+    ceo_cfo_buying = None
+    unique_buyers = None
 
     with get_db() as conn:
+        # Take the write lock up front so the open-position check and the
+        # insert below can't interleave with another writer
+        conn.execute("BEGIN IMMEDIATE")
+
         cursor = conn.execute(
-            "SELECT id, stop_price, target_price FROM signals WHERE date = ? AND ticker = ?",
+            """
+            SELECT id, stop_price, target_price,
+                   CASE WHEN json_valid(insider_details)
+                        THEN json_extract(insider_details, '$.ceo_cfo_buying') END AS ceo_cfo_buying,
+                   CASE WHEN json_valid(insider_details)
+                        THEN json_extract(insider_details, '$.unique_buyers') END AS unique_buyers
+            FROM signals
+            WHERE date = ? AND ticker = ?
+            """,
             (today.isoformat(), ticker)
         )
         signal = cursor.fetchone()
@@ -540,35 +744,32 @@ def enter(ticker, price, size, notes):
             signal_id = signal['id']
             stop_price = signal['stop_price']
             target_price = signal['target_price']
+            ceo_cfo_buying = signal['ceo_cfo_buying']
+            unique_buyers = signal['unique_buyers']
 
-    # Default stop/target if no signal found
-    if stop_price is None:
-        stop_price = price * (1 - config.DEFAULT_STOP_PCT)
-    if target_price is None:
-        target_price = price * (1 + config.DEFAULT_TARGET_PCT)
+        # Default stop/target if no signal found
+        if stop_price is None:
+            stop_price = price * (1 - config.DEFAULT_STOP_PCT)
+        if target_price is None:
+            target_price = price * (1 + config.DEFAULT_TARGET_PCT)
 
-    # Check for existing open position
-    with get_db() as conn:
-        cursor = conn.execute(
-            "SELECT id FROM trades WHERE ticker = ? AND status = 'OPEN'",
-            (ticker,)
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            click.echo(f"Error: Already have an open position in {ticker}")
-            click.echo("Use 'python3 daily_run.py exit' to close it first")
-            return
-
-        # Insert the trade
+        # Insert the trade unless there is already an open position
         cursor = conn.execute(
             """
-            INSERT INTO trades (signal_id, ticker, entry_date, entry_price, shares, stop_price, target_price, status, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'OPEN', ?)
+            INSERT INTO trades (signal_id, ticker, entry_date, entry_price, shares, stop_price, target_price,
+                                status, notes, ceo_cfo_buying, unique_buyers)
+            SELECT ?, ?, ?, ?, ?, ?, ?, 'OPEN', ?, ?, ?
+            WHERE NOT EXISTS (SELECT 1 FROM trades WHERE ticker = ? AND status = 'OPEN')
             """,
-            (signal_id, ticker, today.isoformat(), price, shares, stop_price, target_price, notes)
+            (signal_id, ticker, today.isoformat(), price, shares, stop_price, target_price, notes,
+             ceo_cfo_buying, unique_buyers, ticker)
         )
 
+    if cursor.rowcount == 0:
+        click.echo(f"Error: Already have an open position in {ticker}")
+        click.echo("Use 'python3 daily_run.py exit' to close it first")
+        return
+
     # Show confirmation
     click.echo()
     click.echo("✓ Paper trade entered")
@@ -590,15 +791,19 @@ def enter(ticker, price, size, notes):
 @click.option("--reason", "-r", type=click.Choice(["TARGET", "STOP", "TIME", "MANUAL"]),
               default="MANUAL", help="Exit reason (default: MANUAL)")
 @click.option("--notes", "-n", default=None, help="Exit notes")
-def exit_trade(ticker, price, reason, notes):
+@click.pass_obj
+def exit_trade(obj, ticker, price, reason, notes):
     """Close an open paper trade.
 
     Example: python3 daily_run.py exit NVDA 156.50 --reason TARGET
     """
     ticker = ticker.upper()
-    today = date.today()
+    today = obj["today"]
 
     with get_db() as conn:
+        # Read and close the position in one write transaction
+        conn.execute("BEGIN IMMEDIATE")
+
         # Find the open position
         cursor = conn.execute(
             """
@@ -618,7 +823,7 @@ def exit_trade(ticker, price, reason, notes):
         # Calculate returns
         entry_price = trade['entry_price']
         shares = trade['shares']
-        entry_date = datetime.strptime(trade['entry_date'], "%Y-%m-%d").date()
+        entry_date = date.fromisoformat(trade['entry_date'])
 
         return_pct = ((price - entry_price) / entry_price) * 100
         return_dollars = (price - entry_price) * shares
@@ -641,6 +846,7 @@ def exit_trade(ticker, price, reason, notes):
             (today.isoformat(), price, reason, return_pct, return_dollars,
              days_held, all_notes, trade['id'])
         )
+        classify_closed_trades(conn, trade['id'])
 
     # Show confirmation
     result_icon = "✅" if return_pct > 0 else "❌"
@@ -654,8 +860,11 @@ def exit_trade(ticker, price, reason, notes):
 
 
 @cli.command()
-def positions():
+@click.pass_obj
+def positions(obj):
     """Show open paper trading positions with live prices."""
+    from collectors.market import get_current_prices
+    out = Out()
     with get_db() as conn:
         cursor = conn.execute(
             """
@@ -671,31 +880,33 @@ def positions():
         open_trades = cursor.fetchall()
 
     if not open_trades:
-        click.echo("No open positions.")
-        click.echo()
-        click.echo("Use 'python3 daily_run.py enter TICKER PRICE' to log a paper trade.")
+        out("No open positions.")
+        out()
+        out("Use 'python3 daily_run.py enter TICKER PRICE' to log a paper trade.")
+        out.flush()
         return
 
-    click.echo()
-    click.echo(f"Open Positions ({len(open_trades)})")
-    click.echo("─" * 60)
+    out()
+    out(f"Open Positions ({len(open_trades)})")
+    out("─" * 60)
 
     total_unrealized = 0
     total_invested = 0
-    today = date.today()
+    today = obj["today"]
+    stop_mult = 1 - config.DEFAULT_STOP_PCT
+    target_mult = 1 + config.DEFAULT_TARGET_PCT
+
+    # Fetch all live prices up front (one batched download)
+    prices = get_current_prices([trade['ticker'] for trade in open_trades])
 
     for trade in open_trades:
-        ticker = trade['ticker']
-        entry_price = trade['entry_price']
-        shares = trade['shares']
-        entry_date = datetime.strptime(trade['entry_date'], "%Y-%m-%d").date()
+        ticker, entry_price, shares = trade['ticker'], trade['entry_price'], trade['shares']
+        entry_date_str, notes = trade['entry_date'], trade['notes']
+        stop, target = trade['stop_price'], trade['target_price']
+        entry_date = date.fromisoformat(entry_date_str)
         days_held = (today - entry_date).days
 
-        # Get current price
-        try:
-            current_price = get_current_price(ticker)
-        except Exception:
-            current_price = None
+        current_price = prices.get(ticker)
 
         if current_price:
             change_pct = ((current_price - entry_price) / entry_price) * 100
@@ -711,256 +922,289 @@ def positions():
         total_invested += entry_price * shares
 
         # Stop and target stored directly on trade
-        stop = trade['stop_price'] if trade['stop_price'] else entry_price * (1 - config.DEFAULT_STOP_PCT)
-        target = trade['target_price'] if trade['target_price'] else entry_price * (1 + config.DEFAULT_TARGET_PCT)
+        if not stop:
+            stop = entry_price * stop_mult
+        if not target:
+            target = entry_price * target_mult
 
-        click.echo(f"{ticker:<6} Entry: ${entry_price:.2f}  Now: {price_str}  {change_str}  ({days_held}d)")
-        click.echo(f"       Stop: ${stop:.2f}   Target: ${target:.2f}   Shares: {shares}")
-        if trade['notes']:
-            click.echo(f"       Notes: {trade['notes']}")
-        click.echo()
+        out(f"{ticker:<6} Entry: ${entry_price:.2f}  Now: {price_str}  {change_str}  ({days_held}d)")
+        out(f"       Stop: ${stop:.2f}   Target: ${target:.2f}   Shares: {shares}")
+        if notes:
+            out(f"       Notes: {notes}")
+        out()
 
-    click.echo("─" * 60)
+    out("─" * 60)
     if total_unrealized >= 0:
-        click.echo(f"Total unrealized: +${total_unrealized:.2f}")
+        out(f"Total unrealized: +${total_unrealized:.2f}")
     else:
-        click.echo(f"Total unrealized: -${abs(total_unrealized):.2f}")
-    click.echo(f"Total invested: ${total_invested:.2f}")
+        out(f"Total unrealized: -${abs(total_unrealized):.2f}")
+    out(f"Total invested: ${total_invested:.2f}")
+    out.flush()
 
 
 @cli.command()
 @click.option("--days", "-d", default=30, help="Days of history to show")
-def history(days):
+@click.pass_obj
+def history(obj, days):
     """Show closed paper trade history with stats."""
-    cutoff_date = (date.today() - timedelta(days=days)).isoformat()
+    out = Out()
+    cutoff_date = (obj["today"] - timedelta(days=days)).isoformat()
 
     with get_db() as conn:
         cursor = conn.execute(
             """
-            SELECT ticker, entry_date, entry_price, exit_date, exit_price,
-                   exit_reason, return_pct, return_dollars, days_held, shares
+            SELECT ticker, entry_price, exit_price, exit_reason,
+                   COALESCE(return_pct, 0), COALESCE(return_dollars, 0), days_held
             FROM trades
             WHERE status = 'CLOSED' AND exit_date >= ?
             ORDER BY exit_date DESC
             """,
             (cutoff_date,)
         )
+        # Plain tuples: the display loop unpacks by position
+        cursor.row_factory = None
         closed_trades = cursor.fetchall()
 
+        # Summary stats over the same trades, computed by SQLite
+        total_trades, wins, avg_win, avg_loss, total_return_dollars = conn.execute(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(pct > 0), 0),
+                   COALESCE(AVG(CASE WHEN pct > 0 THEN pct END), 0),
+                   COALESCE(AVG(CASE WHEN pct <= 0 THEN pct END), 0),
+                   COALESCE(SUM(return_dollars), 0)
+            FROM (
+                SELECT COALESCE(return_pct, 0) AS pct, return_dollars
+                FROM trades
+                WHERE status = 'CLOSED' AND exit_date >= ?
+            )
+            """,
+            (cutoff_date,)
+        ).fetchone()
+
     if not closed_trades:
-        click.echo(f"No closed trades in the last {days} days.")
+        out(f"No closed trades in the last {days} days.")
+        out.flush()
         return
 
-    click.echo()
-    click.echo(f"Closed Trades (last {days} days)")
-    click.echo("─" * 70)
-
-    wins = 0
-    losses = 0
-    total_return_dollars = 0
-    total_return_pct = 0
-    win_returns = []
-    loss_returns = []
-
-    for trade in closed_trades:
-        pct = trade['return_pct'] or 0
-        dollars = trade['return_dollars'] or 0
-        total_return_dollars += dollars
-        total_return_pct += pct
-
-        if pct > 0:
-            wins += 1
-            win_returns.append(pct)
-        else:
-            losses += 1
-            loss_returns.append(pct)
-
-        result = "✅" if pct > 0 else "❌"
-        click.echo(
-            f"{result} {trade['ticker']:<6} "
-            f"${trade['entry_price']:.2f} → ${trade['exit_price']:.2f}  "
-            f"{pct:+.1f}% (${dollars:+.2f})  {trade['days_held']}d  {trade['exit_reason']}"
+    out()
+    out(f"Closed Trades (last {days} days)")
+    out("─" * 70)
+
+    row = HISTORY_ROW_FORMAT.format
+    out("\n".join(
+        row(
+            result="✅" if pct > 0 else "❌", ticker=ticker,
+            entry_price=entry_price, exit_price=exit_price, return_pct=pct,
+            return_dollars=dollars, days_held=days_held, exit_reason=exit_reason,
         )
+        for ticker, entry_price, exit_price, exit_reason, pct, dollars, days_held in closed_trades
+    ))
 
     # Stats summary
-    total_trades = len(closed_trades)
+    losses = total_trades - wins
     win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
-    avg_win = sum(win_returns) / len(win_returns) if win_returns else 0
-    avg_loss = sum(loss_returns) / len(loss_returns) if loss_returns else 0
 
     # Expectancy = (Win% * Avg Win) + (Loss% * Avg Loss)
     expectancy = (win_rate/100 * avg_win) + ((100-win_rate)/100 * avg_loss)
 
-    click.echo()
-    click.echo("─" * 70)
-    click.echo("SUMMARY")
-    click.echo("─" * 70)
-    click.echo(f"  Total trades: {total_trades}")
-    click.echo(f"  Winners: {wins} ({win_rate:.0f}%)")
-    click.echo(f"  Losers: {losses}")
-    click.echo(f"  Avg win: {avg_win:+.1f}%")
-    click.echo(f"  Avg loss: {avg_loss:+.1f}%")
-    click.echo(f"  Expectancy: {expectancy:+.2f}%")
-    click.echo()
-    click.echo(f"  Total return: ${total_return_dollars:+.2f}")
-    click.echo(f"  Portfolio impact: {total_return_dollars/config.PAPER_PORTFOLIO_SIZE*100:+.2f}%")
+    out()
+    out("─" * 70)
+    out("SUMMARY")
+    out("─" * 70)
+    out(f"  Total trades: {total_trades}")
+    out(f"  Winners: {wins} ({win_rate:.0f}%)")
+    out(f"  Losers: {losses}")
+    out(f"  Avg win: {avg_win:+.1f}%")
+    out(f"  Avg loss: {avg_loss:+.1f}%")
+    out(f"  Expectancy: {expectancy:+.2f}%")
+    out()
+    out(f"  Total return: ${total_return_dollars:+.2f}")
+    out(f"  Portfolio impact: {total_return_dollars/config.PAPER_PORTFOLIO_SIZE*100:+.2f}%")
+    # Long look-backs produce more rows than fit on a screen
+    out.flush(pager=len(closed_trades) > PAGER_MIN_ROWS)
+
+
+SCORE_BUCKETS = [
+    ("high", "High (50+)"),
+    ("medium", "Medium (35-49)"),
+    ("low", "Low (<35)"),
+    ("none", "No signal"),
+]
+INSIDER_TYPES = [("ceo_cfo", "CEO/CFO buying"), ("other", "Other insider")]
+
+
+def _summarize_closed_trades(summary_rows) -> dict:
+    """
+    Turn get_closed_trade_summary() rollup rows into report stats.
+
+    Returns:
+        Dict with total, wins, losses, win_rate, avg_win, avg_loss,
+        expectancy, total_return, by_score and by_insider (each mapping
+        bucket -> (trades, wins, avg_pct))
+    """
+    total = wins = 0
+    win_sum = loss_sum = total_return = 0.0
+    by_dimension = {"score": {}, "insider": {}}
+
+    for row in summary_rows:
+        n, w = row['trades'], row['wins']
+        if row['dimension'] == 'total':
+            total, wins = n, w
+            win_sum, loss_sum = row['win_return_sum'], row['loss_return_sum']
+            total_return = row['return_dollars']
+        else:
+            by_dimension[row['dimension']][row['bucket']] = (n, w, row['return_sum'] / n)
+
+    losses = total - wins
+    avg_win = win_sum / wins if wins else 0
+    avg_loss = loss_sum / losses if losses else 0
+    win_rate = wins / total * 100 if total else 0
+    expectancy = (win_rate/100 * avg_win) + ((100-win_rate)/100 * avg_loss)
+
+    return {
+        "total": total,
+        "wins": wins,
+        "losses": losses,
+        "win_rate": win_rate,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "expectancy": expectancy,
+        "total_return": total_return,
+        "by_score": by_dimension["score"],
+        "by_insider": by_dimension["insider"],
+    }
 
 
 @cli.command()
-def performance():
+@click.pass_obj
+def performance(obj):
     """Show comprehensive paper trading performance report."""
-    today = date.today()
+    from collectors.market import get_current_prices
+    out = Out()
+    today = obj["today"]
 
     with get_db() as conn:
-        # Get all trades
         cursor = conn.execute(
             """
-            SELECT t.*, s.total_score, s.insider_score, s.options_score, s.social_score,
-                   s.insider_details
-            FROM trades t
-            LEFT JOIN signals s ON t.signal_id = s.id
-            ORDER BY t.entry_date
+            SELECT ticker, entry_date, entry_price, shares
+            FROM trades
+            WHERE status = 'OPEN'
+            ORDER BY entry_date
             """
         )
-        all_trades = cursor.fetchall()
-
-    if not all_trades:
-        click.echo()
-        click.echo("Paper Trading Performance")
-        click.echo("═" * 60)
-        click.echo()
-        click.echo("No trades yet.")
-        click.echo()
-        click.echo("To start paper trading:")
-        click.echo("  1. Run 'python3 daily_run.py evening' to generate signals")
-        click.echo("  2. Run 'python3 daily_run.py top' to see today's signals")
-        click.echo("  3. Run 'python3 daily_run.py enter TICKER PRICE' to log a trade")
-        click.echo()
+        open_trades = cursor.fetchall()
+        first_entry, closed_count = conn.execute(
+            "SELECT MIN(entry_date), COALESCE(SUM(status = 'CLOSED'), 0) FROM trades"
+        ).fetchone()
+
+    # Only run the aggregate query when there is something to aggregate
+    stats = _summarize_closed_trades(get_closed_trade_summary() if closed_count else [])
+
+    if not first_entry:
+        out()
+        out("Paper Trading Performance")
+        out("═" * 60)
+        out()
+        out("No trades yet.")
+        out()
+        out("To start paper trading:")
+        out("  1. Run 'python3 daily_run.py evening' to generate signals")
+        out("  2. Run 'python3 daily_run.py top' to see today's signals")
+        out("  3. Run 'python3 daily_run.py enter TICKER PRICE' to log a trade")
+        out()
+        out.flush()
         return
 
-    open_trades = [t for t in all_trades if t['status'] == 'OPEN']
-    closed_trades = [t for t in all_trades if t['status'] == 'CLOSED']
-
     # Find date range
-    first_trade = datetime.strptime(all_trades[0]['entry_date'], "%Y-%m-%d").date()
+    first_trade = date.fromisoformat(first_entry)
     days_trading = (today - first_trade).days + 1
 
-    click.echo()
-    click.echo("Paper Trading Performance")
-    click.echo("═" * 60)
-    click.echo(f"Period: {first_trade.strftime('%b %d')} - {today.strftime('%b %d, %Y')} ({days_trading} days)")
-    click.echo()
+    out()
+    out("Paper Trading Performance")
+    out("═" * 60)
+    out(f"Period: {first_trade.strftime('%b %d')} - {today.strftime('%b %d, %Y')} ({days_trading} days)")
+    out()
+
+    win_rate = stats["win_rate"]
+    expectancy = stats["expectancy"]
 
     # Closed trades stats
-    if closed_trades:
-        wins = [t for t in closed_trades if (t['return_pct'] or 0) > 0]
-        losses = [t for t in closed_trades if (t['return_pct'] or 0) <= 0]
-        total_return = sum(t['return_dollars'] or 0 for t in closed_trades)
-        win_rate = len(wins) / len(closed_trades) * 100
-
-        avg_win = sum(t['return_pct'] for t in wins) / len(wins) if wins else 0
-        avg_loss = sum(t['return_pct'] for t in losses) / len(losses) if losses else 0
-        expectancy = (win_rate/100 * avg_win) + ((100-win_rate)/100 * avg_loss)
-
-        click.echo("CLOSED TRADES")
-        click.echo("─" * 40)
-        click.echo(f"  Total: {len(closed_trades)}")
-        click.echo(f"  Winners: {len(wins)} ({win_rate:.0f}%)")
-        click.echo(f"  Losers: {len(losses)}")
-        click.echo(f"  Avg win: {avg_win:+.1f}%")
-        click.echo(f"  Avg loss: {avg_loss:+.1f}%")
-        click.echo(f"  Expectancy: {expectancy:+.2f}% per trade")
-        click.echo(f"  Total return: ${total_return:+.2f} ({total_return/config.PAPER_PORTFOLIO_SIZE*100:+.2f}% of portfolio)")
-        click.echo()
+    if stats["total"]:
+        total_return = stats["total_return"]
+
+        out("CLOSED TRADES")
+        out("─" * 40)
+        out(f"  Total: {stats['total']}")
+        out(f"  Winners: {stats['wins']} ({win_rate:.0f}%)")
+        out(f"  Losers: {stats['losses']}")
+        out(f"  Avg win: {stats['avg_win']:+.1f}%")
+        out(f"  Avg loss: {stats['avg_loss']:+.1f}%")
+        out(f"  Expectancy: {expectancy:+.2f}% per trade")
+        out(f"  Total return: ${total_return:+.2f} ({total_return/config.PAPER_PORTFOLIO_SIZE*100:+.2f}% of portfolio)")
+        out()
 
         # Breakdown by score
-        click.echo("BY SIGNAL SCORE")
-        click.echo("─" * 40)
-        high_score = [t for t in closed_trades if t['total_score'] and t['total_score'] >= 50]
-        med_score = [t for t in closed_trades if t['total_score'] and 35 <= t['total_score'] < 50]
-        low_score = [t for t in closed_trades if t['total_score'] and t['total_score'] < 35]
-        no_signal = [t for t in closed_trades if not t['total_score']]
-
-        for label, trades in [("High (50+)", high_score), ("Medium (35-49)", med_score),
-                               ("Low (<35)", low_score), ("No signal", no_signal)]:
-            if trades:
-                w = len([t for t in trades if (t['return_pct'] or 0) > 0])
-                avg = sum(t['return_pct'] or 0 for t in trades) / len(trades)
-                click.echo(f"  {label}: {len(trades)} trades, {w}/{len(trades)} wins, {avg:+.1f}% avg")
-
-        click.echo()
-
-        # Breakdown by insider type (parse insider_details JSON)
-        import json
-        ceo_cfo_trades = []
-        other_insider_trades = []
-
-        for t in closed_trades:
-            if t['insider_details']:
-                try:
-                    details = json.loads(t['insider_details'])
-                    if details.get('ceo_cfo_buying'):
-                        ceo_cfo_trades.append(t)
-                    elif details.get('unique_buyers', 0) > 0:
-                        other_insider_trades.append(t)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-        if ceo_cfo_trades or other_insider_trades:
-            click.echo("BY INSIDER TYPE")
-            click.echo("─" * 40)
-            if ceo_cfo_trades:
-                w = len([t for t in ceo_cfo_trades if (t['return_pct'] or 0) > 0])
-                avg = sum(t['return_pct'] or 0 for t in ceo_cfo_trades) / len(ceo_cfo_trades)
-                click.echo(f"  CEO/CFO buying: {len(ceo_cfo_trades)} trades, {w}/{len(ceo_cfo_trades)} wins, {avg:+.1f}% avg")
-            if other_insider_trades:
-                w = len([t for t in other_insider_trades if (t['return_pct'] or 0) > 0])
-                avg = sum(t['return_pct'] or 0 for t in other_insider_trades) / len(other_insider_trades)
-                click.echo(f"  Other insider: {len(other_insider_trades)} trades, {w}/{len(other_insider_trades)} wins, {avg:+.1f}% avg")
-            click.echo()
+        out("BY SIGNAL SCORE")
+        out("─" * 40)
+        for bucket, label in SCORE_BUCKETS:
+            if bucket in stats["by_score"]:
+                n, w, avg = stats["by_score"][bucket]
+                out(f"  {label}: {n} trades, {w}/{n} wins, {avg:+.1f}% avg")
+
+        out()
+
+        # Breakdown by insider type
+        if stats["by_insider"]:
+            out("BY INSIDER TYPE")
+            out("─" * 40)
+            for insider_type, label in INSIDER_TYPES:
+                if insider_type in stats["by_insider"]:
+                    n, w, avg = stats["by_insider"][insider_type]
+                    out(f"  {label}: {n} trades, {w}/{n} wins, {avg:+.1f}% avg")
+            out()
 
     else:
-        click.echo("CLOSED TRADES")
-        click.echo("─" * 40)
-        click.echo("  None yet")
-        click.echo()
+        out("CLOSED TRADES")
+        out("─" * 40)
+        out("  None yet")
+        out()
 
     # Open positions
-    click.echo("OPEN POSITIONS")
-    click.echo("─" * 40)
+    out("OPEN POSITIONS")
+    out("─" * 40)
     if open_trades:
         total_unrealized = 0
+        quotes = get_current_prices([t['ticker'] for t in open_trades])
         for t in open_trades:
-            try:
-                current = get_current_price(t['ticker'])
+            current = quotes.get(t['ticker'])
+            if current:
                 pnl = (current - t['entry_price']) * t['shares']
                 total_unrealized += pnl
                 pct = ((current - t['entry_price']) / t['entry_price']) * 100
-                click.echo(f"  {t['ticker']}: ${t['entry_price']:.2f} → ${current:.2f} ({pct:+.1f}%)")
-            except Exception:
-                click.echo(f"  {t['ticker']}: ${t['entry_price']:.2f} → N/A")
-        click.echo(f"  Total unrealized: ${total_unrealized:+.2f}")
+                out(f"  {t['ticker']}: ${t['entry_price']:.2f} → ${current:.2f} ({pct:+.1f}%)")
+            else:
+                out(f"  {t['ticker']}: ${t['entry_price']:.2f} → N/A")
+        out(f"  Total unrealized: ${total_unrealized:+.2f}")
     else:
-        click.echo("  None")
-    click.echo()
+        out("  None")
+    out()
 
     # Status assessment
-    click.echo("─" * 60)
-    total_closed = len(closed_trades)
+    out("─" * 60)
+    total_closed = stats["total"]
     if total_closed < 10:
-        click.echo(f"Status: Too early to judge (need 10+ trades, have {total_closed})")
+        out(f"Status: Too early to judge (need 10+ trades, have {total_closed})")
     elif total_closed < 20:
-        click.echo(f"Status: Early results ({total_closed} trades) - continue monitoring")
+        out(f"Status: Early results ({total_closed} trades) - continue monitoring")
+    elif win_rate >= 55 and expectancy > 0:
+        out(f"Status: System appears profitable ({win_rate:.0f}% win rate, {expectancy:+.2f}% expectancy)")
+    elif expectancy > 0:
+        out(f"Status: Profitable but watch win rate ({win_rate:.0f}%)")
     else:
-        if closed_trades:
-            win_rate = len([t for t in closed_trades if (t['return_pct'] or 0) > 0]) / len(closed_trades) * 100
-            if win_rate >= 55 and expectancy > 0:
-                click.echo(f"Status: System appears profitable ({win_rate:.0f}% win rate, {expectancy:+.2f}% expectancy)")
-            elif expectancy > 0:
-                click.echo(f"Status: Profitable but watch win rate ({win_rate:.0f}%)")
-            else:
-                click.echo(f"Status: Review strategy - negative expectancy ({expectancy:+.2f}%)")
-    click.echo("═" * 60)
+        out(f"Status: Review strategy - negative expectancy ({expectancy:+.2f}%)")
+    out("═" * 60)
+    out.flush()
 
 
 # Insider-specific commands
@@ -968,6 +1212,7 @@ def performance():
 @click.option("--count", "-c", default=100, help="Number of filings to fetch")
 def insider_collect(count):
     """Fetch latest insider trading data from SEC EDGAR."""
+    from collectors.insider import collect_insider_data
     click.echo(f"Collecting insider data ({count} filings)...")
     click.echo()
 
@@ -988,6 +1233,9 @@ def insider_collect(count):
 @click.option("--limit", "-l", default=10, help="Number of stocks to show")
 def insider_top(min_score, limit):
     """Show stocks with highest insider buying scores."""
+    from signals.insider_signal import (
+        get_top_insider_stocks, format_signal_report as format_insider_report,
+    )
     signals = get_top_insider_stocks(min_score=min_score, limit=limit)
 
     if not signals:
@@ -1007,6 +1255,7 @@ def insider_top(min_score, limit):
 @click.argument("ticker")
 def insider_score_cmd(ticker):
     """Show insider buying score for a specific ticker."""
+    from signals.insider_signal import score_insider, format_signal_report as format_insider_report
     signal = score_insider(ticker.upper())
     click.echo()
     click.echo(format_insider_report(signal))
@@ -1018,24 +1267,28 @@ def insider_score_cmd(ticker):
 @click.option("--limit", "-l", default=20, help="Number of purchases to show")
 def insider_recent(days, min_value, limit):
     """Show recent insider purchases."""
+    from collectors.insider import get_recent_purchases
+    out = Out()
     purchases = get_recent_purchases(days=days, min_value=min_value)[:limit]
 
     if not purchases:
-        click.echo(f"No insider purchases found in last {days} days with value >= ${min_value:,}")
-        click.echo("Run: python3 daily_run.py insider-collect")
+        out(f"No insider purchases found in last {days} days with value >= ${min_value:,}")
+        out("Run: python3 daily_run.py insider-collect")
+        out.flush()
         return
 
-    click.echo(f"Recent insider purchases (last {days} days, >= ${min_value:,}):")
-    click.echo("-" * 80)
-    click.echo(f"{'Ticker':<6} {'Date':<12} {'Insider':<25} {'Title':<15} {'Value':>12}")
-    click.echo("-" * 80)
+    out(f"Recent insider purchases (last {days} days, >= ${min_value:,}):")
+    out("-" * 80)
+    out(f"{'Ticker':<6} {'Date':<12} {'Insider':<25} {'Title':<15} {'Value':>12}")
+    out("-" * 80)
 
-    for p in purchases:
-        insider = p['insider_name'][:24] if p['insider_name'] else ""
-        title = (p['insider_title'] or "")[:14]
-        click.echo(
-            f"{p['ticker']:<6} {p['trade_date']:<12} {insider:<25} {title:<15} ${p['total_value']:>10,.0f}"
-        )
+    rows = [
+        f"{p['ticker']:<6} {p['trade_date']:<12} {(p['insider_name'] or '')[:24]:<25} "
+        f"{(p['insider_title'] or '')[:14]:<15} ${p['total_value']:>10,.0f}"
+        for p in purchases
+    ]
+    out("\n".join(rows))
+    out.flush()
 
 
 # Options-specific commands
@@ -1043,6 +1296,7 @@ def insider_recent(days, min_value, limit):
 @click.option("--tickers", "-t", default=None, help="Comma-separated tickers (default: watchlist)")
 def options_collect(tickers):
     """Collect options data for watchlist or specific tickers."""
+    from collectors.options import collect_options_data, get_default_watchlist
     if tickers:
         ticker_list = [t.strip().upper() for t in tickers.split(",")]
     else:
@@ -1067,6 +1321,9 @@ def options_collect(tickers):
 @click.option("--limit", "-l", default=10, help="Number of stocks to show")
 def options_top(min_score, limit):
     """Show stocks with highest options activity scores."""
+    from signals.options_signal import (
+        get_top_options_stocks, format_signal_report as format_options_report,
+    )
     signals = get_top_options_stocks(min_score=min_score, limit=limit)
 
     if not signals:
@@ -1086,6 +1343,7 @@ def options_top(min_score, limit):
 @click.argument("ticker")
 def options_score_cmd(ticker):
     """Show options activity score for a specific ticker."""
+    from signals.options_signal import score_options, format_signal_report as format_options_report
     signal = score_options(ticker.upper())
     click.echo()
     click.echo(format_options_report(signal))
@@ -1096,23 +1354,28 @@ def options_score_cmd(ticker):
 @click.option("--limit", "-l", default=20, help="Number of stocks to show")
 def options_unusual(min_ratio, limit):
     """Show stocks with unusual options activity today."""
+    from collectors.options import get_unusual_options
+    out = Out()
     unusual = get_unusual_options(min_call_ratio=min_ratio, limit=limit)
 
     if not unusual:
-        click.echo("No unusual options activity found today.")
-        click.echo("Run: python3 daily_run.py options-collect")
+        out("No unusual options activity found today.")
+        out("Run: python3 daily_run.py options-collect")
+        out.flush()
         return
 
-    click.echo(f"Unusual options activity (call volume >= {min_ratio}x average):")
-    click.echo("-" * 70)
-    click.echo(f"{'Ticker':<8} {'Call Vol':>12} {'Put Vol':>12} {'Ratio':>8} {'P/C':>8}")
-    click.echo("-" * 70)
+    out(f"Unusual options activity (call volume >= {min_ratio}x average):")
+    out("-" * 70)
+    out(f"{'Ticker':<8} {'Call Vol':>12} {'Put Vol':>12} {'Ratio':>8} {'P/C':>8}")
+    out("-" * 70)
 
-    for o in unusual:
-        click.echo(
-            f"{o['ticker']:<8} {o['call_volume']:>12,} {o['put_volume']:>12,} "
-            f"{o['call_volume_ratio']:>7.1f}x {o['put_call_ratio']:>7.2f}"
-        )
+    rows = [
+        f"{o['ticker']:<8} {o['call_volume']:>12,} {o['put_volume']:>12,} "
+        f"{o['call_volume_ratio']:>7.1f}x {o['put_call_ratio']:>7.2f}"
+        for o in unusual
+    ]
+    out("\n".join(rows))
+    out.flush()
 
 
 # Social-specific commands
@@ -1122,6 +1385,7 @@ def options_unusual(min_ratio, limit):
               help="Data source: adanos (Reddit via API), stocktwits, or all (default)")
 def social_collect(tickers, source):
     """Collect social media data from Adanos API and Stocktwits."""
+    from collectors.social import collect_social_data
     if tickers:
         ticker_list = [t.strip().upper() for t in tickers.split(",")]
     else:
@@ -1148,6 +1412,9 @@ def social_collect(tickers, source):
 @click.option("--limit", "-l", default=10, help="Number of stocks to show")
 def social_top(min_score, limit):
     """Show stocks with highest social activity scores."""
+    from signals.social_signal import (
+        get_top_social_stocks, format_signal_report as format_social_report,
+    )
     signals = get_top_social_stocks(min_score=min_score, limit=limit)
 
     if not signals:
@@ -1167,6 +1434,7 @@ def social_top(min_score, limit):
 @click.argument("ticker")
 def social_score_cmd(ticker):
     """Show social activity score for a specific ticker."""
+    from signals.social_signal import score_social, format_signal_report as format_social_report
     signal = score_social(ticker.upper())
     click.echo()
     click.echo(format_social_report(signal))
@@ -1177,24 +1445,29 @@ def social_score_cmd(ticker):
 @click.option("--limit", "-l", default=20, help="Number of stocks to show")
 def social_trending(min_mentions, limit):
     """Show trending stocks on social media today."""
+    from collectors.social import get_trending_tickers
+    out = Out()
     trending = get_trending_tickers(min_mentions=min_mentions, limit=limit)
 
     if not trending:
-        click.echo("No trending stocks found today.")
-        click.echo("Run: python3 daily_run.py social-collect")
+        out("No trending stocks found today.")
+        out("Run: python3 daily_run.py social-collect")
+        out.flush()
         return
 
-    click.echo(f"Trending stocks (min {min_mentions} mentions):")
-    click.echo("-" * 75)
-    click.echo(f"{'Ticker':<8} {'Adanos':>8} {'Stocktwits':>10} {'Velocity':>10} {'Sentiment':>10} {'Bullish':>8}")
-    click.echo("-" * 75)
+    out(f"Trending stocks (min {min_mentions} mentions):")
+    out("-" * 75)
+    out(f"{'Ticker':<8} {'Adanos':>8} {'Stocktwits':>10} {'Velocity':>10} {'Sentiment':>10} {'Bullish':>8}")
+    out("-" * 75)
 
-    for t in trending:
-        bullish_pct = t['bullish_ratio'] * 100 if t['bullish_ratio'] else 50
-        click.echo(
-            f"{t['ticker']:<8} {t['reddit_mentions']:>8} {t['stocktwits_mentions']:>10} "
-            f"{t['combined_velocity']:>9.0f}% {t['reddit_sentiment']:>10.2f} {bullish_pct:>7.0f}%"
-        )
+    rows = [
+        f"{t['ticker']:<8} {t['reddit_mentions']:>8} {t['stocktwits_mentions']:>10} "
+        f"{t['combined_velocity']:>9.0f}% {t['reddit_sentiment']:>10.2f} "
+        f"{(t['bullish_ratio'] * 100 if t['bullish_ratio'] else 50):>7.0f}%"
+        for t in trending
+    ]
+    out("\n".join(rows))
+    out.flush()
 
 
 # Validation commands
@@ -1202,7 +1475,6 @@ def social_trending(min_mentions, limit):
 def validate_cmd():
     """Run insider buying validation analysis."""
     from validate_insider import run_validation
-
     result = run_validation()
 
     click.echo()
@@ -1220,7 +1492,6 @@ def validate_cmd():
 def validate_backfill(months):
     """Backfill historical insider data for validation."""
     from validate_insider import run_validation_backfill
-
     click.echo(f"Backfilling {months} months of insider data...")
     click.echo("This may take a while (respecting SEC rate limits)...")
     click.echo()
@@ -1240,7 +1511,6 @@ def validate_backfill(months):
 def validate_calculate():
     """Calculate returns for insider buying events."""
     from validate_insider import run_validation_calculate
-
     click.echo("Calculating returns for insider events...")
     click.echo("This requires fetching historical price data...")
     click.echo()
@@ -1257,7 +1527,6 @@ def validate_calculate():
 def validate_report():
     """Show the latest validation report."""
     from validate_insider import load_validation_events, analyze_returns, format_validation_report
-
     events = load_validation_events(min_value=50000)
 
     if len(events) < 50:
@@ -1277,7 +1546,6 @@ def validate_report():
 @cli.command("v2-init")
 def v2_init():
     """Initialize V2 database tables and portfolio."""
-    from utils.db import init_db
     from utils.paper_trading import PaperTradingEngine
 
     click.echo("Initializing V2 system...")
@@ -1303,10 +1571,14 @@ def v2_init():
 @cli.command("v2-scan")
 @click.option("--limit", "-l", default=100, help="Max stocks to scan")
 @click.option("--save/--no-save", default=True, help="Save results to database")
-def v2_scan(limit, save):
+@click.option("--reuse", is_flag=True, help="Reuse results already saved today instead of rescanning")
+def v2_scan(limit, save, reuse):
     """Run V2 screening: Trend Template + RS Rating."""
+    from collectors.market import get_price_histories
     from collectors.universe import get_sp500_tickers
-    from signals.trend_template import check_trend_template, save_trend_template_result, format_template_report
+    from signals.trend_template import (
+        check_trend_template, save_trend_template_results, load_trend_template_results,
+    )
     from signals.relative_strength import calculate_rs_ratings_batch, update_rs_ratings_in_db
 
     click.echo("=" * 50)
@@ -1324,25 +1596,32 @@ def v2_scan(limit, save):
     passing = []
     failed = []
     errors = []
-
-    for i, ticker in enumerate(tickers):
-        if (i + 1) % 25 == 0:
-            click.echo(f"  Progress: {i + 1}/{len(tickers)}... ({len(passing)} passing)")
-
-        try:
-            result = check_trend_template(ticker)
-
-            if save:
-                save_trend_template_result(result)
-
-            if result.passes_template:
-                passing.append(result)
+    scanned = []
+
+    saved = load_trend_template_results(tickers) if reuse else {}
+    if saved:
+        click.echo(f"Reusing {len(saved)} results saved earlier today")
+    to_scan = [t for t in tickers if t not in saved]
+
+    histories = get_price_histories(to_scan)
+    scan = _scan_concurrently(
+        lambda t: check_trend_template(t, prices=histories.get(t)), to_scan
+    )
+    with click.progressbar(scan, length=len(to_scan), label="  Scanning") as bar:
+        for ticker, result, error in bar:
+            if error:
+                errors.append((ticker, str(error)[:50]))
             else:
-                failed.append(result)
+                scanned.append(result)
 
-        except Exception as e:
-            errors.append((ticker, str(e)[:50]))
-            continue
+    if save:
+        save_trend_template_results(scanned)
+
+    for result in [*saved.values(), *scanned]:
+        if result.passes_template:
+            passing.append(result)
+        else:
+            failed.append(result)
 
     click.echo()
     click.echo(f"Trend Template Results:")
@@ -1367,24 +1646,26 @@ def v2_scan(limit, save):
     for result in passing:
         result.rs_rating = rs_ratings.get(result.ticker, 0)
 
-    passing.sort(key=lambda x: x.rs_rating or 0, reverse=True)
+    passing = _rank_by_rs(passing, rs_ratings)
 
     # Display top candidates
-    click.echo()
-    click.echo("=" * 50)
-    click.echo("TOP CANDIDATES (Trend Template + RS)")
-    click.echo("=" * 50)
+    out = Out()
+    out()
+    out("=" * 50)
+    out("TOP CANDIDATES (Trend Template + RS)")
+    out("=" * 50)
 
     for i, result in enumerate(passing[:10], 1):
-        click.echo(
+        out(
             f"{i:2}. {result.ticker:<6} "
             f"RS: {result.rs_rating or 0:5.1f}  "
             f"Price: ${result.price:>8.2f}  "
             f"From High: {result.distance_from_high_pct:5.1f}%"
         )
 
-    click.echo()
-    click.echo(f"Full results saved to database. Run 'v2-watchlist' to manage.")
+    out()
+    out(f"Full results saved to database. Run 'v2-watchlist' to manage.")
+    out.flush()
 
 
 @cli.command("v2-portfolio")
@@ -1521,40 +1802,42 @@ def v2_check():
 
 
 @cli.command("v2-watchlist")
-@click.option("--date", "-d", default=None, help="Date (YYYY-MM-DD)")
-def v2_watchlist(date):
+@click.option("--date", "-d", "target_date", default=None, help="Date (YYYY-MM-DD)")
+def v2_watchlist(target_date):
     """Show stocks passing trend template (potential setups)."""
     from signals.trend_template import get_compliant_stocks
-    from datetime import date as dt
+    out = Out()
 
-    target_date = dt.fromisoformat(date) if date else dt.today()
+    target_date = date.fromisoformat(target_date) if target_date else date.today()
 
     stocks = get_compliant_stocks(target_date)
 
-    click.echo()
-    click.echo("=" * 60)
-    click.echo(f"V2 WATCHLIST - {target_date}")
-    click.echo("=" * 60)
-    click.echo()
+    out()
+    out("=" * 60)
+    out(f"V2 WATCHLIST - {target_date}")
+    out("=" * 60)
+    out()
 
     if not stocks:
-        click.echo("No stocks found. Run 'v2-scan' first.")
+        out("No stocks found. Run 'v2-scan' first.")
+        out.flush()
         return
 
-    click.echo(f"{'Ticker':<8} {'RS':>6} {'Price':>10} {'From High':>10} {'Criteria':>8}")
-    click.echo("-" * 60)
+    out(f"{'Ticker':<8} {'RS':>6} {'Price':>10} {'From High':>10} {'Criteria':>8}")
+    out("-" * 60)
 
     for stock in stocks[:20]:
-        click.echo(
+        out(
             f"{stock['ticker']:<8} "
             f"{stock['rs_rating'] or 0:>6.1f} "
             f"${stock['price']:>9.2f} "
-            f"{((stock['high_52w'] - stock['price']) / stock['high_52w'] * 100):>9.1f}% "
+            f"{stock['distance_from_high_pct']:>9.1f}% "
             f"{stock['criteria_passed']:>8}/8"
         )
 
     if len(stocks) > 20:
-        click.echo(f"\n... and {len(stocks) - 20} more")
+        out(f"\n... and {len(stocks) - 20} more")
+    out.flush()
 
 
 @cli.command("v2-explain")
@@ -1578,25 +1861,27 @@ def v2_explain(ticker):
 def v2_history(limit):
     """Show V2 paper trade history."""
     from utils.paper_trading import PaperTradingEngine
+    out = Out()
 
     engine = PaperTradingEngine()
     trades = engine.get_trade_history(days=limit)
 
-    click.echo()
-    click.echo("=" * 70)
-    click.echo("V2 TRADE HISTORY")
-    click.echo("=" * 70)
-    click.echo()
+    out()
+    out("=" * 70)
+    out("V2 TRADE HISTORY")
+    out("=" * 70)
+    out()
 
     if not trades:
-        click.echo("No closed trades yet.")
+        out("No closed trades yet.")
+        out.flush()
         return
 
-    click.echo(f"{'Date':<12} {'Ticker':<8} {'Entry':>8} {'Exit':>8} {'Return':>10} {'Days':>5} {'Reason':<8}")
-    click.echo("-" * 70)
+    out(f"{'Date':<12} {'Ticker':<8} {'Entry':>8} {'Exit':>8} {'Return':>10} {'Days':>5} {'Reason':<8}")
+    out("-" * 70)
 
     for t in trades:
-        click.echo(
+        out(
             f"{t['exit_date']:<12} "
             f"{t['ticker']:<8} "
             f"${t['entry_price']:>7.2f} "
@@ -1605,15 +1890,15 @@ def v2_history(limit):
             f"{t['days_held']:>5} "
             f"{t['exit_reason']:<8}"
         )
+    out.flush()
 
 
 @cli.command("v2-vcp")
 @click.option("--limit", "-l", default=50, help="Max stocks to scan")
 def v2_vcp(limit):
     """Scan for VCP patterns in trend template stocks."""
-    from signals.trend_template import get_compliant_stocks
-    from signals.vcp_detector import detect_vcp, format_vcp_report
-    from datetime import date
+    from signals.trend_template import get_watchlist_tickers
+    from signals.vcp_detector import detect_vcp
 
     click.echo("=" * 50)
     click.echo("V2 VCP PATTERN SCAN")
@@ -1621,60 +1906,62 @@ def v2_vcp(limit):
     click.echo()
 
     # Get stocks passing trend template
-    stocks = get_compliant_stocks(date.today())
+    tickers = get_watchlist_tickers(limit)
 
-    if not stocks:
+    if not tickers:
         click.echo("No stocks passing trend template. Run 'v2-scan' first.")
         return
 
-    tickers = [s['ticker'] for s in stocks[:limit]]
     click.echo(f"Scanning {len(tickers)} trend template stocks for VCP...")
     click.echo()
 
     valid_patterns = []
-    for i, ticker in enumerate(tickers):
-        if (i + 1) % 10 == 0:
-            click.echo(f"  Progress: {i + 1}/{len(tickers)}...")
-
-        pattern = detect_vcp(ticker)
-        if pattern.pattern_score >= 40:  # Show decent patterns
-            valid_patterns.append(pattern)
-
-    click.echo()
-    click.echo("=" * 50)
-    click.echo(f"VCP PATTERNS FOUND: {len(valid_patterns)}")
-    click.echo("=" * 50)
+    scan = _scan_concurrently(detect_vcp, tickers)
+    with click.progressbar(scan, length=len(tickers), label="  Scanning") as bar:
+        for ticker, pattern, error in bar:
+            if error:
+                raise error
+            if pattern.pattern_score >= 40:  # Show decent patterns
+                valid_patterns.append(pattern)
+
+    out = Out()
+    out()
+    out("=" * 50)
+    out(f"VCP PATTERNS FOUND: {len(valid_patterns)}")
+    out("=" * 50)
 
     if not valid_patterns:
-        click.echo("No valid VCP patterns found.")
+        out("No valid VCP patterns found.")
+        out.flush()
         return
 
     # Sort by score
     valid_patterns.sort(key=lambda x: x.pattern_score, reverse=True)
 
-    click.echo()
-    click.echo(f"{'Ticker':<8} {'Score':>6} {'Pivot':>10} {'Contractions':<20} {'Vol Ratio':>10}")
-    click.echo("-" * 60)
+    out()
+    out(f"{'Ticker':<8} {'Score':>6} {'Pivot':>10} {'Contractions':<20} {'Vol Ratio':>10}")
+    out("-" * 60)
 
     for p in valid_patterns[:15]:
         contractions_str = ", ".join(f"{c:.0f}%" for c in p.contractions[:3])
-        click.echo(
+        out(
             f"{p.ticker:<8} "
             f"{p.pattern_score:>6} "
             f"${p.pivot_price:>9.2f} "
             f"{contractions_str:<20} "
             f"{p.volume_ratio:>9.2f}x"
         )
+    out.flush()
 
 
 @cli.command("v2-breakout")
 @click.option("--threshold", "-t", default=3.0, help="Max % from pivot")
 def v2_breakout(threshold):
     """Check for breakouts on watchlist stocks."""
+    from collectors.market import get_price_histories
     from signals.trend_template import get_compliant_stocks
     from signals.vcp_detector import detect_vcp
     from signals.breakout import check_breakout, format_breakout_report
-    from datetime import date
 
     click.echo("=" * 50)
     click.echo("V2 BREAKOUT CHECK")
@@ -1694,17 +1981,22 @@ def v2_breakout(threshold):
     breakouts = []
     near_pivot = []
 
-    for i, stock in enumerate(stocks[:50]):
+    # One download covers both the VCP base and the breakout volume check
+    stocks = stocks[:50]
+    histories = get_price_histories([s['ticker'] for s in stocks], period="6mo")
+
+    for stock in stocks:
         ticker = stock['ticker']
+        prices = histories.get(ticker)
 
         # Get pivot from VCP or use 52-week high
-        vcp = detect_vcp(ticker)
+        vcp = detect_vcp(ticker, prices=prices)
         pivot = vcp.pivot_price if vcp.pivot_price > 0 else stock.get('high_52w', 0)
 
         if pivot <= 0:
             continue
 
-        signal = check_breakout(ticker, pivot)
+        signal = check_breakout(ticker, pivot, prices=prices)
 
         if signal.is_breakout:
             breakouts.append(signal)
@@ -1770,18 +2062,16 @@ def v2_alerts(limit):
 @click.option("--days", "-d", default=14, help="Days to look ahead")
 def v2_earnings(days):
     """Check earnings dates for watchlist stocks."""
-    from signals.trend_template import get_compliant_stocks
+    from signals.trend_template import get_watchlist_tickers
     from collectors.earnings import check_earnings_batch, format_earnings_report
-    from datetime import date
 
     # Get stocks passing trend template
-    stocks = get_compliant_stocks(date.today())
+    tickers = get_watchlist_tickers(30)
 
-    if not stocks:
+    if not tickers:
         click.echo("No stocks in watchlist. Run 'v2-scan' first.")
         return
 
-    tickers = [s['ticker'] for s in stocks[:30]]
 
     click.echo(f"Checking earnings for {len(tickers)} stocks...")
     click.echo()
@@ -1794,12 +2084,12 @@ def v2_earnings(days):
 @click.option("--email/--no-email", default=True, help="Send email alert")
 def v2_morning(email):
     """Run morning routine: update data, check for setups."""
+    from collectors.market import get_price_histories
     from collectors.universe import get_sp500_tickers
-    from signals.trend_template import check_trend_template, save_trend_template_result, get_compliant_stocks
+    from signals.trend_template import check_trend_template, save_trend_template_results
     from signals.relative_strength import calculate_rs_ratings_batch, update_rs_ratings_in_db
     from signals.vcp_detector import detect_vcp
     from output.alerts import send_alert, format_morning_scan_alert
-    from datetime import date
 
     click.echo("=" * 50)
     click.echo("V2 MORNING ROUTINE")
@@ -1815,16 +2105,20 @@ def v2_morning(email):
     # 2. Run trend template scan
     click.echo("2. Running trend template scan...")
     passing = []
-    for i, ticker in enumerate(tickers):
-        if (i + 1) % 50 == 0:
-            click.echo(f"   Progress: {i + 1}/{len(tickers)}...")
-        try:
-            result = check_trend_template(ticker)
-            save_trend_template_result(result)
+    scanned = []
+    histories = get_price_histories(tickers)
+    scan = _scan_concurrently(
+        lambda t: check_trend_template(t, prices=histories.get(t)), tickers
+    )
+    with click.progressbar(scan, length=len(tickers), label="   Scanning") as bar:
+        for ticker, result, error in bar:
+            if error:
+                continue
+            scanned.append(result)
             if result.passes_template:
                 passing.append(result)
-        except Exception:
-            continue
+
+    save_trend_template_results(scanned)
 
     click.echo(f"   {len(passing)} stocks passing trend template")
 
@@ -1838,7 +2132,7 @@ def v2_morning(email):
     click.echo("4. Checking for near-pivot setups...")
     breakout_candidates = []
     for result in passing[:30]:
-        vcp = detect_vcp(result.ticker)
+        vcp = detect_vcp(result.ticker, prices=histories.get(result.ticker))
         if vcp.pivot_price > 0:
             dist = (vcp.pivot_price - result.price) / result.price * 100
             if dist < 5 and dist > -2:  # Within 5% of pivot
@@ -1851,7 +2145,7 @@ def v2_morning(email):
     click.echo(f"   {len(breakout_candidates)} near-pivot setups")
 
     # 5. Prepare summary
-    top_stocks = sorted(passing, key=lambda x: rs_ratings.get(x.ticker, 0), reverse=True)[:10]
+    top_stocks = _rank_by_rs(passing, rs_ratings)[:10]
     top_list = [{'ticker': s.ticker, 'rs_rating': rs_ratings.get(s.ticker, 0), 'price': s.price} for s in top_stocks]
 
     # 6. Send alert
@@ -1875,7 +2169,6 @@ def v2_evening(email):
     """Run evening routine: check stops, take snapshot, send report."""
     from utils.paper_trading import PaperTradingEngine
     from output.alerts import send_alert, format_daily_report_alert
-    from datetime import date
 
     click.echo("=" * 50)
     click.echo("V2 EVENING ROUTINE")
@@ -2024,12 +2317,12 @@ def mr_check(ticker):
 @cli.command("mr-positions")
 def mr_positions():
     """Show open mean reversion positions."""
-    from utils.db import get_db
+    out = Out()
     
-    click.echo("=" * 50)
-    click.echo("MEAN REVERSION POSITIONS")
-    click.echo("=" * 50)
-    click.echo()
+    out("=" * 50)
+    out("MEAN REVERSION POSITIONS")
+    out("=" * 50)
+    out()
     
     with get_db() as conn:
         cursor = conn.execute("""
@@ -2040,60 +2333,72 @@ def mr_positions():
         positions = cursor.fetchall()
     
     if not positions:
-        click.echo("No open mean reversion positions")
+        out("No open mean reversion positions")
+        out.flush()
         return
     
+    today = date.today()
     for pos in positions:
-        days_held = (date.today() - date.fromisoformat(pos['entry_date'])).days
-        click.echo(f"{pos['ticker']}")
-        click.echo(f"  Entry: ${pos['entry_price']:.2f} on {pos['entry_date']}")
-        click.echo(f"  Shares: {pos['shares']}")
-        click.echo(f"  Stop: ${pos['stop_price']:.2f} | Target: ${pos['target_price']:.2f}")
-        click.echo(f"  Days held: {days_held}/5")
-        click.echo()
+        days_held = (today - date.fromisoformat(pos['entry_date'])).days
+        out(f"{pos['ticker']}")
+        out(f"  Entry: ${pos['entry_price']:.2f} on {pos['entry_date']}")
+        out(f"  Shares: {pos['shares']}")
+        out(f"  Stop: ${pos['stop_price']:.2f} | Target: ${pos['target_price']:.2f}")
+        out(f"  Days held: {days_held}/5")
+        out()
+    out.flush()
 
 
 @cli.command("mr-history")
 @click.option("--limit", "-l", default=20, help="Number of trades to show")
 def mr_history(limit):
     """Show mean reversion trade history."""
-    from utils.db import get_db
+    out = Out()
     
-    click.echo("=" * 50)
-    click.echo("MEAN REVERSION TRADE HISTORY")
-    click.echo("=" * 50)
-    click.echo()
+    out("=" * 50)
+    out("MEAN REVERSION TRADE HISTORY")
+    out("=" * 50)
+    out()
     
     with get_db() as conn:
         cursor = conn.execute("""
-            SELECT * FROM mean_reversion_trades 
+            SELECT ticker, return_pct, return_dollars, exit_reason, days_held
+            FROM mean_reversion_trades
             WHERE status = 'CLOSED'
             ORDER BY exit_date DESC
             LIMIT ?
         """, (limit,))
         trades = cursor.fetchall()
+
+        # Totals over the same trades, computed by SQLite
+        count, wins, total_pnl = conn.execute("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(return_pct > 0), 0),
+                   COALESCE(SUM(return_dollars), 0)
+            FROM (
+                SELECT return_pct, return_dollars FROM mean_reversion_trades
+                WHERE status = 'CLOSED'
+                ORDER BY exit_date DESC
+                LIMIT ?
+            )
+        """, (limit,)).fetchone()
     
     if not trades:
-        click.echo("No closed mean reversion trades")
+        out("No closed mean reversion trades")
+        out.flush()
         return
     
-    total_pnl = 0
-    wins = 0
-    
-    for t in trades:
-        total_pnl += t['return_dollars'] or 0
-        if (t['return_pct'] or 0) > 0:
-            wins += 1
-        
-        emoji = "✓" if (t['return_pct'] or 0) > 0 else "✗"
-        click.echo(f"{emoji} {t['ticker']}: {t['return_pct']:+.1f}% "
-                  f"(${t['return_dollars']:+.2f}) - {t['exit_reason']} "
-                  f"[{t['days_held']}d]")
+    for ticker, return_pct, return_dollars, exit_reason, days_held in trades:
+        emoji = "✓" if (return_pct or 0) > 0 else "✗"
+        out(f"{emoji} {ticker}: {return_pct:+.1f}% "
+            f"(${return_dollars:+.2f}) - {exit_reason} "
+            f"[{days_held}d]")
     
-    click.echo()
-    click.echo(f"Total: {len(trades)} trades")
-    click.echo(f"Win Rate: {wins/len(trades)*100:.0f}%")
-    click.echo(f"Net P&L: ${total_pnl:+.2f}")
+    out()
+    out(f"Total: {count} trades")
+    out(f"Win Rate: {wins/count*100:.0f}%")
+    out(f"Net P&L: ${total_pnl:+.2f}")
+    out.flush()
 
 
 @cli.command("v2-combined")
@@ -2109,17 +2414,22 @@ def v2_combined(email):
     
     trader = AutoTrader()
     
-    # Run momentum check
-    click.echo()
-    click.echo("MOMENTUM STRATEGY (70%)")
-    click.echo("-" * 50)
-    momentum_results = trader.run_breakout_check(send_emails=email)
-    
-    # Run mean reversion check
-    click.echo()
-    click.echo("MEAN REVERSION STRATEGY (30%)")
-    click.echo("-" * 50)
-    mr_results = trader.run_mean_reversion_check(send_emails=email)
+    # Mean reversion market data is fetched in the background while the
+    # momentum check runs; entries stay sequential (shared cash/positions)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        mr_signals = executor.submit(trader.fetch_mean_reversion_signals)
+
+        # Run momentum check
+        click.echo()
+        click.echo("MOMENTUM STRATEGY (70%)")
+        click.echo("-" * 50)
+        momentum_results = trader.run_breakout_check(send_emails=email)
+
+        # Run mean reversion check
+        click.echo()
+        click.echo("MEAN REVERSION STRATEGY (30%)")
+        click.echo("-" * 50)
+        mr_results = trader.run_mean_reversion_check(send_emails=email, signals=mr_signals.result())
     
     click.echo()
     click.echo("=" * 50)
@@ -2152,10 +2462,9 @@ def v2_auto_trade(email, dry_run):
 
     Run via cron at market close to enter best setups.
     """
-    from signals.auto_trader import AutoTrader
-    from utils.paper_trading import PaperTradingEngine
     from signals.trend_template import get_compliant_stocks
-    from datetime import date as dt
+    from utils.paper_trading import PaperTradingEngine
+    from signals.auto_trader import AutoTrader
 
     click.echo("=" * 50)
     click.echo("V2 AUTO-TRADE - MOMENTUM STRATEGY")
@@ -2177,7 +2486,7 @@ def v2_auto_trade(email, dry_run):
         click.echo()
 
         # Get compliant stocks and analyze candidates
-        stocks = get_compliant_stocks(dt.today())
+        stocks = get_compliant_stocks(date.today())
         open_tickers = [p.ticker for p in status.open_positions]
 
         # Filter candidates
@@ -10,22 +10,53 @@ Sends notifications for important events:
 Supports email delivery (SMS can be added later).
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Optional, List, Dict
+import time
+from typing import Iterator, Optional, List, Dict
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.db import get_db
 from utils.config import config
-from output.emailer import send_email
+from output.emailer import send_email, smtp_session
+
+
+# Alert settings, read once at import (see reload_config)
+_ALERT_EMAIL = config.ALERT_EMAIL
+_EMAIL_TO = config.EMAIL_TO
+
+
+def reload_config():
+    """Re-read alert settings from config after changing them at runtime."""
+    global _ALERT_EMAIL, _EMAIL_TO
+    _ALERT_EMAIL = config.ALERT_EMAIL
+    _EMAIL_TO = config.EMAIL_TO
+
+
+# Email subject for an alert, as _alert_subject(alert_type, ticker)
+_alert_subject = "[Stock Radar V2] {}: {}".format
+
+ALERT_INSERT_SQL = """
+    INSERT INTO alerts_v2 (ticker, alert_type, message, delivered)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Undelivered alerts read per retry_failed_alerts() round
+RETRY_BATCH_SIZE = 100
+
+# Deferred alerts awaiting flush_pending_alerts(): (alert_id, alert_type, ticker, message)
+_pending: List[tuple] = []
 
 
 def send_alert(
     alert_type: str,
     ticker: str,
     message: str,
-    send_email_flag: bool = True
+    send_email_flag: bool = True,
+    defer: bool = False
 ) -> int:
     """
     Send an alert and log it to database.
@@ -44,94 +75,171 @@ def send_alert(
         ticker: Stock symbol (or 'SYSTEM' for portfolio-level alerts)
         message: Alert message body
         send_email_flag: Whether to send email notification
+        defer: Log the alert now (undelivered) and email it in the next
+            flush_pending_alerts() digest instead of immediately
     
     Returns:
         alert_id
     """
-    # Log to database
+    if defer and send_email_flag and _ALERT_EMAIL:
+        with get_db() as conn:
+            alert_id = conn.execute(ALERT_INSERT_SQL, (ticker, alert_type, message, False)).lastrowid
+        _pending.append((alert_id, alert_type, ticker, message))
+        return alert_id
+    
+    # Send first so the row is written once, with its final delivered flag,
+    # in a single transaction (no UPDATE and no write lock held over SMTP)
+    delivered = False
+    if send_email_flag and _ALERT_EMAIL:
+        delivered = _send_email_notification(_alert_subject(alert_type, ticker), message)
+    
     with get_db() as conn:
-        cursor = conn.execute("""
-            INSERT INTO alerts_v2 (ticker, alert_type, message, delivered)
-            VALUES (?, ?, ?, ?)
-        """, (ticker, alert_type, message, False))
-        
+        cursor = conn.execute(ALERT_INSERT_SQL, (ticker, alert_type, message, delivered))
         alert_id = cursor.lastrowid
     
-    # Send notification
-    if send_email_flag and config.ALERT_EMAIL:
-        subject = f"[Stock Radar V2] {alert_type}: {ticker}"
-        success = _send_email_notification(subject, message, alert_id)
-        
-        if success:
-            with get_db() as conn:
-                conn.execute(
-                    "UPDATE alerts_v2 SET delivered = 1 WHERE id = ?",
-                    (alert_id,)
-                )
-    
     return alert_id
 
 
-def _send_email_notification(subject: str, message: str, alert_id: int) -> bool:
-    """Send email notification."""
+def send_alerts_bulk(
+    alerts: List[tuple],
+    send_email_flag: bool = True
+) -> int:
+    """
+    Send several alerts over one SMTP connection and log them with one executemany.
+    
+    Args:
+        alerts: (alert_type, ticker, message) tuples
+        send_email_flag: Whether to send email notifications
+    
+    Returns:
+        Number of alerts logged
+    """
+    if not alerts:
+        return 0
+    
+    delivered = [False] * len(alerts)
+    if send_email_flag and _ALERT_EMAIL:
+        # One SMTP login for the whole batch; anything unsent stays
+        # undelivered for retry_failed_alerts()
+        try:
+            with smtp_session() as server:
+                for i, (alert_type, ticker, message) in enumerate(alerts):
+                    delivered[i] = _send_email_notification(
+                        _alert_subject(alert_type, ticker), message, server
+                    )
+        except Exception as e:
+            print(f"Failed to connect to SMTP server for alerts: {e}")
+    
+    rows = [
+        (ticker, alert_type, message, sent)
+        for (alert_type, ticker, message), sent in zip(alerts, delivered)
+    ]
+    
+    with get_db() as conn:
+        conn.executemany(ALERT_INSERT_SQL, rows)
+    
+    return len(rows)
+
+
+def flush_pending_alerts() -> int:
+    """
+    Email deferred alerts as one digest per alert type.
+    
+    All digests go over one SMTP connection and the delivered alerts are
+    marked with a single UPDATE; anything that fails stays undelivered for
+    retry_failed_alerts().
+    
+    Returns:
+        Number of alerts delivered
+    """
+    global _pending
+    pending, _pending = _pending, []
+    if not pending:
+        return 0
+    
+    groups = defaultdict(list)
+    for alert in pending:
+        groups[alert[1]].append(alert)
+    
+    delivered_ids = []
     try:
-        send_email(
-            to=config.EMAIL_TO,
-            subject=subject,
-            body=message
-        )
-        return True
+        with smtp_session() as server:
+            for alert_type, alerts in groups.items():
+                subject = _alert_subject(alert_type, ", ".join(a[2] for a in alerts))
+                body = "\n\n".join(a[3] for a in alerts)
+                if _send_email_notification(subject, body, server):
+                    delivered_ids.extend(a[0] for a in alerts)
     except Exception as e:
-        print(f"Failed to send alert email: {e}")
-        return False
+        print(f"Failed to connect to SMTP server for alert digest: {e}")
+    
+    _mark_delivered(delivered_ids)
+    return len(delivered_ids)
+
+
+def _mark_delivered(alert_ids: List[int]):
+    """Set delivered = 1 on the given alerts with one UPDATE per 500 ids."""
+    if not alert_ids:
+        return
+    with get_db() as conn:
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(alert_ids), 500):
+            chunk = alert_ids[start:start + 500]
+            conn.execute(
+                f"UPDATE alerts_v2 SET delivered = 1 WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+
+
+def _send_email_notification(subject: str, message: str, server=None) -> bool:
+    """Send email notification (optionally over an open smtp_session())."""
+    result = send_email(subject, message, to_email=_EMAIL_TO, server=server)
+    if not result["success"]:
+        print(f"Failed to send alert email: {result['message']}")
+    return result["success"]
 
 
 # =============================================================================
 # Alert Formatters
 # =============================================================================
 
-def format_breakout_alert(
-    ticker: str,
-    pivot: float,
-    price: float,
-    volume_ratio: float,
-    quality: str = "B"
-) -> str:
-    """Format a breakout alert message."""
-    return f"""
+SEP = "=" * 50
+
+# Footer timestamp, reformatted only when the minute changes: [minute, text]
+_TS_CACHE = [None, ""]
+
+
+def _now_str() -> str:
+    """Return the current local time as 'YYYY-MM-DD HH:MM'."""
+    minute = int(time.time() // 60)
+    if minute != _TS_CACHE[0]:
+        _TS_CACHE[:] = [minute, datetime.now().strftime('%Y-%m-%d %H:%M')]
+    return _TS_CACHE[1]
+
+
+# Message templates, parsed once at import and filled in with .format()
+_FOOTER = "\n---\nStock Radar V2 | {timestamp}\n"
+
+_BREAKOUT_TMPL = ("""
 🚀 BREAKOUT ALERT: {ticker} (Grade: {quality})
-{'=' * 50}
+""" + SEP + """
 
 Pivot Price: ${pivot:.2f}
-Current Price: ${price:.2f} (+{((price-pivot)/pivot)*100:.1f}%)
+Current Price: ${price:.2f} (+{gain_pct:.1f}%)
 Volume: {volume_ratio:.1f}x average
 
 ACTION REQUIRED: Review for potential entry
 
 Entry Guidelines:
 • Enter near current price if volume confirms
-• Stop: ${pivot * 0.93:.2f} (7% below pivot)
-• Target: ${price * 1.20:.2f} (20% profit)
+• Stop: ${stop:.2f} (7% below pivot)
+• Target: ${target:.2f} (20% profit)
 
 ⚠️  Check earnings calendar before entering!
+""" + _FOOTER).format
 
----
-Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-
-
-def format_stop_hit_alert(
-    ticker: str,
-    entry: float,
-    exit_price: float,
-    return_pct: float,
-    return_dollars: float,
-    days_held: int
-) -> str:
-    """Format a stop hit alert message."""
-    return f"""
+_STOP_HIT_TMPL = ("""
 🛑 STOP HIT: {ticker}
-{'=' * 50}
+""" + SEP + """
 
 Position Closed (Stop Loss Triggered)
 
@@ -143,24 +251,11 @@ Days Held: {days_held}
 The stop loss was triggered automatically to protect capital.
 
 Remember: Cutting losses quickly is key to long-term success.
+""" + _FOOTER).format
 
----
-Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-
-
-def format_target_hit_alert(
-    ticker: str,
-    entry: float,
-    exit_price: float,
-    return_pct: float,
-    return_dollars: float,
-    days_held: int
-) -> str:
-    """Format a target hit alert message."""
-    return f"""
+_TARGET_HIT_TMPL = ("""
 🎯 TARGET HIT: {ticker}
-{'=' * 50}
+""" + SEP + """
 
 Profit Target Reached! 🎉
 
@@ -170,23 +265,11 @@ Return: {return_pct:+.1f}% (${return_dollars:+,.2f})
 Days Held: {days_held}
 
 Congratulations! The profit target was reached.
+""" + _FOOTER).format
 
----
-Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-
-
-def format_watchlist_alert(
-    ticker: str,
-    pivot: float,
-    trend_score: int,
-    rs_rating: float,
-    notes: str = ""
-) -> str:
-    """Format a watchlist addition alert."""
-    return f"""
+_WATCHLIST_TMPL = ("""
 👁️ WATCHLIST ADD: {ticker}
-{'=' * 50}
+""" + SEP + """
 
 New Setup Added to Watchlist
 
@@ -197,51 +280,128 @@ RS Rating: {rs_rating:.1f}
 {notes}
 
 Monitor for breakout with volume confirmation.
+""" + _FOOTER).format
 
----
-Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
+# Morning scan rows: (rank, ticker, rs_rating, price) and (ticker, pivot, price)
+_TOP_PICK_FMT = "{}. {:<6} RS: {:.1f}  Price: ${:.2f}".format
+_NEAR_PIVOT_FMT = "   {:<6} Pivot: ${:.2f}  Current: ${:.2f}".format
 
+_WARNING_TMPL = ("""
+⚠️ WARNING: {ticker}
+""" + SEP + """
 
-def format_morning_scan_alert(
+Type: {warning_type}
+
+{details}
+
+Please review and take appropriate action.
+""" + _FOOTER).format
+
+
+def format_breakout_alert(
+    ticker: str,
+    pivot: float,
+    price: float,
+    volume_ratio: float,
+    quality: str = "B"
+) -> str:
+    """Format a breakout alert message."""
+    return _BREAKOUT_TMPL(
+        ticker=ticker, quality=quality, pivot=pivot, price=price,
+        gain_pct=((price - pivot) / pivot) * 100, volume_ratio=volume_ratio,
+        stop=pivot * 0.93, target=price * 1.20,
+        timestamp=_now_str(),
+    )
+
+
+def format_stop_hit_alert(
+    ticker: str,
+    entry: float,
+    exit_price: float,
+    return_pct: float,
+    return_dollars: float,
+    days_held: int
+) -> str:
+    """Format a stop hit alert message."""
+    return _STOP_HIT_TMPL(
+        ticker=ticker, entry=entry, exit_price=exit_price, return_pct=return_pct,
+        return_dollars=return_dollars, days_held=days_held,
+        timestamp=_now_str(),
+    )
+
+
+def format_target_hit_alert(
+    ticker: str,
+    entry: float,
+    exit_price: float,
+    return_pct: float,
+    return_dollars: float,
+    days_held: int
+) -> str:
+    """Format a target hit alert message."""
+    return _TARGET_HIT_TMPL(
+        ticker=ticker, entry=entry, exit_price=exit_price, return_pct=return_pct,
+        return_dollars=return_dollars, days_held=days_held,
+        timestamp=_now_str(),
+    )
+
+
+def format_watchlist_alert(
+    ticker: str,
+    pivot: float,
+    trend_score: int,
+    rs_rating: float,
+    notes: str = ""
+) -> str:
+    """Format a watchlist addition alert."""
+    return _WATCHLIST_TMPL(
+        ticker=ticker, pivot=pivot, trend_score=trend_score, rs_rating=rs_rating,
+        notes=notes, timestamp=_now_str(),
+    )
+
+
+def _iter_morning_scan(
     passing_count: int,
     top_stocks: List[Dict],
     breakout_candidates: List[Dict]
-) -> str:
-    """Format morning scan results alert."""
-    lines = [
-        f"☀️ MORNING SCAN RESULTS",
-        "=" * 50,
-        "",
-        f"Stocks Passing Trend Template: {passing_count}",
-        "",
-    ]
+) -> Iterator[str]:
+    """Yield the lines of the morning scan alert."""
+    yield "☀️ MORNING SCAN RESULTS"
+    yield SEP
+    yield ""
+    yield f"Stocks Passing Trend Template: {passing_count}"
+    yield ""
     
     if top_stocks:
-        lines.append("Top Candidates by RS Rating:")
-        lines.append("-" * 40)
+        yield "Top Candidates by RS Rating:"
+        yield "-" * 40
         for i, s in enumerate(top_stocks[:5], 1):
-            lines.append(f"{i}. {s['ticker']:<6} RS: {s.get('rs_rating', 0):.1f}  Price: ${s.get('price', 0):.2f}")
-        lines.append("")
+            yield _TOP_PICK_FMT(i, s['ticker'], s.get('rs_rating', 0), s.get('price', 0))
+        yield ""
     
     if breakout_candidates:
-        lines.append("⚡ Near Breakout (within 3% of pivot):")
-        lines.append("-" * 40)
+        yield "⚡ Near Breakout (within 3% of pivot):"
+        yield "-" * 40
         for s in breakout_candidates[:5]:
-            lines.append(f"   {s['ticker']:<6} Pivot: ${s.get('pivot', 0):.2f}  Current: ${s.get('price', 0):.2f}")
-        lines.append("")
+            yield _NEAR_PIVOT_FMT(s['ticker'], s.get('pivot', 0), s.get('price', 0))
+        yield ""
     
-    lines.extend([
-        "Run 'v2-watchlist' for full list.",
-        "",
-        "---",
-        f"Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-    ])
-    
-    return "\n".join(lines)
+    yield "Run 'v2-watchlist' for full list."
+    yield ""
+    yield "---"
+    yield f"Stock Radar V2 | {_now_str()}"
 
 
-def format_daily_report_alert(
+def format_morning_scan_alert(
+    passing_count: int,
+    top_stocks: List[Dict],
+    breakout_candidates: List[Dict]
+) -> str:
+    """Format morning scan results alert."""
+    return "\n".join(_iter_morning_scan(passing_count, top_stocks, breakout_candidates))
+
+
+def _iter_daily_report(
     portfolio_value: float,
     daily_pnl: float,
     daily_pnl_pct: float,
@@ -249,70 +409,78 @@ def format_daily_report_alert(
     total_pnl_pct: float,
     open_positions: List[Dict],
     trades_today: List[Dict]
-) -> str:
-    """Format end of day portfolio report."""
-    lines = [
-        f"📊 DAILY PORTFOLIO REPORT",
-        "=" * 50,
-        "",
-        f"Portfolio Value: ${portfolio_value:,.2f}",
-        f"Today's P&L: ${daily_pnl:+,.2f} ({daily_pnl_pct:+.2f}%)",
-        f"Total P&L: ${total_pnl:+,.2f} ({total_pnl_pct:+.2f}%)",
-        "",
-    ]
+) -> Iterator[str]:
+    """Yield the lines of the end of day portfolio report."""
+    yield "📊 DAILY PORTFOLIO REPORT"
+    yield SEP
+    yield ""
+    yield f"Portfolio Value: ${portfolio_value:,.2f}"
+    yield f"Today's P&L: ${daily_pnl:+,.2f} ({daily_pnl_pct:+.2f}%)"
+    yield f"Total P&L: ${total_pnl:+,.2f} ({total_pnl_pct:+.2f}%)"
+    yield ""
     
     if open_positions:
-        lines.append(f"Open Positions ({len(open_positions)}):")
-        lines.append("-" * 40)
+        yield f"Open Positions ({len(open_positions)}):"
+        yield "-" * 40
         for pos in open_positions:
-            pnl = pos.get('pnl_pct', 0)
-            lines.append(
+            yield (
                 f"  {pos['ticker']:<6} {pos['shares']:>4} sh  "
-                f"Entry: ${pos['entry']:.2f}  P&L: {pnl:+.1f}%"
+                f"Entry: ${pos['entry']:.2f}  P&L: {pos.get('pnl_pct', 0):+.1f}%"
             )
-        lines.append("")
+        yield ""
     
     if trades_today:
-        lines.append(f"Trades Today ({len(trades_today)}):")
-        lines.append("-" * 40)
+        yield f"Trades Today ({len(trades_today)}):"
+        yield "-" * 40
         for trade in trades_today:
-            lines.append(
+            yield (
                 f"  {trade['ticker']:<6} {trade['action']:<6} @ ${trade['price']:.2f}  "
                 f"{trade.get('return_pct', 0):+.1f}%"
             )
-        lines.append("")
+        yield ""
     
-    lines.extend([
-        "---",
-        f"Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-    ])
-    
-    return "\n".join(lines)
-
-
-def format_warning_alert(ticker: str, warning_type: str, details: str) -> str:
-    """Format a warning alert."""
-    return f"""
-⚠️ WARNING: {ticker}
-{'=' * 50}
+    yield "---"
+    yield f"Stock Radar V2 | {_now_str()}"
 
-Type: {warning_type}
 
-{details}
+def format_daily_report_alert(
+    portfolio_value: float,
+    daily_pnl: float,
+    daily_pnl_pct: float,
+    total_pnl: float,
+    total_pnl_pct: float,
+    open_positions: List[Dict],
+    trades_today: List[Dict]
+) -> str:
+    """Format end of day portfolio report."""
+    return "\n".join(_iter_daily_report(
+        portfolio_value, daily_pnl, daily_pnl_pct, total_pnl, total_pnl_pct,
+        open_positions, trades_today
+    ))
 
-Please review and take appropriate action.
 
----
-Stock Radar V2 | {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
+def format_warning_alert(ticker: str, warning_type: str, details: str) -> str:
+    """Format a warning alert."""
+    return _WARNING_TMPL(
+        ticker=ticker, warning_type=warning_type, details=details,
+        timestamp=_now_str(),
+    )
 
 
 # =============================================================================
 # Alert Retrieval
 # =============================================================================
 
-def get_recent_alerts(limit: int = 20, alert_type: str = None) -> List[Dict]:
-    """Get recent alerts from database."""
+def _iter_dicts(cursor) -> Iterator[Dict]:
+    """Yield rows as dicts, zipping plain tuples with column names read once."""
+    cursor.row_factory = None
+    columns = [col[0] for col in cursor.description]
+    for row in cursor:
+        yield dict(zip(columns, row))
+
+
+def iter_recent_alerts(limit: int = 20, alert_type: str = None) -> Iterator[Dict]:
+    """Yield recent alerts one row at a time, without materializing the result."""
     with get_db() as conn:
         if alert_type:
             cursor = conn.execute("""
@@ -328,36 +496,94 @@ def get_recent_alerts(limit: int = 20, alert_type: str = None) -> List[Dict]:
                 LIMIT ?
             """, (limit,))
         
-        return [dict(row) for row in cursor.fetchall()]
+        yield from _iter_dicts(cursor)
 
 
-def get_undelivered_alerts() -> List[Dict]:
-    """Get alerts that failed to deliver."""
+def get_recent_alerts(limit: int = 20, alert_type: str = None) -> List[Dict]:
+    """Get recent alerts from database."""
+    return list(iter_recent_alerts(limit, alert_type))
+
+
+def iter_undelivered_alerts(
+    limit: Optional[int] = None,
+    before: Optional[tuple] = None
+) -> Iterator[Dict]:
+    """
+    Yield alerts that failed to deliver, newest first, one row at a time.
+    
+    Args:
+        limit: Maximum rows to return (None = all)
+        before: (sent_at, id) of the last alert on the previous page; only
+            older alerts are returned
+    """
+    query = "SELECT * FROM alerts_v2 WHERE delivered = 0"
+    params = []
+    if before is not None:
+        query += " AND (sent_at, id) < (?, ?)"
+        params.extend(before)
+    query += " ORDER BY sent_at DESC, id DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    
     with get_db() as conn:
-        cursor = conn.execute("""
-            SELECT * FROM alerts_v2
-            WHERE delivered = 0
-            ORDER BY sent_at DESC
-        """)
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = conn.execute(query, params)
+        yield from _iter_dicts(cursor)
+
+
+def get_undelivered_alerts(limit: Optional[int] = 100, before: Optional[tuple] = None) -> List[Dict]:
+    """Get up to `limit` alerts that failed to deliver (see iter_undelivered_alerts)."""
+    return list(iter_undelivered_alerts(limit, before))
+
+
+def _send_alert_batch(alerts: List[Dict]) -> List[int]:
+    """Send stored alerts over one SMTP session and return the delivered ids."""
+    delivered_ids = []
+    try:
+        with smtp_session() as server:
+            for alert in alerts:
+                subject = _alert_subject(alert['alert_type'], alert['ticker'])
+                if _send_email_notification(subject, alert['message'], server):
+                    delivered_ids.append(alert['id'])
+    except Exception as e:
+        print(f"Failed to connect to SMTP server for alert retry: {e}")
+    return delivered_ids
 
 
 def retry_failed_alerts() -> int:
-    """Retry sending failed alerts."""
-    failed = get_undelivered_alerts()
-    retried = 0
+    """
+    Retry sending failed alerts, RETRY_BATCH_SIZE at a time.
+    
+    Each batch is split across up to config.ALERT_SEND_CONCURRENCY
+    threads, each sending its share over its own SMTP connection, and the
+    delivered ones are marked with a single UPDATE before the next batch
+    is read. Pages advance past alerts that fail again, so every
+    undelivered alert is attempted once per call.
+    """
+    concurrency = max(1, config.ALERT_SEND_CONCURRENCY)
+    total = 0
+    before = None
     
-    for alert in failed:
-        subject = f"[Stock Radar V2] {alert['alert_type']}: {alert['ticker']}"
-        if _send_email_notification(subject, alert['message'], alert['id']):
-            with get_db() as conn:
-                conn.execute(
-                    "UPDATE alerts_v2 SET delivered = 1 WHERE id = ?",
-                    (alert['id'],)
-                )
-            retried += 1
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            failed = get_undelivered_alerts(RETRY_BATCH_SIZE, before)
+            if not failed:
+                break
+            
+            workers = min(concurrency, len(failed))
+            delivered_ids = [
+                alert_id
+                for ids in executor.map(_send_alert_batch, [failed[i::workers] for i in range(workers)])
+                for alert_id in ids
+            ]
+            _mark_delivered(delivered_ids)
+            total += len(delivered_ids)
+            
+            if len(failed) < RETRY_BATCH_SIZE:
+                break
+            before = (failed[-1]['sent_at'], failed[-1]['id'])
     
-    return retried
+    return total
 
 
 # Quick test
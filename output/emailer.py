@@ -6,6 +6,8 @@ Supports both plain text and HTML multipart emails.
 """
 
 import smtplib
+from contextlib import contextmanager
+from functools import lru_cache
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from datetime import date
@@ -16,7 +18,25 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config import config
-from output.formatter import format_daily_email
+
+
+@contextmanager
+def smtp_session():
+    """
+    Open one authenticated SMTP connection for sending several emails.
+
+    Pass the yielded server to send_email() so the TLS handshake and login
+    happen once per batch instead of once per message.
+
+    Usage:
+        with smtp_session() as server:
+            for subject, body in messages:
+                send_email(subject, body, server=server)
+    """
+    with smtplib.SMTP(config.EMAIL_SMTP_SERVER, config.EMAIL_SMTP_PORT) as server:
+        server.starttls()
+        server.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
+        yield server
 
 
 def send_email(
@@ -24,6 +44,7 @@ def send_email(
     text_body: str,
     html_body: Optional[str] = None,
     to_email: Optional[str] = None,
+    server: Optional[smtplib.SMTP] = None,
 ) -> dict:
     """
     Send an email via SMTP.
@@ -33,6 +54,8 @@ def send_email(
         text_body: Plain text content
         html_body: HTML content (optional)
         to_email: Recipient email (default: from config)
+        server: Logged-in connection from smtp_session() to reuse
+            (default: open a new one for this email)
 
     Returns:
         Dict with 'success' bool and 'message'
@@ -60,11 +83,12 @@ def send_email(
         msg['From'] = config.EMAIL_USERNAME
         msg['To'] = to_email
 
-        # Connect and send
-        with smtplib.SMTP(config.EMAIL_SMTP_SERVER, config.EMAIL_SMTP_PORT) as server:
-            server.starttls()
-            server.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
+        # Connect (unless reusing a session) and send
+        if server is not None:
             server.sendmail(config.EMAIL_USERNAME, to_email, msg.as_string())
+        else:
+            with smtp_session() as server:
+                server.sendmail(config.EMAIL_USERNAME, to_email, msg.as_string())
 
         return {"success": True, "message": f"Email sent to {to_email}"}
 
@@ -90,14 +114,19 @@ def send_daily_email(target_date: Optional[date] = None, to_email: Optional[str]
     if target_date is None:
         target_date = date.today()
 
+    # The formatter pulls in signals/market data; only load it when building
+    # the daily email so plain alert sends stay lightweight
+    from output.formatter import format_daily_email
+
     # Generate email content
     email = format_daily_email(target_date)
+    subject, text_body, html_body = email['subject'], email['text'], email['html']
 
     # Send
     result = send_email(
-        subject=email['subject'],
-        text_body=email['text'],
-        html_body=email['html'],
+        subject=subject,
+        text_body=text_body,
+        html_body=html_body,
         to_email=to_email,
     )
 
@@ -134,18 +163,8 @@ def test_email_connection() -> dict:
         return {"success": False, "message": f"Connection error: {str(e)}"}
 
 
-def send_test_email(to_email: Optional[str] = None) -> dict:
-    """
-    Send a test email to verify configuration.
-
-    Args:
-        to_email: Recipient email (default: from config)
-
-    Returns:
-        Dict with 'success' bool and 'message'
-    """
-    subject = "Stock Radar - Test Email"
-    text_body = """This is a test email from Stock Radar.
+# Test email bodies, filled in with the SMTP settings being tested
+_TEST_EMAIL_TEXT = """This is a test email from Stock Radar.
 
 If you received this, your email configuration is working correctly.
 
@@ -155,21 +174,17 @@ Configuration:
   From: {username}
 
 Stock Radar is configured and ready to send daily signals.
-""".format(
-        server=config.EMAIL_SMTP_SERVER,
-        port=config.EMAIL_SMTP_PORT,
-        username=config.EMAIL_USERNAME,
-    )
+""".format
 
-    html_body = """<!DOCTYPE html>
+_TEST_EMAIL_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <style>
-        body { font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; }
-        .container { background: #f5f5f5; padding: 20px; border-radius: 8px; }
-        h1 { color: #333; }
-        .success { color: #28a745; font-size: 18px; }
-        .config { background: white; padding: 15px; border-radius: 4px; margin: 15px 0; }
+        body {{ font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; }}
+        .container {{ background: #f5f5f5; padding: 20px; border-radius: 8px; }}
+        h1 {{ color: #333; }}
+        .success {{ color: #28a745; font-size: 18px; }}
+        .config {{ background: white; padding: 15px; border-radius: 4px; margin: 15px 0; }}
     </style>
 </head>
 <body>
@@ -188,13 +203,30 @@ Stock Radar is configured and ready to send daily signals.
     </div>
 </body>
 </html>
-""".format(
-        server=config.EMAIL_SMTP_SERVER,
-        port=config.EMAIL_SMTP_PORT,
-        username=config.EMAIL_USERNAME,
-    )
+""".format
+
+
+@lru_cache(maxsize=4)
+def _render_test_email(server: str, port: int, username: str) -> tuple:
+    """Render the (text, html) test email bodies for one SMTP configuration."""
+    fields = {"server": server, "port": port, "username": username}
+    return _TEST_EMAIL_TEXT(**fields), _TEST_EMAIL_HTML(**fields)
+
+
+def send_test_email(to_email: Optional[str] = None) -> dict:
+    """
+    Send a test email to verify configuration.
+
+    Args:
+        to_email: Recipient email (default: from config)
 
-    return send_email(subject, text_body, html_body, to_email)
+    Returns:
+        Dict with 'success' bool and 'message'
+    """
+    text_body, html_body = _render_test_email(
+        config.EMAIL_SMTP_SERVER, config.EMAIL_SMTP_PORT, config.EMAIL_USERNAME
+    )
+    return send_email("Stock Radar - Test Email", text_body, html_body, to_email)
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.config import config
 from utils.db import get_db
 from signals.combiner import get_top_signals
-from collectors.market import get_current_price
+from collectors.market import get_current_prices
 
 
 def get_open_positions():
@@ -100,11 +100,16 @@ def format_daily_email(target_date: Optional[date] = None) -> dict:
     else:
         subject = f"Stock Radar {target_date.strftime('%m/%d')}: No signals today"
 
+    # Fetch open positions and one batch of quotes for both versions, so the
+    # text and HTML bodies show the same prices
+    open_positions = get_open_positions()
+    prices = get_current_prices([pos['ticker'] for pos in open_positions]) if open_positions else {}
+
     # Build text content
-    text = format_text_email(target_date, trade_signals, watch_signals)
+    text = format_text_email(target_date, trade_signals, watch_signals, open_positions, prices)
 
     # Build HTML content
-    html = format_html_email(target_date, trade_signals, watch_signals)
+    html = format_html_email(target_date, trade_signals, watch_signals, open_positions, prices)
 
     return {
         'subject': subject,
@@ -113,7 +118,13 @@ def format_daily_email(target_date: Optional[date] = None) -> dict:
     }
 
 
-def format_text_email(target_date: date, trade_signals: list, watch_signals: list) -> str:
+def format_text_email(
+    target_date: date,
+    trade_signals: list,
+    watch_signals: list,
+    open_positions: list,
+    prices: dict,
+) -> str:
     """Format plain text email content."""
     lines = [
         f"STOCK RADAR - {target_date.strftime('%A, %B %d, %Y')}",
@@ -122,7 +133,6 @@ def format_text_email(target_date: date, trade_signals: list, watch_signals: lis
     ]
 
     # Get paper trading data
-    open_positions = get_open_positions()
     recent_trades = get_recent_closed_trades(days=7)
     stats = get_trading_stats()
 
@@ -172,13 +182,13 @@ def format_text_email(target_date: date, trade_signals: list, watch_signals: lis
         ])
         total_unrealized = 0
         for pos in open_positions:
-            try:
-                current = get_current_price(pos['ticker'])
+            current = prices.get(pos['ticker'])
+            if current:
                 pct = ((current - pos['entry_price']) / pos['entry_price']) * 100
                 unrealized = (current - pos['entry_price']) * pos['shares']
                 total_unrealized += unrealized
                 lines.append(f"  {pos['ticker']}: ${pos['entry_price']:.2f} -> ${current:.2f} ({pct:+.1f}%)")
-            except Exception:
+            else:
                 lines.append(f"  {pos['ticker']}: ${pos['entry_price']:.2f} (price unavailable)")
         lines.extend([
             "",
@@ -241,7 +251,13 @@ def format_signal_text(sig: dict, brief: bool = False) -> list[str]:
     return lines
 
 
-def format_html_email(target_date: date, trade_signals: list, watch_signals: list) -> str:
+def format_html_email(
+    target_date: date,
+    trade_signals: list,
+    watch_signals: list,
+    open_positions: list,
+    prices: dict,
+) -> str:
     """Format HTML email content."""
     html = f"""<!DOCTYPE html>
 <html>
@@ -303,8 +319,7 @@ def format_html_email(target_date: date, trade_signals: list, watch_signals: lis
         </div>
 """
 
-    # Paper trading positions and stats
-    open_positions = get_open_positions()
+    # Paper trading stats
     recent_trades = get_recent_closed_trades(days=7)
     stats = get_trading_stats()
 
@@ -322,8 +337,8 @@ def format_html_email(target_date: date, trade_signals: list, watch_signals: lis
 """
         total_unrealized = 0
         for pos in open_positions:
-            try:
-                current = get_current_price(pos['ticker'])
+            current = prices.get(pos['ticker'])
+            if current:
                 pct = ((current - pos['entry_price']) / pos['entry_price']) * 100
                 unrealized = (current - pos['entry_price']) * pos['shares']
                 total_unrealized += unrealized
@@ -336,7 +351,7 @@ def format_html_email(target_date: date, trade_signals: list, watch_signals: lis
                 <td style="padding: 8px; text-align: right; color: {color};">{pct:+.1f}%</td>
             </tr>
 """
-            except Exception:
+            else:
                 html += f"""
             <tr style="border-bottom: 1px solid #eee;">
                 <td style="padding: 8px;"><strong>{pos['ticker']}</strong></td>
@@ -14,6 +14,7 @@ Automatically enters and manages paper trades based on:
 This is the "brain" that makes trading decisions without manual intervention.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import List, Dict, Optional, Tuple
 import sys
@@ -24,7 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.db import get_db
 from utils.config import config
 from utils.paper_trading import PaperTradingEngine
-from signals.trend_template import get_compliant_stocks, check_trend_template, save_trend_template_result
+from signals.trend_template import get_compliant_stocks, check_trend_template, save_trend_template_results
 from signals.vcp_detector import detect_vcp
 from signals.breakout import check_breakout
 from signals.mean_reversion import (
@@ -37,6 +38,8 @@ from signals.mean_reversion import (
 from collectors.earnings import is_earnings_safe
 from output.alerts import (
     send_alert, 
+    send_alerts_bulk,
+    flush_pending_alerts,
     format_breakout_alert, 
     format_stop_hit_alert,
     format_target_hit_alert,
@@ -107,11 +110,11 @@ class AutoTrader:
             from collectors.universe import get_sp500_tickers
             tickers = get_sp500_tickers()[:100]
             
+            scanned = []
             for ticker in tickers:
                 try:
                     result = check_trend_template(ticker)
-                    # Save to trend_template table
-                    save_trend_template_result(result)
+                    scanned.append(result)
                     if result.passes_template:
                         compliant.append({
                             'ticker': result.ticker,
@@ -120,6 +123,9 @@ class AutoTrader:
                         })
                 except:
                     continue
+            
+            # Save to trend_template table in one transaction
+            save_trend_template_results(scanned)
         
         results['stocks_scanned'] = len(compliant)
         results['passing_template'] = len(compliant)
@@ -356,6 +362,9 @@ class AutoTrader:
                 results['errors'].append(f"{ticker}: {str(e)[:50]}")
                 print(f"  {ticker}: Error - {str(e)[:50]}")
 
+        # One digest email for all entries made this run
+        flush_pending_alerts()
+
         print()
         print("=" * 50)
         print(f"Setups found: {len(results['setups_found'])}")
@@ -424,7 +433,7 @@ Trade Details:
 ---
 Stock Radar V2 - Momentum Strategy
 """
-                send_alert("TRADE_ENTRY", ticker, msg)
+                send_alert("TRADE_ENTRY", ticker, msg, defer=True)
 
             return {
                 'trade_id': trade_id,
@@ -441,12 +450,39 @@ Stock Radar V2 - Momentum Strategy
             print(f"  ❌ Error entering {ticker}: {e}")
             return None
     
-    def run_mean_reversion_check(self, send_emails: bool = True) -> Dict:
+    def fetch_mean_reversion_signals(self) -> Dict:
+        """
+        Evaluate the mean reversion universe on a thread pool.
+        
+        Only reads market data, so it can run while the momentum check is
+        entering trades. Tickers that fail are left out and get retried by
+        run_mean_reversion_check().
+        
+        Returns:
+            Dict of ticker -> MeanReversionSignal
+        """
+        def check(ticker):
+            try:
+                return check_mean_reversion(ticker)
+            except Exception:
+                return None
+        
+        universe = get_large_cap_universe()
+        with ThreadPoolExecutor(max_workers=config.V2_SCAN_WORKERS) as executor:
+            signals = dict(zip(universe, executor.map(check, universe)))
+        return {t: s for t, s in signals.items() if s is not None}
+    
+    def run_mean_reversion_check(self, send_emails: bool = True, signals: Optional[Dict] = None) -> Dict:
         """
         Check for mean reversion setups and auto-enter trades.
         
         Run alongside breakout check during market hours.
         Looks for oversold quality stocks to buy for a bounce.
+        
+        Args:
+            send_emails: Send entry/exit alerts
+            signals: Signals prefetched by fetch_mean_reversion_signals();
+                tickers missing from it are checked here
         """
         results = {
             'check_time': datetime.now().isoformat(),
@@ -488,7 +524,7 @@ Stock Radar V2 - Momentum Strategy
                 continue
                 
             try:
-                signal = check_mean_reversion(ticker)
+                signal = (signals or {}).get(ticker) or check_mean_reversion(ticker)
                 
                 if signal.is_signal and signal.signal_strength in ['A', 'B']:
                     print(f"  📉 OVERSOLD: {ticker} - RSI={signal.rsi_14}, Drop={signal.drop_pct}%, Grade={signal.signal_strength}")
@@ -522,6 +558,9 @@ Stock Radar V2 - Momentum Strategy
             except Exception as e:
                 results['errors'].append(f"{ticker}: {str(e)[:50]}")
         
+        # One digest email for all entries made this run
+        flush_pending_alerts()
+        
         print()
         print(f"Oversold signals: {len(results['signals_found'])}")
         print(f"Mean reversion trades entered: {len(results['trades_entered'])}")
@@ -538,11 +577,13 @@ Stock Radar V2 - Momentum Strategy
     
     def _check_mean_reversion_exits(self, send_emails: bool):
         """Check mean reversion positions for exit conditions."""
+        alerts = []
         with get_db() as conn:
             cursor = conn.execute(
                 "SELECT * FROM mean_reversion_trades WHERE status = 'OPEN'"
             )
             positions = cursor.fetchall()
+            today = date.today()
             
             for pos in positions:
                 ticker = pos['ticker']
@@ -557,7 +598,7 @@ Stock Radar V2 - Momentum Strategy
                     # Exit the trade
                     return_pct = ((current_price - entry_price) / entry_price) * 100
                     return_dollars = (current_price - entry_price) * pos['shares']
-                    days_held = (date.today() - entry_date).days
+                    days_held = (today - entry_date).days
                     
                     conn.execute("""
                         UPDATE mean_reversion_trades
@@ -566,7 +607,7 @@ Stock Radar V2 - Momentum Strategy
                             status = 'CLOSED'
                         WHERE id = ?
                     """, (
-                        date.today().isoformat(), current_price, reason,
+                        today.isoformat(), current_price, reason,
                         return_pct, return_dollars, days_held, pos['id']
                     ))
                     
@@ -593,7 +634,10 @@ Days held: {days_held}
 ---
 Stock Radar V2 - Mean Reversion Strategy
 """
-                        send_alert("MR_EXIT", ticker, msg)
+                        alerts.append(("MR_EXIT", ticker, msg))
+        
+        # Log the exits in one batch once the write transaction has committed
+        send_alerts_bulk(alerts)
     
     def _should_enter_mean_reversion(
         self,
@@ -693,7 +737,7 @@ Strategy: Buy oversold, sell on bounce
 ---
 Stock Radar V2 - Mean Reversion Strategy
 """
-                send_alert("MR_ENTRY", ticker, msg)
+                send_alert("MR_ENTRY", ticker, msg, defer=True)
             
             return {
                 'trade_id': trade_id,
@@ -720,11 +764,17 @@ Stock Radar V2 - Mean Reversion Strategy
             'mean_reversion': {},
         }
         
-        # Run momentum (breakout) check
-        results['momentum'] = self.run_breakout_check(send_emails)
-        
-        # Run mean reversion check
-        results['mean_reversion'] = self.run_mean_reversion_check(send_emails)
+        # Fetch mean reversion data in the background while the momentum
+        # (breakout) check runs; trade entries stay sequential so both
+        # strategies see each other's positions and cash
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            mr_signals = executor.submit(self.fetch_mean_reversion_signals)
+            results['momentum'] = self.run_breakout_check(send_emails)
+            
+            # Run mean reversion check
+            results['mean_reversion'] = self.run_mean_reversion_check(
+                send_emails, signals=mr_signals.result()
+            )
         
         return results
     
@@ -754,6 +804,7 @@ Stock Radar V2 - Mean Reversion Strategy
         print("Checking stops and targets...")
         triggered = self.engine.check_stops_and_targets()
         
+        alerts = []
         for t in triggered:
             if t.exit_reason == 'STOP':
                 results['stops_triggered'].append(t)
@@ -764,7 +815,7 @@ Stock Radar V2 - Mean Reversion Strategy
                         t.ticker, t.entry_price, t.exit_price,
                         t.return_pct, t.return_dollars, t.days_held
                     )
-                    send_alert("STOP_HIT", t.ticker, msg)
+                    alerts.append(("STOP_HIT", t.ticker, msg))
                     
             elif t.exit_reason == 'TARGET':
                 results['targets_triggered'].append(t)
@@ -775,7 +826,9 @@ Stock Radar V2 - Mean Reversion Strategy
                         t.ticker, t.entry_price, t.exit_price,
                         t.return_pct, t.return_dollars, t.days_held
                     )
-                    send_alert("TARGET_HIT", t.ticker, msg)
+                    alerts.append(("TARGET_HIT", t.ticker, msg))
+        
+        send_alerts_bulk(alerts)
         
         # 2. Take daily snapshot
         print("Taking daily snapshot...")
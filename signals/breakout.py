@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Optional, Dict, List, Tuple
 import yfinance as yf
+import pandas as pd
 import sys
 from pathlib import Path
 
@@ -78,7 +79,8 @@ def check_breakout(
     ticker: str,
     pivot_price: float,
     volume_multiplier: float = None,
-    portfolio_value: float = None
+    portfolio_value: float = None,
+    prices: Optional[pd.DataFrame] = None
 ) -> BreakoutSignal:
     """
     Check if stock is breaking out above pivot.
@@ -88,6 +90,8 @@ def check_breakout(
         pivot_price: Resistance level to break
         volume_multiplier: Required volume vs average (default from config)
         portfolio_value: For position sizing (default from config)
+        prices: Preloaded daily history (last row = today), e.g. the frame
+            already fetched for detect_vcp(); downloaded when omitted
     
     Returns:
         BreakoutSignal with analysis
@@ -98,8 +102,10 @@ def check_breakout(
         portfolio_value = config.V2_PORTFOLIO_SIZE
     
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="60d")
+        if prices is None:
+            hist = yf.Ticker(ticker).history(period="60d")
+        else:
+            hist = prices
         
         if len(hist) < 20:
             return _empty_breakout(ticker, pivot_price, "Insufficient data")
@@ -15,8 +15,10 @@ POSITION SIZING:
 """
 
 import json
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import sys
@@ -30,6 +32,11 @@ from signals.options_signal import score_options, OptionsSignal
 from signals.social_signal import score_social, SocialSignal
 
 
+# Position size by total_score for TRADE signals (see module docstring)
+POSITION_SIZE_BOUNDS = [45, 60]
+POSITION_SIZES = ["QUARTER", "HALF", "FULL"]
+
+
 @dataclass
 class CombinedSignal:
     """Combined signal with all scores and trade decision."""
@@ -123,12 +130,7 @@ def combine_signals(
 
     # Determine position size based on total score
     if action == "TRADE":
-        if total_score >= 60:
-            position_size = "FULL"
-        elif total_score >= 45:
-            position_size = "HALF"
-        else:
-            position_size = "QUARTER"
+        position_size = POSITION_SIZES[bisect_right(POSITION_SIZE_BOUNDS, total_score)]
     else:
         position_size = "NONE"
 
@@ -212,10 +214,17 @@ def get_scoring_universe() -> list[str]:
     - Stocks with recent insider buying
     - Stocks with unusual options activity today
     - Stocks trending on social media
+
+    The result is cached per calendar day for the lifetime of the process.
     """
+    return list(_load_scoring_universe(date.today().isoformat()))
+
+
+@lru_cache(maxsize=8)
+def _load_scoring_universe(today: str) -> tuple[str, ...]:
+    """Query the scoring universe for a given day (cached by get_scoring_universe)."""
     tickers = set()
-    today = date.today().isoformat()
-    cutoff_14d = (date.today() - __import__("datetime").timedelta(days=14)).isoformat()
+    cutoff_14d = (date.fromisoformat(today) - timedelta(days=14)).isoformat()
 
     with get_db() as conn:
         # Insider buying in last 14 days
@@ -242,15 +251,19 @@ def get_scoring_universe() -> list[str]:
         for row in cursor.fetchall():
             tickers.add(row["ticker"])
 
-    return sorted(list(tickers))
+    return tuple(sorted(tickers))
 
 
-def run_daily_scoring(target_date: Optional[date] = None) -> list[CombinedSignal]:
+def run_daily_scoring(
+    target_date: Optional[date] = None,
+    universe: Optional[list[str]] = None,
+) -> list[CombinedSignal]:
     """
     Run the daily scoring pipeline.
 
     Args:
         target_date: Date to score (default: today)
+        universe: Tickers to score (default: get_scoring_universe())
 
     Returns:
         List of signals sorted by total_score descending
@@ -259,7 +272,8 @@ def run_daily_scoring(target_date: Optional[date] = None) -> list[CombinedSignal
         target_date = date.today()
 
     # Get universe
-    universe = get_scoring_universe()
+    if universe is None:
+        universe = get_scoring_universe()
     print(f"Scoring {len(universe)} tickers...")
 
     signals = []
@@ -39,6 +39,7 @@ SCORING RUBRIC (0-30 points max):
 import json
 from dataclasses import dataclass, asdict
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import sys
@@ -214,7 +215,8 @@ def get_insider_activity(ticker: str, lookback_days: int = 14) -> dict:
     }
 
 
-def score_insider(ticker: str, lookback_days: int = None) -> InsiderSignal:
+@lru_cache(maxsize=4096)
+def _score_insider(ticker: str, lookback_days: int, as_of: date) -> InsiderSignal:
     """
     Score a stock based on insider buying activity.
 
@@ -234,6 +236,7 @@ def score_insider(ticker: str, lookback_days: int = None) -> InsiderSignal:
     Args:
         ticker: Stock symbol
         lookback_days: Days to look back (default from config)
+        as_of: Day the lookback is anchored to (part of the cache key)
 
     Returns:
         InsiderSignal with score and details
@@ -315,6 +318,21 @@ def score_insider(ticker: str, lookback_days: int = None) -> InsiderSignal:
     )
 
 
+def score_insider(ticker: str, lookback_days: int = None) -> InsiderSignal:
+    """
+    Score a stock based on insider buying activity (see _score_insider for the rubric).
+
+    Results are cached per (ticker, lookback, day) for the lifetime of the
+    process; call score_insider.cache_clear() after collecting new filings.
+    """
+    if lookback_days is None:
+        lookback_days = config.INSIDER_LOOKBACK_DAYS
+    return _score_insider(ticker.upper(), lookback_days, date.today())
+
+
+score_insider.cache_clear = _score_insider.cache_clear
+
+
 def get_top_insider_stocks(min_score: int = 10, limit: int = 20) -> list[InsiderSignal]:
     """
     Get stocks with the highest insider buying scores.
@@ -360,34 +360,53 @@ def scan_for_mean_reversion(tickers: List[str] = None, save_to_db: bool = True)
                 signals.append(signal)
                 print(f"  📉 {ticker}: RSI={signal.rsi_14}, Drop={signal.drop_pct}%, Grade={signal.signal_grade}")
                 
-                if save_to_db:
-                    save_mean_reversion_signal(signal)
             else:
                 print(f"  · {ticker}: RSI={signal.rsi_14}, Drop={signal.drop_pct}%")
         except Exception as e:
             print(f"  ✗ {ticker}: {e}")
     
+    if save_to_db:
+        save_mean_reversion_signals(signals)
+    
     # Sort by score
     signals.sort(key=lambda x: x.signal_score, reverse=True)
     
     return signals
 
 
+MEAN_REVERSION_SIGNAL_INSERT_SQL = """
+    INSERT OR REPLACE INTO mean_reversion_signals
+    (ticker, date, rsi_14, drop_pct, current_price, 
+     suggested_entry, suggested_stop, suggested_target,
+     signal_score, signal_grade, is_signal, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _mean_reversion_signal_row(signal: MeanReversionSignal) -> tuple:
+    """Column values for MEAN_REVERSION_SIGNAL_INSERT_SQL."""
+    return (
+        signal.ticker, signal.date.isoformat(), signal.rsi_14,
+        signal.drop_pct, signal.current_price,
+        signal.suggested_entry, signal.suggested_stop, signal.suggested_target,
+        signal.signal_score, signal.signal_grade, signal.is_signal, signal.notes
+    )
+
+
 def save_mean_reversion_signal(signal: MeanReversionSignal):
     """Save mean reversion signal to database."""
+    save_mean_reversion_signals([signal])
+
+
+def save_mean_reversion_signals(signals: List[MeanReversionSignal]) -> None:
+    """Save many mean reversion signals in a single transaction."""
+    if not signals:
+        return
     with get_db() as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO mean_reversion_signals
-            (ticker, date, rsi_14, drop_pct, current_price, 
-             suggested_entry, suggested_stop, suggested_target,
-             signal_score, signal_grade, is_signal, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            signal.ticker, signal.date.isoformat(), signal.rsi_14,
-            signal.drop_pct, signal.current_price,
-            signal.suggested_entry, signal.suggested_stop, signal.suggested_target,
-            signal.signal_score, signal.signal_grade, signal.is_signal, signal.notes
-        ))
+        conn.executemany(
+            MEAN_REVERSION_SIGNAL_INSERT_SQL,
+            [_mean_reversion_signal_row(s) for s in signals]
+        )
 
 
 def get_active_mr_signals(min_grade: str = 'C') -> List[Dict]:
@@ -395,13 +414,15 @@ def get_active_mr_signals(min_grade: str = 'C') -> List[Dict]:
     grade_order = {'A': 4, 'B': 3, 'C': 2, 'F': 1}
     min_grade_val = grade_order.get(min_grade, 2)
     
+    cutoff = (date.today() - timedelta(days=3)).isoformat()
+    
     with get_db() as conn:
         cursor = conn.execute("""
             SELECT * FROM mean_reversion_signals
             WHERE is_signal = 1
-            AND date >= date('now', '-3 days')
+            AND date >= ?
             ORDER BY signal_score DESC
-        """)
+        """, (cutoff,))
         
         signals = []
         for row in cursor.fetchall():
@@ -14,6 +14,7 @@ SCORING RUBRIC (0-25 points max):
 import json
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import sys
@@ -104,7 +105,8 @@ def get_options_activity(ticker: str, target_date: Optional[date] = None) -> dic
     }
 
 
-def score_options(ticker: str, target_date: Optional[date] = None) -> OptionsSignal:
+@lru_cache(maxsize=4096)
+def _score_options(ticker: str, target_date: date) -> OptionsSignal:
     """
     Score a stock based on options activity.
 
@@ -187,6 +189,19 @@ def score_options(ticker: str, target_date: Optional[date] = None) -> OptionsSig
     )
 
 
+def score_options(ticker: str, target_date: Optional[date] = None) -> OptionsSignal:
+    """
+    Score a stock based on options activity (see _score_options for the rubric).
+
+    Results are cached per (ticker, date) for the lifetime of the process;
+    call score_options.cache_clear() after collecting new options data.
+    """
+    return _score_options(ticker.upper(), target_date or date.today())
+
+
+score_options.cache_clear = _score_options.cache_clear
+
+
 def get_top_options_stocks(min_score: int = 8, limit: int = 20) -> list[OptionsSignal]:
     """
     Get stocks with highest options scores today.
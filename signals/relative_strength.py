@@ -20,6 +20,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.db import get_db
+from signals.trend_template import get_watchlist_tickers
 
 
 @dataclass
@@ -164,15 +165,15 @@ def calculate_rs_ratings_batch(
     if not performances:
         return {t: 50.0 for t in tickers}
     
-    # Rank all stocks by weighted performance
-    sorted_tickers = sorted(performances.keys(), key=lambda t: performances[t])
-    n = len(sorted_tickers)
+    # Rank all stocks by weighted performance in one vectorized pass:
+    # percentile = rank position / total * 100
+    ranked = list(performances.keys())
+    scores = np.fromiter(performances.values(), dtype=np.float64, count=len(ranked))
+    positions = np.empty(len(ranked), dtype=np.float64)
+    positions[np.argsort(scores, kind='stable')] = np.arange(len(ranked))
+    percentiles = np.round(positions / len(ranked) * 100, 1)
     
-    # Calculate percentile for each
-    ratings = {}
-    for i, ticker in enumerate(sorted_tickers):
-        # Percentile = position / total * 100
-        ratings[ticker] = round((i / n) * 100, 1)
+    ratings = dict(zip(ranked, percentiles.tolist()))
     
     # Add 0 for stocks we couldn't calculate
     for ticker in tickers:
@@ -305,16 +306,20 @@ def update_rs_ratings_in_db(ratings: Dict[str, float], target_date: Optional[dat
     if target_date is None:
         target_date = date.today()
     
-    updated = 0
-    with get_db() as conn:
-        for ticker, rating in ratings.items():
-            cursor = conn.execute("""
-                UPDATE trend_template
-                SET rs_rating = ?
-                WHERE ticker = ? AND date = ?
-            """, (rating, ticker, target_date.isoformat()))
-            updated += cursor.rowcount
+    if not ratings:
+        return 0
     
+    day = target_date.isoformat()
+    with get_db() as conn:
+        cursor = conn.executemany("""
+            UPDATE trend_template
+            SET rs_rating = ?
+            WHERE ticker = ? AND date = ?
+        """, [(rating, ticker, day) for ticker, rating in ratings.items()])
+        updated = cursor.rowcount
+    
+    # Watchlist order depends on rs_rating
+    get_watchlist_tickers.cache_clear()
     return updated
 
 
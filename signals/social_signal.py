@@ -15,6 +15,7 @@ SCORING RUBRIC (0-20 points max):
 import json
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import sys
@@ -115,7 +116,8 @@ def get_social_activity(ticker: str, target_date: Optional[date] = None) -> dict
     }
 
 
-def score_social(ticker: str, target_date: Optional[date] = None) -> SocialSignal:
+@lru_cache(maxsize=4096)
+def _score_social(ticker: str, target_date: date) -> SocialSignal:
     """
     Score a stock based on social media activity.
 
@@ -203,6 +205,19 @@ def score_social(ticker: str, target_date: Optional[date] = None) -> SocialSigna
     )
 
 
+def score_social(ticker: str, target_date: Optional[date] = None) -> SocialSignal:
+    """
+    Score a stock based on social media activity (see _score_social for the rubric).
+
+    Results are cached per (ticker, date) for the lifetime of the process;
+    call score_social.cache_clear() after collecting new social data.
+    """
+    return _score_social(ticker.upper(), target_date or date.today())
+
+
+score_social.cache_clear = _score_social.cache_clear
+
+
 def get_top_social_stocks(min_score: int = 6, limit: int = 20) -> list[SocialSignal]:
     """
     Get stocks with highest social scores today.
@@ -9,6 +9,7 @@ Based on Mark Minervini's SEPA methodology from "Trade Like a Stock Market Wizar
 
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict
 import yfinance as yf
 import pandas as pd
@@ -81,7 +82,11 @@ class TrendTemplateResult:
         }
 
 
-def check_trend_template(ticker: str, target_date: Optional[date] = None) -> TrendTemplateResult:
+def check_trend_template(
+    ticker: str,
+    target_date: Optional[date] = None,
+    prices: Optional[pd.DataFrame] = None
+) -> TrendTemplateResult:
     """
     Check if a stock passes Minervini's 8-point Trend Template.
     
@@ -98,6 +103,8 @@ def check_trend_template(ticker: str, target_date: Optional[date] = None) -> Tre
     Args:
         ticker: Stock symbol
         target_date: Date to analyze (default: today)
+        prices: Preloaded daily history (~15 months), e.g. from
+            get_price_histories(); downloaded when omitted
     
     Returns:
         TrendTemplateResult with pass/fail for each criterion
@@ -107,8 +114,10 @@ def check_trend_template(ticker: str, target_date: Optional[date] = None) -> Tre
     
     # Fetch historical data
     # Need ~315 days for 252 trading days (52-week) + 200-day MA calculation buffer
-    stock = yf.Ticker(ticker)
-    hist = stock.history(period="15mo")
+    if prices is None:
+        hist = yf.Ticker(ticker).history(period="15mo")
+    else:
+        hist = prices
     
     if len(hist) < 200:
         raise ValueError(f"Insufficient data for {ticker}: only {len(hist)} days available, need 200+")
@@ -199,9 +208,6 @@ def scan_universe(
         try:
             result = check_trend_template(ticker)
             
-            if save_to_db:
-                save_trend_template_result(result)
-            
             if result.passes_template:
                 passing.append(result)
             else:
@@ -211,6 +217,9 @@ def scan_universe(
             errors.append((ticker, str(e)))
             continue
     
+    if save_to_db:
+        save_trend_template_results(passing + failed)
+    
     if verbose:
         print(f"\nScan complete:")
         print(f"  Passing: {len(passing)}")
@@ -220,48 +229,128 @@ def scan_universe(
     return passing
 
 
+TREND_TEMPLATE_INSERT_SQL = """
+    INSERT OR REPLACE INTO trend_template
+    (ticker, date, price, ma_50, ma_150, ma_200, high_52w, low_52w,
+     price_above_ma50, price_above_ma150, price_above_ma200,
+     ma50_above_ma150, ma150_above_ma200, ma200_trending_up,
+     price_within_25pct_of_high, price_above_30pct_from_low,
+     rs_rating, template_compliant, criteria_passed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _trend_template_row(result: TrendTemplateResult) -> tuple:
+    """Column values for TREND_TEMPLATE_INSERT_SQL."""
+    return (
+        result.ticker,
+        result.analysis_date.isoformat(),
+        result.price,
+        result.ma_50,
+        result.ma_150,
+        result.ma_200,
+        result.high_52w,
+        result.low_52w,
+        result.c1_price_above_ma50,
+        result.c2_price_above_ma150,
+        result.c3_price_above_ma200,
+        result.c4_ma50_above_ma150,
+        result.c5_ma150_above_ma200,
+        result.c6_ma200_trending_up,
+        result.c7_within_25pct_of_high,
+        result.c8_above_30pct_from_low,
+        result.rs_rating,
+        result.passes_template,
+        result.criteria_passed,
+    )
+
+
 def save_trend_template_result(result: TrendTemplateResult) -> None:
     """Save trend template result to database."""
+    save_trend_template_results([result])
+
+
+def save_trend_template_results(results: List[TrendTemplateResult]) -> None:
+    """Save many trend template results in a single transaction."""
+    if not results:
+        return
     with get_db() as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO trend_template
-            (ticker, date, price, ma_50, ma_150, ma_200, high_52w, low_52w,
-             price_above_ma50, price_above_ma150, price_above_ma200,
-             ma50_above_ma150, ma150_above_ma200, ma200_trending_up,
-             price_within_25pct_of_high, price_above_30pct_from_low,
-             rs_rating, template_compliant, criteria_passed)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            result.ticker,
-            result.analysis_date.isoformat(),
-            result.price,
-            result.ma_50,
-            result.ma_150,
-            result.ma_200,
-            result.high_52w,
-            result.low_52w,
-            result.c1_price_above_ma50,
-            result.c2_price_above_ma150,
-            result.c3_price_above_ma200,
-            result.c4_ma50_above_ma150,
-            result.c5_ma150_above_ma200,
-            result.c6_ma200_trending_up,
-            result.c7_within_25pct_of_high,
-            result.c8_above_30pct_from_low,
-            result.rs_rating,
-            result.passes_template,
-            result.criteria_passed,
-        ))
+        conn.executemany(TREND_TEMPLATE_INSERT_SQL, [_trend_template_row(r) for r in results])
+    get_watchlist_tickers.cache_clear()
+
+
+def load_trend_template_results(
+    tickers: List[str],
+    target_date: Optional[date] = None
+) -> Dict[str, TrendTemplateResult]:
+    """
+    Load results already saved for target_date, so re-runs can skip them.
+    
+    Args:
+        tickers: Stock symbols to look up
+        target_date: Scan date (default: today)
+    
+    Returns:
+        Dict of ticker -> TrendTemplateResult for tickers with a saved row
+    """
+    if target_date is None:
+        target_date = date.today()
+    if not tickers:
+        return {}
+    
+    placeholders = ",".join("?" * len(tickers))
+    with get_db() as conn:
+        rows = conn.execute(f"""
+            SELECT * FROM trend_template
+            WHERE date = ? AND ticker IN ({placeholders})
+        """, (target_date.isoformat(), *tickers)).fetchall()
+    
+    results = {}
+    for row in rows:
+        high_52w, low_52w, price = row['high_52w'], row['low_52w'], row['price']
+        results[row['ticker']] = TrendTemplateResult(
+            ticker=row['ticker'],
+            analysis_date=target_date,
+            price=price,
+            ma_50=row['ma_50'],
+            ma_150=row['ma_150'],
+            ma_200=row['ma_200'],
+            high_52w=high_52w,
+            low_52w=low_52w,
+            c1_price_above_ma50=bool(row['price_above_ma50']),
+            c2_price_above_ma150=bool(row['price_above_ma150']),
+            c3_price_above_ma200=bool(row['price_above_ma200']),
+            c4_ma50_above_ma150=bool(row['ma50_above_ma150']),
+            c5_ma150_above_ma200=bool(row['ma150_above_ma200']),
+            c6_ma200_trending_up=bool(row['ma200_trending_up']),
+            c7_within_25pct_of_high=bool(row['price_within_25pct_of_high']),
+            c8_above_30pct_from_low=bool(row['price_above_30pct_from_low']),
+            passes_template=bool(row['template_compliant']),
+            criteria_passed=row['criteria_passed'],
+            rs_rating=row['rs_rating'],
+            distance_from_high_pct=round((high_52w - price) / high_52w * 100, 2),
+            distance_from_low_pct=round((price - low_52w) / low_52w * 100, 2),
+        )
+    return results
 
 
 def get_compliant_stocks(target_date: Optional[date] = None) -> List[Dict]:
-    """Get all stocks passing trend template from database."""
+    """
+    Get all stocks passing trend template from database.
+    
+    Each row also carries distance_from_high_pct (% below the 52-week high,
+    0 when price or high is missing), computed by SQLite.
+    """
     if target_date is None:
         target_date = date.today()
     
     with get_db() as conn:
         cursor = conn.execute("""
-            SELECT * FROM trend_template
+            SELECT *,
+                   CASE WHEN high_52w AND price
+                        THEN (high_52w - price) * 100.0 / high_52w
+                        ELSE 0 END AS distance_from_high_pct
+            FROM trend_template
             WHERE date = ? AND template_compliant = 1
             ORDER BY rs_rating DESC NULLS LAST, criteria_passed DESC
         """, (target_date.isoformat(),))
@@ -270,6 +359,39 @@ def get_compliant_stocks(target_date: Optional[date] = None) -> List[Dict]:
         return [dict(row) for row in rows]
 
 
+def get_watchlist_tickers(limit: Optional[int] = None, as_of: Optional[date] = None) -> List[str]:
+    """
+    Get tickers passing the trend template, best RS first.
+    
+    Same ordering as get_compliant_stocks() but selects only the ticker
+    column. Results are cached per (limit, day) and cleared whenever trend
+    template results are saved.
+    
+    Args:
+        limit: Maximum number of tickers (default: all)
+        as_of: Scan date (default: today)
+    """
+    if as_of is None:
+        as_of = date.today()
+    return list(_load_watchlist_tickers(limit, as_of))
+
+
+@lru_cache(maxsize=32)
+def _load_watchlist_tickers(limit: Optional[int], as_of: date) -> tuple:
+    """Query the watchlist tickers (cached by get_watchlist_tickers)."""
+    with get_db() as conn:
+        cursor = conn.execute("""
+            SELECT ticker FROM trend_template
+            WHERE date = ? AND template_compliant = 1
+            ORDER BY rs_rating DESC NULLS LAST, criteria_passed DESC
+            LIMIT ?
+        """, (as_of.isoformat(), -1 if limit is None else limit))
+        return tuple(row[0] for row in cursor.fetchall())
+
+
+get_watchlist_tickers.cache_clear = _load_watchlist_tickers.cache_clear
+
+
 def format_template_report(result: TrendTemplateResult) -> str:
     """Format a readable report for a trend template result."""
     check = "✅" if result.passes_template else "❌"
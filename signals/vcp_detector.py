@@ -78,7 +78,16 @@ class VCPPattern:
         }
 
 
-def detect_vcp(ticker: str, lookback_days: int = 90) -> VCPPattern:
+def _detect_vcp(ticker: str, lookback_days: int, as_of: date) -> VCPPattern:
+    """Download recent history for ticker and run _analyze_vcp on it."""
+    try:
+        hist = yf.Ticker(ticker).history(period=f"{lookback_days + 30}d")
+    except Exception as e:
+        return _empty_vcp(ticker, f"Error: {str(e)[:50]}")
+    return _analyze_vcp(ticker, hist, lookback_days, as_of)
+
+
+def _analyze_vcp(ticker: str, hist: pd.DataFrame, lookback_days: int, as_of: date) -> VCPPattern:
     """
     Detect Volatility Contraction Pattern in price data.
     
@@ -90,15 +99,14 @@ def detect_vcp(ticker: str, lookback_days: int = 90) -> VCPPattern:
     
     Args:
         ticker: Stock symbol
+        hist: Daily OHLCV history (at least lookback_days rows)
         lookback_days: Days to analyze for pattern
+        as_of: Day the analysis is for
     
     Returns:
         VCPPattern with detection results
     """
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=f"{lookback_days + 30}d")
-        
         if len(hist) < lookback_days:
             return _empty_vcp(ticker, f"Insufficient data: only {len(hist)} days")
         
@@ -144,7 +152,7 @@ def detect_vcp(ticker: str, lookback_days: int = 90) -> VCPPattern:
         
         return VCPPattern(
             ticker=ticker,
-            analysis_date=date.today(),
+            analysis_date=as_of,
             is_valid=is_valid,
             num_contractions=len(contractions),
             contractions=contraction_depths,
@@ -162,6 +170,28 @@ def detect_vcp(ticker: str, lookback_days: int = 90) -> VCPPattern:
         return _empty_vcp(ticker, f"Error: {str(e)[:50]}")
 
 
+def detect_vcp(
+    ticker: str,
+    lookback_days: int = 90,
+    prices: Optional[pd.DataFrame] = None
+) -> VCPPattern:
+    """
+    Detect Volatility Contraction Pattern in price data (see _analyze_vcp).
+    
+    History is downloaded on every call unless prices is given; scans that
+    already hold the data should pass it to avoid a second download.
+    
+    Args:
+        ticker: Stock symbol
+        lookback_days: Days to analyze for pattern
+        prices: Preloaded daily history, e.g. from get_price_histories();
+            analyzed directly when given
+    """
+    if prices is not None:
+        return _analyze_vcp(ticker.upper(), prices, lookback_days, date.today())
+    return _detect_vcp(ticker.upper(), lookback_days, date.today())
+
+
 def _find_base_period(hist: pd.DataFrame) -> Tuple[int, Optional[pd.DataFrame]]:
     """
     Find the consolidation base period.
@@ -97,6 +97,9 @@ class Config:
     V2_DEFAULT_STOP_PCT = float(os.getenv("V2_DEFAULT_STOP_PCT", "0.07"))  # 7%
     V2_DEFAULT_TARGET_PCT = float(os.getenv("V2_DEFAULT_TARGET_PCT", "0.20"))  # 20%
 
+    # Scanning (yfinance requests are I/O bound, so tickers are fetched on a thread pool)
+    V2_SCAN_WORKERS = int(os.getenv("V2_SCAN_WORKERS", "8"))
+
     # Breakout Confirmation
     VOLUME_BREAKOUT_MULTIPLIER = float(os.getenv("VOLUME_BREAKOUT_MULTIPLIER", "1.5"))
     EARNINGS_BUFFER_DAYS = int(os.getenv("EARNINGS_BUFFER_DAYS", "5"))
@@ -107,6 +110,7 @@ class Config:
     # V2 Alerts
     ALERT_EMAIL = os.getenv("ALERT_EMAIL", "true").lower() == "true"
     ALERT_SMS = os.getenv("ALERT_SMS", "false").lower() == "true"
+    ALERT_SEND_CONCURRENCY = int(os.getenv("ALERT_SEND_CONCURRENCY", "4"))  # SMTP connections
 
     @classmethod
     def ensure_dirs(cls):
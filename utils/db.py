@@ -5,36 +5,129 @@ SQLite database connection and schema management.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 from .config import config
 
+# Per-thread connection cache used by get_db()
+_local = threading.local()
+
+# Databases whose column migrations have run in this process
+_migrated = set()
+_migrate_lock = threading.Lock()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a connection with the project's row factory and pragmas."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
+    # Per-connection tuning; safe with WAL (set once in init_db)
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MB
+    return conn
+
+
+def _thread_state() -> dict:
+    """Return this thread's {path: [connection, depth]} cache."""
+    state = getattr(_local, "conns", None)
+    if state is None:
+        state = _local.conns = {}
+    return state
+
 
 @contextmanager
 def get_db(db_path: Optional[Path] = None):
     """
     Context manager for database connections.
 
+    Each thread lazily opens one connection per database path and reuses it
+    for every block, so repeated reads/writes don't pay the connect and
+    pragma setup again. The outermost block commits or rolls back; nested
+    blocks run inside a SAVEPOINT so they can fail without losing the
+    enclosing transaction.
+
     Usage:
         with get_db() as conn:
             cursor = conn.execute("SELECT * FROM signals")
             rows = cursor.fetchall()
     """
     path = db_path or config.DB_PATH
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
-
+    state = _thread_state()
+    entry = state.get(path)
+    if entry is None:
+        conn = _connect(path)
+        _ensure_migrated(conn, path)
+        entry = state[path] = [conn, 0]
+    conn, depth = entry
+
+    if depth:
+        conn.execute("SAVEPOINT get_db")
+    entry[1] += 1
     try:
         yield conn
-        conn.commit()
+        if depth:
+            conn.execute("RELEASE get_db")
+        else:
+            conn.commit()
     except Exception:
-        conn.rollback()
+        if depth:
+            conn.execute("ROLLBACK TO get_db")
+            conn.execute("RELEASE get_db")
+        else:
+            conn.rollback()
         raise
     finally:
-        conn.close()
+        entry[1] -= 1
+
+
+def close_db(db_path: Optional[Path] = None):
+    """Close this thread's cached connection to the database, if any."""
+    path = db_path or config.DB_PATH
+    entry = _thread_state().pop(path, None)
+    if entry is not None:
+        entry[0].close()
+
+
+@contextmanager
+def shared_connection(db_path: Optional[Path] = None):
+    """
+    Scope the calling thread's cached connection to a block.
+
+    get_db() already reuses one connection per thread; this closes it on
+    exit so long-running callers (the CLI group) release the file handle
+    deterministically instead of at interpreter shutdown.
+    """
+    try:
+        yield
+    finally:
+        close_db(db_path)
+
+
+def _ensure_migrated(conn: sqlite3.Connection, path: Path):
+    """
+    Apply column migrations to an existing database once per process.
+
+    Older databases get new trades columns without having to re-run init;
+    a fresh file (no trades table yet) is left for init_db().
+    """
+    if path in _migrated:
+        return
+    with _migrate_lock:
+        if path in _migrated:
+            return
+        has_trades = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trades'"
+        ).fetchone()
+        if has_trades:
+            _migrate_trades_insider_columns(conn)
+            _migrate_trades_class_columns(conn)
+            conn.commit()
+        _migrated.add(path)
 
 
 def init_db(db_path: Optional[Path] = None):
@@ -45,11 +138,136 @@ def init_db(db_path: Optional[Path] = None):
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with get_db(path) as conn:
+        # WAL is persistent in the database file, so it only needs setting once
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.executescript(SCHEMA)
+        _migrate_trades_insider_columns(conn)
+        _migrate_trades_class_columns(conn)
+        _repair_trades_insider_context(conn)
+        # Refresh planner statistics so the indexes above get used
+        conn.execute("ANALYZE")
 
     print(f"Database initialized at {path}")
 
 
+def _migrate_trades_insider_columns(conn):
+    """Add trades.ceo_cfo_buying/unique_buyers to older databases and backfill them."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(trades)")}
+    if "ceo_cfo_buying" in columns and "unique_buyers" in columns:
+        return
+
+    if "ceo_cfo_buying" not in columns:
+        conn.execute("ALTER TABLE trades ADD COLUMN ceo_cfo_buying BOOLEAN")
+    if "unique_buyers" not in columns:
+        conn.execute("ALTER TABLE trades ADD COLUMN unique_buyers INTEGER")
+
+    conn.execute(
+        """
+        UPDATE trades
+        SET ceo_cfo_buying = (
+                SELECT json_extract(s.insider_details, '$.ceo_cfo_buying')
+                FROM signals s
+                WHERE s.id = trades.signal_id AND json_valid(s.insider_details)
+            ),
+            unique_buyers = (
+                SELECT json_extract(s.insider_details, '$.unique_buyers')
+                FROM signals s
+                WHERE s.id = trades.signal_id AND json_valid(s.insider_details)
+            )
+        WHERE signal_id IS NOT NULL
+        """
+    )
+
+
+def _migrate_trades_class_columns(conn):
+    """Add trades.score_bucket/insider_class to older databases and backfill closed trades."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(trades)")}
+    if "score_bucket" in columns and "insider_class" in columns:
+        return
+
+    if "score_bucket" not in columns:
+        conn.execute(
+            "ALTER TABLE trades ADD COLUMN score_bucket TEXT "
+            "CHECK(score_bucket IN ('high', 'medium', 'low', 'none'))"
+        )
+    if "insider_class" not in columns:
+        conn.execute(
+            "ALTER TABLE trades ADD COLUMN insider_class TEXT "
+            "CHECK(insider_class IN ('ceo_cfo', 'other'))"
+        )
+
+    classify_closed_trades(conn)
+
+
+def _repair_trades_insider_context(conn):
+    """
+    Fill insider context on signal-linked trades that were saved without it.
+
+    Dashboard entries used to skip ceo_cfo_buying/unique_buyers; copy them
+    from the signal and reclassify any affected closed trades. Only rows
+    still missing both values are touched, so re-running is cheap.
+    """
+    conn.execute(
+        """
+        UPDATE trades
+        SET ceo_cfo_buying = (
+                SELECT json_extract(s.insider_details, '$.ceo_cfo_buying')
+                FROM signals s
+                WHERE s.id = trades.signal_id AND json_valid(s.insider_details)
+            ),
+            unique_buyers = (
+                SELECT json_extract(s.insider_details, '$.unique_buyers')
+                FROM signals s
+                WHERE s.id = trades.signal_id AND json_valid(s.insider_details)
+            )
+        WHERE signal_id IS NOT NULL
+          AND ceo_cfo_buying IS NULL AND unique_buyers IS NULL
+        """
+    )
+    conn.execute(
+        _CLASSIFY_TRADES_SQL
+        + " AND insider_class IS NULL AND (ceo_cfo_buying OR COALESCE(unique_buyers, 0) > 0)"
+    )
+
+
+# Report buckets for a closed trade; static once the trade is closed
+_CLASSIFY_TRADES_SQL = """
+    UPDATE trades
+    SET score_bucket = COALESCE((
+            SELECT CASE
+                WHEN s.total_score IS NULL OR s.total_score = 0 THEN 'none'
+                WHEN s.total_score >= 50 THEN 'high'
+                WHEN s.total_score >= 35 THEN 'medium'
+                ELSE 'low'
+            END
+            FROM signals s
+            WHERE s.id = trades.signal_id
+        ), 'none'),
+        insider_class = CASE
+            WHEN ceo_cfo_buying THEN 'ceo_cfo'
+            WHEN COALESCE(unique_buyers, 0) > 0 THEN 'other'
+        END
+    WHERE status = 'CLOSED'
+"""
+
+
+def classify_closed_trades(conn, trade_id: Optional[int] = None):
+    """
+    Store score_bucket and insider_class on closed trades.
+
+    Called when a trade is closed so reports can group on the stored columns
+    instead of re-deriving them from signals on every run.
+
+    Args:
+        conn: Open database connection (the caller's transaction)
+        trade_id: Trade to classify (None = every closed trade)
+    """
+    if trade_id is None:
+        conn.execute(_CLASSIFY_TRADES_SQL)
+    else:
+        conn.execute(_CLASSIFY_TRADES_SQL + " AND id = ?", (trade_id,))
+
+
 # Database Schema
 SCHEMA = """
 -- Insider trading data from SEC EDGAR
@@ -204,6 +422,14 @@ CREATE TABLE IF NOT EXISTS trades (
     status TEXT DEFAULT 'OPEN',  -- 'OPEN', 'CLOSED'
     notes TEXT,
 
+    -- Insider context copied from the signal's insider_details at entry
+    ceo_cfo_buying BOOLEAN,
+    unique_buyers INTEGER,
+
+    -- Report buckets, set by classify_closed_trades() when the trade closes
+    score_bucket TEXT CHECK(score_bucket IN ('high', 'medium', 'low', 'none')),
+    insider_class TEXT CHECK(insider_class IN ('ceo_cfo', 'other')),
+
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (signal_id) REFERENCES signals(id)
 );
@@ -403,11 +629,18 @@ CREATE INDEX IF NOT EXISTS idx_insider_trades_ticker_date ON insider_trades(tick
 CREATE INDEX IF NOT EXISTS idx_insider_trades_filed ON insider_trades(filed_date);
 CREATE INDEX IF NOT EXISTS idx_signals_date ON signals(date);
 CREATE INDEX IF NOT EXISTS idx_signals_score ON signals(total_score DESC);
-CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status);
+-- trades lookups are by status plus ticker (enter/exit) or exit_date
+-- (history/performance); these supersede the status-only index
+DROP INDEX IF EXISTS idx_trades_status;
+CREATE INDEX IF NOT EXISTS idx_trades_status_ticker ON trades(status, ticker);
+CREATE INDEX IF NOT EXISTS idx_trades_status_exit_date ON trades(status, exit_date);
 CREATE INDEX IF NOT EXISTS idx_validation_date ON validation_insider(signal_date);
 CREATE INDEX IF NOT EXISTS idx_market_data_ticker_date ON market_data(ticker, date);
 CREATE INDEX IF NOT EXISTS idx_options_flow_ticker_date ON options_flow(ticker, date);
 CREATE INDEX IF NOT EXISTS idx_social_metrics_ticker_date ON social_metrics(ticker, date);
+-- Date-only filters (health's 7-day freshness checks)
+CREATE INDEX IF NOT EXISTS idx_options_flow_date ON options_flow(date);
+CREATE INDEX IF NOT EXISTS idx_social_metrics_date ON social_metrics(date);
 
 -- V2 Indexes
 CREATE INDEX IF NOT EXISTS idx_trend_template_ticker_date ON trend_template(ticker, date);
@@ -418,6 +651,9 @@ CREATE INDEX IF NOT EXISTS idx_vcp_patterns_valid ON vcp_patterns(pattern_valid,
 CREATE INDEX IF NOT EXISTS idx_watchlist_v2_status ON watchlist_v2(status);
 CREATE INDEX IF NOT EXISTS idx_paper_trades_v2_status ON paper_trades_v2(status);
 CREATE INDEX IF NOT EXISTS idx_alerts_v2_type ON alerts_v2(alert_type, sent_at);
+CREATE INDEX IF NOT EXISTS idx_alerts_v2_sent ON alerts_v2(sent_at);
+-- Partial index: the retry path only ever looks at undelivered alerts
+CREATE INDEX IF NOT EXISTS idx_alerts_v2_undelivered ON alerts_v2(sent_at) WHERE delivered = 0;
 
 -- ============================================================================
 -- MEAN REVERSION STRATEGY TABLES
@@ -467,12 +703,23 @@ CREATE TABLE IF NOT EXISTS mean_reversion_trades (
 -- Mean reversion indexes
 CREATE INDEX IF NOT EXISTS idx_mr_signals_date ON mean_reversion_signals(date);
 CREATE INDEX IF NOT EXISTS idx_mr_signals_strength ON mean_reversion_signals(signal_strength, date);
-CREATE INDEX IF NOT EXISTS idx_mr_trades_status ON mean_reversion_trades(status);
+-- status + date lets the open/closed position lists read rows in display
+-- order straight from the index; they supersede the status-only index
+DROP INDEX IF EXISTS idx_mr_trades_status;
+CREATE INDEX IF NOT EXISTS idx_mr_trades_status_entry ON mean_reversion_trades(status, entry_date DESC);
+CREATE INDEX IF NOT EXISTS idx_mr_trades_status_exit ON mean_reversion_trades(status, exit_date DESC);
 """
 
 
-def get_table_counts():
-    """Get row counts for all tables (useful for status checks)."""
+def get_table_counts(exact: bool = False):
+    """
+    Get row counts for all tables (useful for status checks).
+
+    By default counts come from MAX(rowid), which is a single b-tree lookup
+    instead of a full table scan. That is exact for append-only tables but
+    an upper bound where rows have been deleted or replaced. Pass exact=True
+    to use COUNT(*).
+    """
     tables = [
         # V1 tables
         "insider_trades",
@@ -497,11 +744,13 @@ def get_table_counts():
         "mean_reversion_trades",
     ]
 
+    count_expr = "COUNT(*)" if exact else "COALESCE(MAX(rowid), 0)"
+
     counts = {}
     with get_db() as conn:
         for table in tables:
             try:
-                cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
+                cursor = conn.execute(f"SELECT {count_expr} FROM {table}")
                 counts[table] = cursor.fetchone()[0]
             except Exception:
                 counts[table] = -1  # Table doesn't exist yet
@@ -509,9 +758,58 @@ def get_table_counts():
     return counts
 
 
+
+def get_closed_trade_summary():
+    """
+    Aggregate closed paper trades overall, by signal-score bucket and by insider type.
+
+    The rollups are computed by SQLite (one GROUP BY per dimension, combined
+    with UNION ALL) over the score_bucket/insider_class columns stored when
+    each trade closed, so reports neither join signals nor pull individual
+    closed trades into Python.
+
+    Returns rows with a dimension of 'total' (bucket NULL), 'score' (bucket
+    'high' (50+), 'medium' (35-49), 'low' (<35) or 'none' for no signal) or
+    'insider' (bucket 'ceo_cfo' or 'other'), plus counts and return sums.
+    """
+    with get_db() as conn:
+        cursor = conn.execute(
+            """
+            WITH closed AS (
+                SELECT
+                    COALESCE(score_bucket, 'none') AS score_bucket,
+                    insider_class,
+                    COALESCE(return_pct, 0) AS pct,
+                    COALESCE(return_dollars, 0) AS dollars
+                FROM trades
+                WHERE status = 'CLOSED'
+            )
+            SELECT 'total' AS dimension, NULL AS bucket, COUNT(*) AS trades,
+                   SUM(pct > 0) AS wins, SUM(pct) AS return_sum,
+                   SUM(dollars) AS return_dollars,
+                   SUM(CASE WHEN pct > 0 THEN pct ELSE 0 END) AS win_return_sum,
+                   SUM(CASE WHEN pct <= 0 THEN pct ELSE 0 END) AS loss_return_sum
+            FROM closed
+            HAVING COUNT(*) > 0
+            UNION ALL
+            SELECT 'score', score_bucket, COUNT(*), SUM(pct > 0), SUM(pct),
+                   SUM(dollars), NULL, NULL
+            FROM closed
+            GROUP BY score_bucket
+            UNION ALL
+            SELECT 'insider', insider_class, COUNT(*), SUM(pct > 0), SUM(pct),
+                   SUM(dollars), NULL, NULL
+            FROM closed
+            WHERE insider_class IS NOT NULL
+            GROUP BY insider_class
+            """
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+
 if __name__ == "__main__":
     # Initialize database when run directly
     init_db()
     print("\nTable counts:")
-    for table, count in get_table_counts().items():
+    for table, count in get_table_counts(exact=True).items():
         print(f"  {table}: {count}")
@@ -499,13 +499,27 @@ class PaperTradingEngine:
     
     def get_performance_stats(self) -> Dict:
         """Calculate performance statistics."""
+        # Aggregate in SQLite; only one summary row comes back
         with get_db() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM paper_trades_v2 WHERE status = 'CLOSED'
-            """)
-            trades = cursor.fetchall()
+            row = conn.execute("""
+                SELECT COUNT(*) AS n,
+                       COALESCE(SUM(pct > 0), 0) AS n_win,
+                       AVG(CASE WHEN pct > 0 THEN pct END) AS avg_win,
+                       AVG(CASE WHEN pct <= 0 THEN pct END) AS avg_loss,
+                       COALESCE(SUM(CASE WHEN pct > 0 THEN dollars END), 0) AS total_wins,
+                       COALESCE(SUM(CASE WHEN pct <= 0 THEN dollars END), 0) AS total_losses,
+                       COALESCE(SUM(dollars), 0) AS total_pnl,
+                       COALESCE(AVG(COALESCE(days_held, 0)), 0) AS avg_days_held
+                FROM (
+                    SELECT COALESCE(return_pct, 0) AS pct,
+                           COALESCE(return_dollars, 0) AS dollars,
+                           days_held
+                    FROM paper_trades_v2 WHERE status = 'CLOSED'
+                )
+            """).fetchone()
         
-        if not trades:
+        n = row['n']
+        if not n:
             return {
                 'total_trades': 0,
                 'win_rate': 0,
@@ -515,22 +529,19 @@ class PaperTradingEngine:
                 'avg_days_held': 0,
             }
         
-        wins = [t for t in trades if t['return_pct'] > 0]
-        losses = [t for t in trades if t['return_pct'] <= 0]
-        
-        total_wins = sum(t['return_dollars'] for t in wins) if wins else 0
-        total_losses = abs(sum(t['return_dollars'] for t in losses)) if losses else 0
+        n_win = row['n_win']
+        total_losses = abs(row['total_losses'])
         
         return {
-            'total_trades': len(trades),
-            'wins': len(wins),
-            'losses': len(losses),
-            'win_rate': round(len(wins) / len(trades) * 100, 1) if trades else 0,
-            'avg_win': round(sum(t['return_pct'] for t in wins) / len(wins), 2) if wins else 0,
-            'avg_loss': round(sum(t['return_pct'] for t in losses) / len(losses), 2) if losses else 0,
-            'profit_factor': round(total_wins / total_losses, 2) if total_losses > 0 else float('inf'),
-            'avg_days_held': round(sum(t['days_held'] for t in trades) / len(trades), 1) if trades else 0,
-            'total_pnl': round(sum(t['return_dollars'] for t in trades), 2),
+            'total_trades': n,
+            'wins': n_win,
+            'losses': n - n_win,
+            'win_rate': round(n_win / n * 100, 1),
+            'avg_win': round(row['avg_win'], 2) if row['avg_win'] is not None else 0,
+            'avg_loss': round(row['avg_loss'], 2) if row['avg_loss'] is not None else 0,
+            'profit_factor': round(row['total_wins'] / total_losses, 2) if total_losses > 0 else float('inf'),
+            'avg_days_held': round(row['avg_days_held'], 1),
+            'total_pnl': round(row['total_pnl'], 2),
         }
 
 
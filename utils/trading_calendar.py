@@ -4,6 +4,7 @@ Trading Calendar Utilities
 Handles NYSE trading day checks and holiday scheduling for 2025-2026.
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
 from typing import Optional
 
@@ -65,6 +66,23 @@ def is_trading_day(check_date: Optional[date] = None) -> bool:
     return True
 
 
+def _build_trading_days(start: date, end: date) -> list[date]:
+    """Materialize every trading day in [start, end] as a sorted list."""
+    days = []
+    current = start
+    one_day = timedelta(days=1)
+    while current <= end:
+        if is_trading_day(current):
+            days.append(current)
+        current += one_day
+    return days
+
+
+# Sorted trading days used for bisect lookups. Dates outside this window
+# fall back to stepping one day at a time.
+_DAYS = _build_trading_days(date(2015, 1, 1), date(2035, 12, 31))
+
+
 def next_trading_day(from_date: Optional[date] = None) -> date:
     """
     Find the next trading day from a given date.
@@ -81,6 +99,10 @@ def next_trading_day(from_date: Optional[date] = None) -> date:
     if from_date is None:
         from_date = date.today()
 
+    idx = bisect_right(_DAYS, from_date)
+    if _DAYS[0] <= from_date and idx < len(_DAYS):
+        return _DAYS[idx]
+
     # Start with the day after from_date
     next_day = from_date + timedelta(days=1)
 
@@ -104,6 +126,10 @@ def previous_trading_day(from_date: Optional[date] = None) -> date:
     if from_date is None:
         from_date = date.today()
 
+    idx = bisect_left(_DAYS, from_date)
+    if 0 < idx and from_date <= _DAYS[-1] + timedelta(days=1):
+        return _DAYS[idx - 1]
+
     # Start with the day before from_date
     prev_day = from_date - timedelta(days=1)
 
@@ -128,6 +154,12 @@ def trading_days_until(target_date: date, from_date: Optional[date] = None) -> i
     if from_date is None:
         from_date = date.today()
 
+    if target_date <= from_date:
+        return 0
+
+    if _DAYS[0] <= from_date and target_date <= _DAYS[-1]:
+        return bisect_left(_DAYS, target_date) - bisect_left(_DAYS, from_date)
+
     count = 0
     current = from_date
 
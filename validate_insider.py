@@ -231,6 +231,8 @@ def backfill_historical_insider_data(months_back: int = 6, use_existing: bool =
 
                 # Parse the index file
                 lines = response.text.split('\n')
+                # Purchases are written once per index day, not per filing
+                day_purchases = []
 
                 for line in lines:
                     # Form 4 lines look like:
@@ -261,9 +263,7 @@ def backfill_historical_insider_data(months_back: int = 6, use_existing: bool =
                                         purchases = [t for t in trades if t.trade_type == 'P']
                                         stats["purchases_found"] += len(purchases)
 
-                                        if purchases:
-                                            saved = save_trades(purchases)
-                                            stats["trades_saved"] += saved
+                                        day_purchases.extend(purchases)
 
                                         # Rate limit: max ~3 filings per second
                                         time.sleep(0.35)
@@ -271,6 +271,9 @@ def backfill_historical_insider_data(months_back: int = 6, use_existing: bool =
                             except Exception as e:
                                 stats["errors"].append(f"Parse error: {str(e)[:50]}")
 
+                if day_purchases:
+                    stats["trades_saved"] += save_trades(day_purchases)
+
         except requests.exceptions.HTTPError as e:
             if e.response.status_code != 404:
                 stats["errors"].append(f"{current_date}: {str(e)[:50]}")
@@ -450,46 +453,72 @@ def calculate_all_returns(events: list[dict], progress_interval: int = 50) -> li
     return validation_events
 
 
+VALIDATION_INSERT_SQL = """
+    INSERT OR REPLACE INTO validation_insider
+    (ticker, signal_date, insider_buy_value, num_buyers, ceo_cfo_buy,
+     price_at_signal, return_1d, return_3d, return_5d, return_10d, return_20d,
+     spy_return_1d, spy_return_3d, spy_return_5d, spy_return_10d, spy_return_20d,
+     excess_return_5d, excess_return_10d)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def save_validation_events(events: list[ValidationEvent]) -> int:
-    """Save validation events to database."""
-    saved = 0
+    """
+    Save validation events to database.
+
+    Events are written with one executemany; if the batch fails it is rolled
+    back and the events are saved one at a time, so a bad event is reported
+    and skipped without losing the rest.
+
+    Returns:
+        Number of events saved
+    """
+    rows = []
+    for event in events:
+        try:
+            rows.append((
+                event.ticker,
+                event.signal_date.isoformat(),
+                event.insider_buy_value,
+                event.num_buyers,
+                event.ceo_cfo_buy,
+                event.price_at_signal,
+                event.return_1d,
+                event.return_3d,
+                event.return_5d,
+                event.return_10d,
+                event.return_20d,
+                event.spy_return_1d,
+                event.spy_return_3d,
+                event.spy_return_5d,
+                event.spy_return_10d,
+                event.spy_return_20d,
+                event.excess_return_5d,
+                event.excess_return_10d,
+            ))
+        except Exception as e:
+            print(f"Error saving {event.ticker} {event.signal_date}: {e}")
+
+    if not rows:
+        return 0
 
     with get_db() as conn:
-        for event in events:
+        try:
+            # Nested get_db() runs in a savepoint, so a failed batch leaves nothing behind
+            with get_db() as batch:
+                batch.executemany(VALIDATION_INSERT_SQL, rows)
+            return len(rows)
+        except Exception:
+            pass
+
+        saved = 0
+        for row in rows:
             try:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO validation_insider
-                    (ticker, signal_date, insider_buy_value, num_buyers, ceo_cfo_buy,
-                     price_at_signal, return_1d, return_3d, return_5d, return_10d, return_20d,
-                     spy_return_1d, spy_return_3d, spy_return_5d, spy_return_10d, spy_return_20d,
-                     excess_return_5d, excess_return_10d)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        event.ticker,
-                        event.signal_date.isoformat(),
-                        event.insider_buy_value,
-                        event.num_buyers,
-                        event.ceo_cfo_buy,
-                        event.price_at_signal,
-                        event.return_1d,
-                        event.return_3d,
-                        event.return_5d,
-                        event.return_10d,
-                        event.return_20d,
-                        event.spy_return_1d,
-                        event.spy_return_3d,
-                        event.spy_return_5d,
-                        event.spy_return_10d,
-                        event.spy_return_20d,
-                        event.excess_return_5d,
-                        event.excess_return_10d,
-                    )
-                )
+                conn.execute(VALIDATION_INSERT_SQL, row)
                 saved += 1
             except Exception as e:
-                print(f"Error saving {event.ticker} {event.signal_date}: {e}")
+                print(f"Error saving {row[0]} {row[1]}: {e}")
 
     return saved
 